@@ -0,0 +1,129 @@
+"""
+comandos.py
+============
+Comandos de manutenção, rodados pela linha de comando sem abrir a janela:
+
+    python main.py --verificar-contadores
+    python main.py --reconstruir-contadores
+    python main.py --calibrar-senha [alvo_ms]
+    python main.py --tempo-importacao [quantos] [orcamento_ms]
+
+main.py chama executar(sys.argv[1:]) antes de criar a QApplication; se o
+primeiro argumento não for um comando daqui, o app abre normalmente.
+"""
+
+import sys
+
+import linha_do_tempo
+import politica_senha
+from database import DatabaseManager
+
+
+def _mostrar_divergencias(divergencias):
+    for chave, (armazenado, real) in sorted(divergencias.items()):
+        print(f"  {chave}: {armazenado} (tabela) x {real} (contagem)")
+
+
+def verificar_contadores(db):
+    """Confere a tabela de contadores do dashboard contra uma contagem
+    completa. Código de saída 1 se houver divergência."""
+    divergencias = db.verificar_contadores()
+    if not divergencias:
+        print("Contadores conferidos: tudo certo.")
+        return 0
+    print(f"{len(divergencias)} contador(es) divergente(s):")
+    _mostrar_divergencias(divergencias)
+    print("Rode com --reconstruir-contadores para corrigir.")
+    return 1
+
+
+def reconstruir_contadores(db):
+    """Recalcula a tabela de contadores do dashboard do zero."""
+    divergencias = db.reconstruir_contadores()
+    if divergencias:
+        print(f"{len(divergencias)} contador(es) corrigido(s):")
+        _mostrar_divergencias(divergencias)
+    print("Contadores reconstruídos.")
+    return 0
+
+
+def calibrar_senha(db, alvo_ms=politica_senha.ALVO_PADRAO_MS):
+    """Mede o bcrypt nesta máquina e grava como custo das senhas o maior
+    que cabe em alvo_ms. As senhas existentes passam para o novo custo no
+    próximo login de cada usuário."""
+    alvo_ms = int(alvo_ms)
+    custo, medicoes = politica_senha.calibrar(alvo_ms)
+    for custo_medido, segundos in medicoes:
+        print(f"  custo {custo_medido:2d}: {segundos * 1000:7.1f} ms")
+
+    if medicoes[0][1] * 1000 > alvo_ms:
+        print(f"Nem o custo mínimo ({politica_senha.CUSTO_MINIMO}) cabe em {alvo_ms} ms; usando ele.")
+    anterior = db.custo_senha()
+    db.definir_parametro(politica_senha.CHAVE_CUSTO, custo)
+    print(f"Custo das senhas: {anterior} -> {custo} (alvo {alvo_ms} ms).")
+    return 0
+
+
+USO_TEMPO_IMPORTACAO = "uso: python main.py --tempo-importacao [quantos] [orcamento_ms]"
+
+
+def tempo_importacao(quantos=15, orcamento_ms=None, *sobra):
+    """Lista as importações mais caras da abertura do programa (até a
+    janela de login, em janela_qt.py). Código de saída 1 se a importação
+    passar de orcamento_ms — para o teste de desempenho cobrar o limite —
+    e 2 se os argumentos forem inválidos ou a medição não puder rodar."""
+    try:
+        quantos = int(quantos)
+        orcamento_ms = None if orcamento_ms is None else float(orcamento_ms)
+    except ValueError:
+        quantos = -1
+    if sobra or quantos < 0 or (orcamento_ms is not None and not orcamento_ms > 0):
+        print(USO_TEMPO_IMPORTACAO)
+        print("  quantos: inteiro >= 0; orcamento_ms: número de milissegundos > 0")
+        return 2
+    if getattr(sys, "frozen", False):
+        print("--tempo-importacao só funciona rodando pelo Python (python main.py).")
+        return 2
+
+    modulo = "janela_qt"
+    medidas = linha_do_tempo.medir_importacoes(modulo)
+    total = next((acumulado for nome, _, acumulado in medidas if nome == modulo), None)
+    if total is None:
+        print(f"A medição não encontrou a importação de {modulo}.")
+        return 2
+    print(f"Importação da interface ({modulo}): {total:.0f} ms. As {quantos} mais caras (acumulado / próprio):")
+    outras = [medida for medida in medidas if medida[0] != modulo]
+    for nome, proprio, acumulado in outras[:quantos]:
+        print(f"  {acumulado:7.1f} ms  {proprio:7.1f} ms  {nome}")
+
+    if orcamento_ms is not None and total > orcamento_ms:
+        print(f"Acima do orçamento de {orcamento_ms:.0f} ms.")
+        return 1
+    return 0
+
+COMANDOS = {
+    "--verificar-contadores": verificar_contadores,
+    "--reconstruir-contadores": reconstruir_contadores,
+    "--calibrar-senha": calibrar_senha,
+}
+
+# Comandos que não usam o banco: rodam sem abrir (nem migrar) o
+# DatabaseManager — a medição das importações não pode incluir isso.
+COMANDOS_SEM_BANCO = {
+    "--tempo-importacao": tempo_importacao,
+}
+
+
+def executar(argumentos):
+    """Roda o comando pedido e devolve o código de saída, ou None se não
+    há comando (o app deve abrir a interface)."""
+    if argumentos and argumentos[0] in COMANDOS_SEM_BANCO:
+        return COMANDOS_SEM_BANCO[argumentos[0]](*argumentos[1:])
+    if not argumentos or argumentos[0] not in COMANDOS:
+        return None
+
+    db = DatabaseManager()
+    try:
+        return COMANDOS[argumentos[0]](db, *argumentos[1:])
+    finally:
+        db.fechar()
@@ -1,7 +1,15 @@
+import json
 import os
+import re
 import sys
 import sqlite3
-import bcrypt
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+
+import politica_senha
 
 
 def obter_pasta_dados():
@@ -25,91 +33,677 @@ def obter_pasta_dados():
     return pasta
 
 
+# ---------- Migrações do esquema (versionadas via PRAGMA user_version) ----------
+# Cada função recebe um cursor já dentro de uma transação. Para evoluir o
+# esquema, acrescente uma nova função AO FINAL de _MIGRACOES — nunca altere
+# ou reordene as que já existem, pois bancos em uso já as aplicaram.
+
+def _migracao_tabelas_base(cursor):
+    """Esquema original. Usa IF NOT EXISTS porque bancos anteriores ao
+    controle de versão (user_version = 0) já têm essas tabelas."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS usuarios (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE,
+        senha BLOB,
+        tipo TEXT,
+        data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS alunos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT,
+        sala TEXT,
+        serie TEXT,
+        gravidade TEXT
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS relacao_pai_aluno (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        pai_id INTEGER,
+        aluno_id INTEGER
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS relatorios (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        aluno_id INTEGER,
+        psicologo_id INTEGER,
+        texto TEXT,
+        data TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS compromissos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        psicologo_id INTEGER,
+        titulo TEXT,
+        data TEXT,
+        hora TEXT,
+        cor TEXT,
+        descricao TEXT
+    )
+    """)
+
+    # Bancos criados antes de existir 'data_criacao' não têm a coluna
+    cursor.execute("PRAGMA table_info(usuarios)")
+    colunas = [c[1] for c in cursor.fetchall()]
+    if "data_criacao" not in colunas:
+        cursor.execute(
+            "ALTER TABLE usuarios ADD COLUMN data_criacao TIMESTAMP"
+        )
+
+        cursor.execute("""
+        UPDATE usuarios
+        SET data_criacao = CURRENT_TIMESTAMP
+        WHERE data_criacao IS NULL
+        """)
+
+    cursor.execute("SELECT 1 FROM usuarios WHERE username='admin'")
+    if not cursor.fetchone():
+        senha = politica_senha.gerar_hash("123")
+        cursor.execute(
+            "INSERT INTO usuarios (username, senha, tipo) VALUES (?, ?, ?)",
+            ("admin", senha, "admin")
+        )
+
+
+def _migracao_indices(cursor):
+    """Índices nas chaves estrangeiras e nas colunas usadas em filtros e
+    ordenações — sem eles, listagens, agenda e exclusões em cascata fazem
+    varredura completa das tabelas."""
+    # listar_relatorios_aluno (WHERE aluno_id ORDER BY data DESC) e excluir_aluno
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_relatorios_aluno_data ON relatorios (aluno_id, data DESC)"
+    )
+    # obter_estatisticas_psicologo e excluir_usuario
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_relatorios_psicologo ON relatorios (psicologo_id)"
+    )
+    # compromissos_por_data / listar_compromissos (WHERE psicologo_id [AND data] ORDER BY hora)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_compromissos_psicologo_data "
+        "ON compromissos (psicologo_id, data, hora)"
+    )
+    # alunos_do_pai, vinculo_existe e excluir_usuario
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_relacao_pai_aluno ON relacao_pai_aluno (pai_id, aluno_id)"
+    )
+    # excluir_aluno
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_relacao_aluno ON relacao_pai_aluno (aluno_id)"
+    )
+    # listar_pais (WHERE tipo='pai' ORDER BY username) e contar_usuarios_por_tipo
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_usuarios_tipo ON usuarios (tipo, username)"
+    )
+    # aluno_existe
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alunos_nome_sala_serie ON alunos (nome, sala, serie)"
+    )
+    cursor.execute("ANALYZE")
+
+
+def _migracao_busca_relatorios(cursor):
+    """Índice de texto completo (FTS5) sobre relatorios.texto.
+
+    A tabela é de conteúdo externo: guarda só o índice invertido, o texto
+    continua em 'relatorios'. Os gatilhos mantêm os dois em sincronia. O
+    tokenizador unicode61 com remove_diacritics 2 minúscula e tira acentos
+    do mesmo jeito que screens.utils._remover_acentos (NFKD sem as marcas
+    combinantes), então "automutilação" casa com "automutilacao"."""
+    cursor.execute("""
+    CREATE VIRTUAL TABLE IF NOT EXISTS relatorios_fts USING fts5(
+        texto,
+        content='relatorios',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS relatorios_fts_ai AFTER INSERT ON relatorios BEGIN
+        INSERT INTO relatorios_fts (rowid, texto) VALUES (NEW.id, NEW.texto);
+    END
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS relatorios_fts_ad AFTER DELETE ON relatorios BEGIN
+        INSERT INTO relatorios_fts (relatorios_fts, rowid, texto) VALUES ('delete', OLD.id, OLD.texto);
+    END
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS relatorios_fts_au AFTER UPDATE OF texto ON relatorios BEGIN
+        INSERT INTO relatorios_fts (relatorios_fts, rowid, texto) VALUES ('delete', OLD.id, OLD.texto);
+        INSERT INTO relatorios_fts (rowid, texto) VALUES (NEW.id, NEW.texto);
+    END
+    """)
+
+    # Indexa os relatórios que já existiam antes desta migração
+    cursor.execute("INSERT INTO relatorios_fts (relatorios_fts) VALUES ('rebuild')")
+
+
+def _migracao_nome_busca(cursor):
+    """Coluna alunos.nome_busca: o nome já em minúsculas e sem acentos,
+    calculado na escrita (adicionar_aluno/atualizar_aluno) para que a busca
+    por nome rode no SQL, com índice, em vez de filtrar em Python."""
+    cursor.execute("PRAGMA table_info(alunos)")
+    if "nome_busca" not in [c[1] for c in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE alunos ADD COLUMN nome_busca TEXT")
+
+    cursor.execute("SELECT id, nome FROM alunos")
+    cursor.executemany(
+        "UPDATE alunos SET nome_busca=? WHERE id=?",
+        [(_normalizar(nome or ""), aluno_id) for aluno_id, nome in cursor.fetchall()]
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alunos_nome_busca ON alunos (nome_busca)"
+    )
+
+
+def _somar_contador(chave, delta):
+    """Trecho de gatilho que soma delta ao contador `chave` (expressão SQL),
+    criando a linha se ainda não existir."""
+    return (
+        f"INSERT INTO contadores (chave, valor) VALUES ({chave}, {delta}) "
+        f"ON CONFLICT (chave) DO UPDATE SET valor = valor + {delta};"
+    )
+
+
+def _migracao_contadores(cursor):
+    """Tabela 'contadores': os números do dashboard já calculados, mantidos
+    exatos por gatilhos a cada INSERT/UPDATE/DELETE. Ler as estatísticas
+    vira uma busca por chave primária, em vez de varrer as tabelas com
+    COUNT(*) — o custo não cresce com o tamanho do banco.
+
+    Chaves (ver _CONTADORES_SQL para a contagem de referência):
+        alunos, relatorios, compromissos, vinculos, pais_vinculados
+        alunos.gravidade.<gravidade>
+        relatorios.psicologo.<id>, compromissos.psicologo.<id>
+    """
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS contadores (
+        chave TEXT PRIMARY KEY,
+        valor INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """)
+
+    gravidade = "'alunos.gravidade.' || coalesce({}.gravidade, '')"
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS contadores_alunos_ai AFTER INSERT ON alunos BEGIN
+        {_somar_contador("'alunos'", 1)}
+        {_somar_contador(gravidade.format("NEW"), 1)}
+    END
+    """)
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS contadores_alunos_ad AFTER DELETE ON alunos BEGIN
+        {_somar_contador("'alunos'", -1)}
+        {_somar_contador(gravidade.format("OLD"), -1)}
+    END
+    """)
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS contadores_alunos_au AFTER UPDATE OF gravidade ON alunos
+    WHEN OLD.gravidade IS NOT NEW.gravidade BEGIN
+        {_somar_contador(gravidade.format("OLD"), -1)}
+        {_somar_contador(gravidade.format("NEW"), 1)}
+    END
+    """)
+
+    # relatórios e compromissos: total + por psicólogo
+    for tabela in ("relatorios", "compromissos"):
+        por_psicologo = f"'{tabela}.psicologo.' || coalesce({{}}.psicologo_id, '')"
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS contadores_{tabela}_ai AFTER INSERT ON {tabela} BEGIN
+            {_somar_contador(f"'{tabela}'", 1)}
+            {_somar_contador(por_psicologo.format("NEW"), 1)}
+        END
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS contadores_{tabela}_ad AFTER DELETE ON {tabela} BEGIN
+            {_somar_contador(f"'{tabela}'", -1)}
+            {_somar_contador(por_psicologo.format("OLD"), -1)}
+        END
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS contadores_{tabela}_au AFTER UPDATE OF psicologo_id ON {tabela}
+        WHEN OLD.psicologo_id IS NOT NEW.psicologo_id BEGIN
+            {_somar_contador(por_psicologo.format("OLD"), -1)}
+            {_somar_contador(por_psicologo.format("NEW"), 1)}
+        END
+        """)
+
+    # vínculos: total + quantos pais distintos têm ao menos um vínculo. O
+    # pai "entra" no primeiro vínculo e "sai" no último — a checagem usa o
+    # índice (pai_id, aluno_id), não uma contagem. Vínculo sem pai (pai_id
+    # NULL) não conta: NULL = NULL nunca é verdadeiro, então o NOT EXISTS
+    # trataria cada um como um pai novo.
+    def _primeiro_vinculo(linha, delta):
+        return f"""
+            UPDATE contadores SET valor = valor + {delta} WHERE chave = 'pais_vinculados'
+            AND {linha}.pai_id IS NOT NULL
+            AND NOT EXISTS (
+                SELECT 1 FROM relacao_pai_aluno WHERE pai_id = {linha}.pai_id AND id <> {linha}.id
+            );"""
+
+    cursor.execute("INSERT OR IGNORE INTO contadores (chave, valor) VALUES ('pais_vinculados', 0)")
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS contadores_vinculos_ai AFTER INSERT ON relacao_pai_aluno BEGIN
+        {_somar_contador("'vinculos'", 1)}
+        {_primeiro_vinculo("NEW", 1)}
+    END
+    """)
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS contadores_vinculos_ad AFTER DELETE ON relacao_pai_aluno BEGIN
+        {_somar_contador("'vinculos'", -1)}
+        {_primeiro_vinculo("OLD", -1)}
+    END
+    """)
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS contadores_vinculos_au AFTER UPDATE OF pai_id ON relacao_pai_aluno
+    WHEN OLD.pai_id IS NOT NEW.pai_id BEGIN
+        {_primeiro_vinculo("OLD", -1)}
+        {_primeiro_vinculo("NEW", 1)}
+    END
+    """)
+
+    _recontar(cursor)
+
+
+# Contagem "de verdade" de cada contador, direto das tabelas. Usada para
+# preencher a tabela na migração e por reconstruir_contadores().
+_CONTADORES_SQL = """
+    SELECT 'alunos', COUNT(*) FROM alunos
+    UNION ALL SELECT 'relatorios', COUNT(*) FROM relatorios
+    UNION ALL SELECT 'compromissos', COUNT(*) FROM compromissos
+    UNION ALL SELECT 'vinculos', COUNT(*) FROM relacao_pai_aluno
+    UNION ALL SELECT 'pais_vinculados', COUNT(DISTINCT pai_id) FROM relacao_pai_aluno
+        WHERE pai_id IS NOT NULL
+    UNION ALL SELECT 'alunos.gravidade.' || coalesce(gravidade, ''), COUNT(*)
+        FROM alunos GROUP BY gravidade
+    UNION ALL SELECT 'relatorios.psicologo.' || coalesce(psicologo_id, ''), COUNT(*)
+        FROM relatorios GROUP BY psicologo_id
+    UNION ALL SELECT 'compromissos.psicologo.' || coalesce(psicologo_id, ''), COUNT(*)
+        FROM compromissos GROUP BY psicologo_id
+"""
+
+
+def _recontar(cursor):
+    cursor.execute("DELETE FROM contadores")
+    cursor.execute(f"INSERT INTO contadores (chave, valor) {_CONTADORES_SQL}")
+
+
+def _migracao_parametros(cursor):
+    """Tabela 'parametros': ajustes da instalação guardados no próprio banco
+    (chave -> valor em texto). O primeiro é o custo do bcrypt, ver
+    politica_senha.py."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS parametros (
+        chave TEXT PRIMARY KEY,
+        valor TEXT NOT NULL
+    ) WITHOUT ROWID
+    """)
+    cursor.execute(
+        "INSERT OR IGNORE INTO parametros (chave, valor) VALUES (?, ?)",
+        (politica_senha.CHAVE_CUSTO, str(politica_senha.CUSTO_PADRAO))
+    )
+
+
+def _migracao_datas_iso(cursor):
+    """compromissos.data passa de "dd/MM/yyyy" para ISO ("yyyy-MM-dd"): em
+    ISO, a ordem do texto é a ordem cronológica, então ORDER BY data e
+    intervalos (data BETWEEN ? AND ?) funcionam direto no índice
+    idx_compromissos_psicologo_data (psicologo_id, data, hora). Datas em
+    outro formato ficam como estão."""
+    cursor.execute("""
+    UPDATE compromissos
+    SET data = substr(data, 7, 4) || '-' || substr(data, 4, 2) || '-' || substr(data, 1, 2)
+    WHERE data GLOB '[0-9][0-9]/[0-9][0-9]/[0-9][0-9][0-9][0-9]'
+    """)
+
+
+_MIGRACOES = [
+    _migracao_tabelas_base,       # 1
+    _migracao_indices,            # 2
+    _migracao_busca_relatorios,   # 3
+    _migracao_nome_busca,         # 4
+    _migracao_contadores,         # 5
+    _migracao_parametros,         # 6
+    _migracao_datas_iso,          # 7
+]
+
+
+def _normalizar(texto):
+    """Minúsculas e sem acentos — mesma regra de screens.utils._remover_acentos,
+    repetida aqui para o banco não depender da camada de telas (Qt)."""
+    nfkd = unicodedata.normalize("NFKD", texto.lower())
+    return "".join(c for c in nfkd if not unicodedata.combining(c))
+
+
+def _consulta_fts(texto):
+    """Converte o que o usuário digitou numa consulta FTS5 segura: cada
+    palavra vira um termo entre aspas com busca por prefixo, e todos os
+    termos precisam aparecer (E implícito). Aspas, operadores e outros
+    símbolos digitados são descartados em vez de virar erro de sintaxe."""
+    palavras = re.findall(r"\w+", _normalizar(texto))
+    return " ".join(f'"{p}"*' for p in palavras)
+
+
+# ---------- Cache de leitura (ver DatabaseManager.__init__) ----------
+# Tabelas que os gatilhos alteram quando outra tabela é gravada.
+_TABELAS_DERIVADAS = {
+    "alunos": ("contadores",),
+    "relatorios": ("contadores", "relatorios_fts"),
+    "compromissos": ("contadores",),
+    "relacao_pai_aluno": ("contadores",),
+}
+
+# Resultados maiores que isto não entram no cache: guardar a lista inteira
+# de 100 mil alunos ocuparia memória para um ganho pequeno.
+_MAX_LINHAS_CACHE = 5000
+
+
+def _leitura(*tabelas):
+    """Marca um método de consulta como cacheável, dependente de `tabelas`."""
+    def decorador(metodo):
+        @wraps(metodo)
+        def envoltorio(self, *args, **kwargs):
+            return self._ler_com_cache(metodo, tabelas, args, kwargs)
+        return envoltorio
+    return decorador
+
+
+def _escrita(*tabelas):
+    """Marca um método que grava em `tabelas`: invalida o cache delas."""
+    tabelas = set(tabelas)
+    for tabela in list(tabelas):
+        tabelas.update(_TABELAS_DERIVADAS.get(tabela, ()))
+
+    def decorador(metodo):
+        @wraps(metodo)
+        def envoltorio(self, *args, **kwargs):
+            self._registrar_escrita(tabelas)
+            return metodo(self, *args, **kwargs)
+        return envoltorio
+    return decorador
+
+
+def _cabe_no_cache(resultado):
+    linhas = resultado
+    if isinstance(resultado, tuple) and resultado and isinstance(resultado[0], list):
+        linhas = resultado[0]  # (linhas, proximo) das páginas
+    return not isinstance(linhas, (list, set)) or len(linhas) <= _MAX_LINHAS_CACHE
+
+
+def _copiar(resultado):
+    """Cópia rasa de listas/dicts/conjuntos, para quem recebe um resultado
+    do cache poder alterá-lo sem estragar a entrada guardada."""
+    if isinstance(resultado, (list, dict, set)):
+        return resultado.copy()
+    if isinstance(resultado, tuple) and resultado and isinstance(resultado[0], list):
+        return (resultado[0].copy(),) + resultado[1:]  # (linhas, proximo) das páginas
+    return resultado
+
+
 class DatabaseManager:
-    def __init__(self, caminho_banco=None):
+    # Quanto tempo uma conexão espera por outra que está gravando antes de
+    # desistir com "database is locked".
+    BUSY_TIMEOUT_MS = 5000
+
+    def __init__(self, caminho_banco=None, tamanho_cache=0):
         # Por padrão, o banco fica no AppData do usuário — não mais no
         # diretório onde o .exe é executado. Aceita um caminho explícito
         # (ex: para testes) via caminho_banco.
         self.caminho_banco = caminho_banco or os.path.join(obter_pasta_dados(), "sispe.db")
-        self.conn = sqlite3.connect(self.caminho_banco)
+
+        # Cache de leitura, opcional (tamanho_cache = nº máximo de entradas;
+        # 0 desliga). Os métodos marcados com @_leitura guardam o resultado
+        # por (método, argumentos); o menos usado sai quando enche (LRU).
+        # Cada tabela tem uma "geração" que todo método @_escrita incrementa
+        # — ao gravar e de novo ao fim da transação, para que uma leitura
+        # feita por outra thread no meio dela não fique valendo. Uma entrada
+        # só é servida se as gerações das tabelas de que depende não mudaram
+        # desde que foi lida; dentro de uma transacao() o cache é ignorado.
+        self._tamanho_cache = tamanho_cache
+        self._cache = OrderedDict()
+        self._geracoes = {}
+        self._tabelas_sujas = {}  # ident da thread -> tabelas gravadas na transação
+        self._trava_cache = threading.Lock()
+        self.acertos_cache = 0
+        self.falhas_cache = 0
+
+        # Uma conexão por thread (sqlite3 não deixa compartilhar). A thread
+        # que cria o DatabaseManager — a da interface — usa a principal;
+        # threads de trabalho ganham a sua na primeira consulta. Em modo WAL
+        # elas leem em paralelo com a gravação da principal, e o próprio
+        # SQLite garante um único gravador por vez (as demais esperam até
+        # BUSY_TIMEOUT_MS). Obs.: com caminho_banco=":memory:" cada thread
+        # enxergaria um banco diferente — use um arquivo se houver threads.
+        #
+        # As conexões das threads de trabalho ficam num dict por ident e não
+        # num threading.local: threads do QThreadPool recriam o estado Python
+        # a cada tarefa, e um threading.local abriria uma conexão nova por
+        # consulta.
+        self._thread_principal = threading.get_ident()
+        self._conexoes_por_thread = {}
+        self._niveis_transacao = {}  # ident da thread -> transacao() abertas
+        self._conexoes = []
+        self._trava_conexoes = threading.Lock()
+
+        self._conn_principal = self._abrir_conexao()
+        self._conn_principal.execute("PRAGMA journal_mode=WAL")
         self.create_tables()
 
-    def create_tables(self):
-        cursor = self.conn.cursor()
+    @property
+    def conn(self):
+        """Conexão da thread atual. Todos os métodos usam self.conn, então
+        podem ser chamados de qualquer thread sem mudar de assinatura."""
+        ident = threading.get_ident()
+        if ident == self._thread_principal:
+            return self._conn_principal
 
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS usuarios (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE,
-            senha BLOB,
-            tipo TEXT,
-            data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        conn = self._conexoes_por_thread.get(ident)
+        if conn is None:
+            conn = self._abrir_conexao()
+            with self._trava_conexoes:
+                self._conexoes_por_thread[ident] = conn
+        return conn
 
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS alunos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nome TEXT,
-            sala TEXT,
-            serie TEXT,
-            gravidade TEXT
-        )
-        """)
+    def _abrir_conexao(self):
+        conn = sqlite3.connect(self.caminho_banco, timeout=self.BUSY_TIMEOUT_MS / 1000)
+        conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+        # Em WAL, NORMAL só sincroniza no checkpoint: commits bem mais
+        # baratos, sem risco de corromper o banco (no máximo perde-se a
+        # última transação numa queda de energia).
+        conn.execute("PRAGMA synchronous = NORMAL")
+        with self._trava_conexoes:
+            self._conexoes.append(conn)
+        return conn
 
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS relacao_pai_aluno (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            pai_id INTEGER,
-            aluno_id INTEGER
-        )
-        """)
+    @contextmanager
+    def transacao(self):
+        """Unidade de trabalho: tudo que for gravado dentro do bloco entra
+        no banco junto, com um único commit — ou nada entra, se o bloco
+        levantar uma exceção.
 
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS relatorios (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            aluno_id INTEGER,
-            psicologo_id INTEGER,
-            texto TEXT,
-            data TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+            with db.transacao():
+                for pai_id, aluno_id in pares:
+                    db.vincular_pai(pai_id, aluno_id)
 
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS compromissos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            psicologo_id INTEGER,
-            titulo TEXT,
-            data TEXT,
-            hora TEXT,
-            cor TEXT,
-            descricao TEXT
-        )
-        """)
+        Todos os métodos que gravam já usam transacao() por dentro, então
+        chamados soltos continuam confirmando na hora; dentro de um bloco,
+        o commit fica para o bloco mais externo. Blocos aninhados viram
+        SAVEPOINTs: um erro no interno (capturado pelo chamador) desfaz só
+        o que foi feito nele. Vale por thread (cada uma tem sua conexão).
 
-        # Migração: bancos criados antes de existir 'data_criacao' não têm a coluna
-        cursor.execute("PRAGMA table_info(usuarios)")
-        colunas = [c[1] for c in cursor.fetchall()]
-        if "data_criacao" not in colunas:
-            cursor.execute(
-                "ALTER TABLE usuarios ADD COLUMN data_criacao TIMESTAMP"
-            )
+        A transação começa com BEGIN IMMEDIATE, pegando a trava de gravação
+        logo no início: uma transação que só descobrisse a disputa no meio
+        do caminho falharia na hora, sem esperar o busy_timeout."""
+        conn = self.conn
+        ident = threading.get_ident()
+        nivel = self._niveis_transacao.get(ident, 0)
 
-            cursor.execute("""
-            UPDATE usuarios
-            SET data_criacao = CURRENT_TIMESTAMP
-            WHERE data_criacao IS NULL
-            """)
-
-        cursor.execute("SELECT * FROM usuarios WHERE username='admin'")
-        if not cursor.fetchone():
-            senha = bcrypt.hashpw("123".encode(), bcrypt.gensalt())
-            cursor.execute(
-                "INSERT INTO usuarios (username, senha, tipo) VALUES (?, ?, ?)",
-                ("admin", senha, "admin")
-            )
+        if nivel == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        else:
+            conn.execute(f"SAVEPOINT nivel_{nivel}")
+        self._niveis_transacao[ident] = nivel + 1
+
+        try:
+            yield conn
+        except BaseException:
+            if nivel == 0:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO nivel_{nivel}")
+                conn.execute(f"RELEASE nivel_{nivel}")
+            raise
+        else:
+            if nivel == 0:
+                try:
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+            else:
+                conn.execute(f"RELEASE nivel_{nivel}")
+        finally:
+            self._niveis_transacao[ident] = nivel
+            if nivel == 0:
+                sujas = self._tabelas_sujas.pop(ident, None)
+                if sujas:
+                    self._invalidar(sujas)
 
-        self.conn.commit()
+    # ------------------------------------------------------------------ #
+    # Cache de leitura
+    # ------------------------------------------------------------------ #
+    def _ler_com_cache(self, metodo, tabelas, args, kwargs):
+        ident = threading.get_ident()
+        if not self._tamanho_cache or self._niveis_transacao.get(ident, 0):
+            return metodo(self, *args, **kwargs)
+
+        chave = (metodo.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(chave)
+        except TypeError:  # argumento não hasheável (ex: lista) — sem cache
+            return metodo(self, *args, **kwargs)
+
+        with self._trava_cache:
+            # as gerações são lidas ANTES da consulta: se alguém gravar
+            # enquanto ela roda, a entrada já nasce vencida
+            geracoes = tuple(self._geracoes.get(t, 0) for t in tabelas)
+            entrada = self._cache.get(chave)
+            if entrada is not None and entrada[0] == geracoes:
+                self._cache.move_to_end(chave)
+                self.acertos_cache += 1
+                return _copiar(entrada[1])
+            self.falhas_cache += 1
+
+        resultado = metodo(self, *args, **kwargs)
+
+        if _cabe_no_cache(resultado):
+            with self._trava_cache:
+                self._cache[chave] = (geracoes, resultado)
+                self._cache.move_to_end(chave)
+                while len(self._cache) > self._tamanho_cache:
+                    self._cache.popitem(last=False)
+        return _copiar(resultado)
+
+    def _registrar_escrita(self, tabelas):
+        ident = threading.get_ident()
+        self._tabelas_sujas.setdefault(ident, set()).update(tabelas)
+        self._invalidar(tabelas)
+
+    def _invalidar(self, tabelas):
+        with self._trava_cache:
+            for tabela in tabelas:
+                self._geracoes[tabela] = self._geracoes.get(tabela, 0) + 1
+
+    @property
+    def cache_ativo(self):
+        """True se este DatabaseManager guarda as leituras em cache."""
+        return bool(self._tamanho_cache)
+
+    def limpar_cache(self):
+        """Descarta tudo que está no cache (ex: depois de gravar no banco
+        por fora dos métodos desta classe)."""
+        with self._trava_cache:
+            self._cache.clear()
+            for tabela in self._geracoes:
+                self._geracoes[tabela] += 1
+
+    def fechar(self):
+        """Fecha todas as conexões abertas por este DatabaseManager (as de
+        threads de trabalho só podem ser fechadas depois que elas terminam)."""
+        with self._trava_conexoes:
+            conexoes, self._conexoes = self._conexoes, []
+            self._conexoes_por_thread.clear()
+        for conn in conexoes:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+
+    def create_tables(self):
+        """Leva o banco até a versão atual do esquema.
+
+        Cada passo de _MIGRACOES roda exatamente uma vez: a versão aplicada
+        fica gravada em PRAGMA user_version. Com o banco já atualizado, a
+        abertura custa uma única leitura desse PRAGMA — nada de
+        PRAGMA table_info nem checagem do admin a cada execução."""
+        cursor = self.conn.cursor()
+        versao = cursor.execute("PRAGMA user_version").fetchone()[0]
+
+        for numero, migracao in enumerate(_MIGRACOES, start=1):
+            if numero <= versao:
+                continue
+            # DDL não abre transação implícita no sqlite3 — a transação
+            # explícita garante que o passo e o novo user_version entrem
+            # juntos (ou não entrem) no banco.
+            with self.transacao():
+                migracao(cursor)
+                cursor.execute(f"PRAGMA user_version = {numero}")
+
+    def _pagina(self, selecao, origem, filtros, parametros, chave, tamanho, cursor,
+                decrescente=False):
+        """Paginação por chave ("keyset"/seek): em vez de OFFSET, que relê e
+        descarta todas as linhas anteriores, cada página continua a partir
+        da chave de ordenação da última linha da página anterior — o índice
+        vai direto ao ponto, não importa o quão longe a lista já rolou.
+
+        selecao/origem/filtros montam o SELECT; chave é a lista de
+        expressões da ordenação, terminando numa coluna única (o id) para
+        desempatar. Retorna (linhas, proximo_cursor); o cursor é a tupla com
+        a chave da última linha devolvida, ou None quando não há mais
+        páginas. As colunas da chave são usadas só internamente — as
+        linhas saem só com as colunas de `selecao`."""
+        onde = list(filtros)
+        valores = list(parametros)
+        if cursor is not None:
+            operador = "<" if decrescente else ">"
+            marcadores = ", ".join("?" * len(chave))
+            onde.append(f"({', '.join(chave)}) {operador} ({marcadores})")
+            valores.extend(cursor)
+
+        clausula_where = f"WHERE {' AND '.join(onde)}" if onde else ""
+        direcao = " DESC" if decrescente else ""
+        sql = f"""
+        SELECT {selecao}, {', '.join(chave)}
+        FROM {origem}
+        {clausula_where}
+        ORDER BY {', '.join(c + direcao for c in chave)}
+        LIMIT ?
+        """
+        # Uma linha a mais só para saber se existe outra página depois desta
+        linhas = self.conn.execute(sql, (*valores, tamanho + 1)).fetchall()
+
+        n = len(chave)
+        proximo = tuple(linhas[tamanho - 1][-n:]) if len(linhas) > tamanho else None
+        return [linha[:-n] for linha in linhas[:tamanho]], proximo
 
     # LOGIN
     def login(self, user, senha):
@@ -117,39 +711,263 @@ class DatabaseManager:
         cursor.execute("SELECT id, senha, tipo FROM usuarios WHERE username=?", (user,))
         result = cursor.fetchone()
 
-        if result and bcrypt.checkpw(senha.encode(), result[1]):
+        if result and politica_senha.conferir(senha, result[1]):
             return {"id": result[0], "tipo": result[2], "username": user}
         return None
 
+    def perfil_para_login(self, user):
+        """(id, tipo) do usuário, sem conferir a senha — só para adiantar,
+        enquanto o login confere, as consultas da tela seguinte. Nada do
+        que for lido com isto pode ir para a tela antes do login passar."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT id, tipo FROM usuarios WHERE username=?", (user,))
+        return cursor.fetchone()
+
+    def atualizar_hash_se_preciso(self, user_id, senha):
+        """Chamado depois de um login que deu certo (com a senha já
+        conferida): se o hash gravado usa um custo diferente do da
+        política, grava um novo. Lento como um login — rode fora da thread
+        da interface. Devolve True se o hash foi trocado."""
+        custo = self.custo_senha()
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT senha FROM usuarios WHERE id=?", (user_id,))
+        result = cursor.fetchone()
+        if not result or not politica_senha.precisa_rehash(result[0], custo):
+            return False
+
+        senha_hash = politica_senha.gerar_hash(senha, custo)
+        self._registrar_escrita({"usuarios"})
+        with self.transacao():
+            cursor = self.conn.cursor()
+            # só troca se ninguém mudou a senha enquanto o hash era calculado
+            cursor.execute(
+                "UPDATE usuarios SET senha=? WHERE id=? AND senha=?",
+                (senha_hash, user_id, result[0])
+            )
+            return cursor.rowcount == 1
+
+    # PARÂMETROS DA INSTALAÇÃO
+    @_leitura("parametros")
+    def obter_parametro(self, chave, padrao=None):
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT valor FROM parametros WHERE chave=?", (chave,))
+        result = cursor.fetchone()
+        return result[0] if result else padrao
+
+    @_escrita("parametros")
+    def definir_parametro(self, chave, valor):
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT INTO parametros (chave, valor) VALUES (?, ?) "
+                "ON CONFLICT (chave) DO UPDATE SET valor = excluded.valor",
+                (chave, str(valor))
+            )
+
+    def custo_senha(self):
+        """Custo do bcrypt usado para novas senhas (ver politica_senha.py)."""
+        valor = self.obter_parametro(politica_senha.CHAVE_CUSTO)
+        try:
+            return int(valor)
+        except (TypeError, ValueError):
+            return politica_senha.CUSTO_PADRAO
+
     # USUÁRIOS
+    @_escrita("usuarios")
     def criar_usuario(self, username, senha, tipo):
-        cursor = self.conn.cursor()
-        senha_hash = bcrypt.hashpw(senha.encode(), bcrypt.gensalt())
-        cursor.execute(
-            "INSERT INTO usuarios (username, senha, tipo) VALUES (?, ?, ?)",
-            (username, senha_hash, tipo)
-        )
-        self.conn.commit()
+        # o hash (lento de propósito) fica fora da transação, para não
+        # segurar o banco travado para gravação enquanto calcula
+        senha_hash = politica_senha.gerar_hash(senha, self.custo_senha())
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT INTO usuarios (username, senha, tipo) VALUES (?, ?, ?)",
+                (username, senha_hash, tipo)
+            )
     
     def usuario_existe(self, username):
         cursor = self.conn.cursor()
         cursor.execute("SELECT 1 FROM usuarios WHERE username=?", (username,))
         return cursor.fetchone() is not None
 
-    # ALUNOS (AGORA COMPLETO)
-    def adicionar_aluno(self, nome, sala, serie, gravidade):
+    def usuarios_existentes(self, usernames):
+        """Quais destes usernames já existem — uma consulta só, com a lista
+        inteira num parâmetro (json_each), em vez de um usuario_existe por
+        linha numa importação."""
         cursor = self.conn.cursor()
         cursor.execute(
-            "INSERT INTO alunos (nome, sala, serie, gravidade) VALUES (?, ?, ?, ?)",
-            (nome, sala, serie, gravidade)
+            "SELECT username FROM usuarios WHERE username IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(usernames)),)
         )
-        self.conn.commit()
+        return {username for (username,) in cursor.fetchall()}
+
+    @_escrita("usuarios")
+    def criar_usuarios_em_lote(self, usuarios):
+        """Insere vários usuários numa única transação. usuarios é uma lista
+        de (username, senha_hash, tipo), com o hash já calculado (ver
+        politica_senha.gerar_hashes). Um username que outra pessoa criou
+        nesse meio tempo é ignorado em vez de desfazer o lote inteiro.
+        Retorna o total inserido."""
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.executemany(
+                "INSERT INTO usuarios (username, senha, tipo) VALUES (?, ?, ?) "
+                "ON CONFLICT (username) DO NOTHING",
+                usuarios
+            )
+            return cursor.rowcount
+
+    # ALUNOS (AGORA COMPLETO)
+    @_escrita("alunos")
+    def adicionar_aluno(self, nome, sala, serie, gravidade):
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT INTO alunos (nome, sala, serie, gravidade, nome_busca) VALUES (?, ?, ?, ?, ?)",
+                (nome, sala, serie, gravidade, _normalizar(nome))
+            )
+
+    @_escrita("alunos")
+    def adicionar_alunos_em_lote(self, lotes, ao_lote=None):
+        """Insere vários alunos de uma vez (importação de planilha).
+
+        lotes é um iterável de listas de (nome, sala, serie, gravidade) —
+        pode ser um gerador que vai lendo o arquivo. Ele é consumido inteiro
+        ANTES de a transação começar: ler e validar a planilha pode levar
+        segundos, e nesse tempo a trava de gravação (BEGIN IMMEDIATE) faria
+        qualquer gravação das telas (um relatório, um compromisso) estourar
+        o busy_timeout com "database is locked". Um cancelamento levantado
+        pelo gerador, portanto, chega antes de qualquer gravação.
+
+        Cada lote entra com um executemany e tudo fica numa única
+        transação, curta: um commit no fim, ou nada gravado se algo der
+        errado no meio. ao_lote(total_ate_agora) é chamada depois de cada
+        lote. Retorna o total inserido."""
+        lotes = list(lotes)
+        cursor = self.conn.cursor()
+        total = 0
+        with self.transacao():
+            for lote in lotes:
+                cursor.executemany(
+                    "INSERT INTO alunos (nome, sala, serie, gravidade, nome_busca) VALUES (?, ?, ?, ?, ?)",
+                    [(nome, sala, serie, gravidade, _normalizar(nome))
+                     for nome, sala, serie, gravidade in lote]
+                )
+                total += len(lote)
+                if ao_lote is not None:
+                    ao_lote(total)
+        return total
+
+    @_escrita("alunos")
+    def promover_alunos(self, series):
+        """Virada do ano letivo: troca a série de todos os alunos conforme
+        o dicionário {serie_atual: serie_nova} (ex: {"8º ano": "9º ano",
+        "9º ano": "1º EM"}). Um único UPDATE com CASE — aplicar um par de
+        cada vez promoveria duas vezes quem sobe do 8º para o 9º e depois
+        do 9º para o 1º EM. Retorna quantos alunos mudaram de série."""
+        if not series:
+            return 0
+        casos = " ".join("WHEN ? THEN ?" for _ in series)
+        parametros = [valor for par in series.items() for valor in par]
+        marcadores = ", ".join("?" for _ in series)
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"UPDATE alunos SET serie = CASE serie {casos} END WHERE serie IN ({marcadores})",
+                parametros + list(series)
+            )
+            return cursor.rowcount
 
+    def chaves_alunos(self):
+        """Conjunto com o (nome, sala, serie) de todos os alunos — para uma
+        importação checar duplicatas em memória, sem uma consulta por linha
+        (é a mesma regra de aluno_existe)."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT nome, sala, serie FROM alunos")
+        return set(cursor.fetchall())
+
+    @_leitura("alunos")
     def listar_alunos(self):
         cursor = self.conn.cursor()
         cursor.execute("SELECT id, nome, sala, serie, gravidade FROM alunos")
         return cursor.fetchall()
     
+    @_leitura("alunos", "relatorios")
+    def listar_alunos_com_resumo(self, busca=None):
+        """Retorna (id, nome, sala, serie, gravidade, ultima_data,
+        total_relatorios) dos alunos, em ordem alfabética, numa única
+        consulta.
+
+        busca filtra por trecho do nome, sem diferenciar maiúsculas nem
+        acentos (compara com a coluna nome_busca). ultima_data é None para
+        quem ainda não tem relatório. As duas subconsultas resolvem-se pelo
+        índice (aluno_id, data DESC) sem tocar no texto dos relatórios."""
+        sql, parametros = self._sql_alunos_com_resumo(busca)
+        cursor = self.conn.cursor()
+        cursor.execute(sql, parametros)
+        return cursor.fetchall()
+
+    @_leitura("alunos", "relatorios")
+    def listar_alunos_pagina(self, tamanho, cursor=None, busca=None):
+        """Versão paginada de listar_alunos_com_resumo(), mesma ordem e
+        mesmas colunas. Retorna (linhas, proximo_cursor); passe o cursor
+        devolvido para obter a página seguinte (None = fim)."""
+        filtros, parametros = self._filtro_busca_alunos(busca)
+        return self._pagina(
+            self._SELECAO_ALUNOS_COM_RESUMO, "alunos", filtros, parametros,
+            ["alunos.nome_busca", "alunos.id"], tamanho, cursor
+        )
+
+    _SELECAO_ALUNOS_COM_RESUMO = """
+            alunos.id, alunos.nome, alunos.sala, alunos.serie, alunos.gravidade,
+            (SELECT MAX(data) FROM relatorios WHERE relatorios.aluno_id = alunos.id),
+            (SELECT COUNT(*) FROM relatorios WHERE relatorios.aluno_id = alunos.id)
+        """
+
+    @staticmethod
+    def _filtro_busca_alunos(busca):
+        if busca:
+            return ["instr(alunos.nome_busca, ?) > 0"], (_normalizar(busca),)
+        return [], ()
+
+    def _sql_alunos_com_resumo(self, busca):
+        filtros, parametros = self._filtro_busca_alunos(busca)
+        clausula_where = f"WHERE {filtros[0]}" if filtros else ""
+        sql = f"""
+        SELECT {self._SELECAO_ALUNOS_COM_RESUMO}
+        FROM alunos
+        {clausula_where}
+        ORDER BY alunos.nome_busca, alunos.id
+        """
+        return sql, parametros
+
+    @_leitura("alunos")
+    def obter_aluno(self, aluno_id):
+        """Retorna (id, nome, sala, serie, gravidade) de um aluno, ou None."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT id, nome, sala, serie, gravidade FROM alunos WHERE id=?", (aluno_id,)
+        )
+        return cursor.fetchone()
+
+    def listar_alunos_filtrados(self, sala=None, serie=None, gravidade=None):
+        """(id, nome, sala, serie, gravidade) dos alunos da turma, em ordem
+        alfabética — para a exportação em lote. Filtro vazio/None = todos.
+        Não passa pelo cache: é uma leitura de uma vez só."""
+        onde, valores = [], []
+        for coluna, valor in (("sala", sala), ("serie", serie), ("gravidade", gravidade)):
+            if valor:
+                onde.append(f"{coluna}=?")
+                valores.append(valor)
+        clausula_where = f"WHERE {' AND '.join(onde)}" if onde else ""
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+        SELECT id, nome, sala, serie, gravidade FROM alunos
+        {clausula_where}
+        ORDER BY nome_busca, id
+        """, valores)
+        return cursor.fetchall()
+
     def aluno_existe(self, nome, sala, serie):
         cursor = self.conn.cursor()
         cursor.execute("""
@@ -158,38 +976,57 @@ class DatabaseManager:
         """, (nome, sala, serie))
         return cursor.fetchone() is not None
     
+    @_escrita("alunos")
     def atualizar_aluno(self, aluno_id, nome, sala, serie, gravidade):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        UPDATE alunos
-        SET nome=?, sala=?, serie=?, gravidade=?
-        WHERE id=?
-        """, (nome, sala, serie, gravidade, aluno_id))
-        self.conn.commit()
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute("""
+            UPDATE alunos
+            SET nome=?, sala=?, serie=?, gravidade=?, nome_busca=?
+            WHERE id=?
+            """, (nome, sala, serie, gravidade, _normalizar(nome), aluno_id))
 
+    @_escrita("alunos", "relatorios", "relacao_pai_aluno")
     def excluir_aluno(self, aluno_id):
-        cursor = self.conn.cursor()
+        with self.transacao():
+            cursor = self.conn.cursor()
 
-        # remove vínculos
-        cursor.execute("DELETE FROM relacao_pai_aluno WHERE aluno_id=?", (aluno_id,))
+            # remove vínculos
+            cursor.execute("DELETE FROM relacao_pai_aluno WHERE aluno_id=?", (aluno_id,))
 
-        # remove relatórios
-        cursor.execute("DELETE FROM relatorios WHERE aluno_id=?", (aluno_id,))
+            # remove relatórios
+            cursor.execute("DELETE FROM relatorios WHERE aluno_id=?", (aluno_id,))
 
-        # remove aluno
-        cursor.execute("DELETE FROM alunos WHERE id=?", (aluno_id,))
-
-        self.conn.commit()
+            # remove aluno
+            cursor.execute("DELETE FROM alunos WHERE id=?", (aluno_id,))
 
     # RELAÇÃO
+    @_escrita("relacao_pai_aluno")
     def vincular_pai(self, pai_id, aluno_id):
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO relacao_pai_aluno (pai_id, aluno_id) VALUES (?, ?)",
-            (pai_id, aluno_id)
-        )
-        self.conn.commit()
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT INTO relacao_pai_aluno (pai_id, aluno_id) VALUES (?, ?)",
+                (pai_id, aluno_id)
+            )
+
+    @_escrita("relacao_pai_aluno")
+    def vincular_pais_em_lote(self, pares):
+        """Cria vários vínculos (pai_id, aluno_id) numa transação só,
+        pulando os que já existem (mesma regra de vinculo_existe). Retorna
+        quantos vínculos novos foram criados."""
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.executemany("""
+            INSERT INTO relacao_pai_aluno (pai_id, aluno_id)
+            SELECT ?1, ?2
+            WHERE NOT EXISTS (
+                SELECT 1 FROM relacao_pai_aluno WHERE pai_id = ?1 AND aluno_id = ?2
+            )
+            """, pares)
+            return cursor.rowcount
 
+    @_leitura("alunos", "relacao_pai_aluno")
     def alunos_do_pai(self, pai_id):
         cursor = self.conn.cursor()
         cursor.execute("""
@@ -200,6 +1037,7 @@ class DatabaseManager:
         """, (pai_id,))
         return cursor.fetchall()
 
+    @_leitura("usuarios")
     def listar_pais(self):
         """Retorna (id, username) de todos os usuários do tipo 'pai'."""
         cursor = self.conn.cursor()
@@ -214,6 +1052,7 @@ class DatabaseManager:
         )
         return cursor.fetchone() is not None
 
+    @_leitura("relacao_pai_aluno", "usuarios", "alunos")
     def listar_vinculos(self):
         """Retorna (vinculo_id, pai_username, aluno_id, aluno_nome) de todos os vínculos."""
         cursor = self.conn.cursor()
@@ -222,24 +1061,52 @@ class DatabaseManager:
         FROM relacao_pai_aluno
         JOIN usuarios ON usuarios.id = relacao_pai_aluno.pai_id
         JOIN alunos ON alunos.id = relacao_pai_aluno.aluno_id
-        ORDER BY usuarios.username
+        ORDER BY usuarios.username, relacao_pai_aluno.aluno_id, relacao_pai_aluno.id
         """)
         return cursor.fetchall()
 
-    def desvincular(self, vinculo_id):
+    @_leitura("relacao_pai_aluno", "usuarios", "alunos")
+    def listar_vinculos_pagina(self, tamanho, cursor=None):
+        """Versão paginada de listar_vinculos(). Retorna (linhas, proximo_cursor).
+
+        O CROSS JOIN fixa a ordem das tabelas no SQLite: a consulta anda
+        pelo índice único de usuarios.username a partir do cursor e, para
+        cada pai, busca os vínculos em idx_relacao_pai_aluno (pai_id,
+        aluno_id). Com um JOIN comum, o planejador pode varrer
+        relacao_pai_aluno inteira e ordenar tudo a cada página. A ordem só
+        é refeita dentro dos vínculos de um mesmo pai (poucas linhas)."""
+        return self._pagina(
+            "relacao_pai_aluno.id, usuarios.username, alunos.id, alunos.nome",
+            """usuarios
+            CROSS JOIN relacao_pai_aluno ON relacao_pai_aluno.pai_id = usuarios.id
+            JOIN alunos ON alunos.id = relacao_pai_aluno.aluno_id""",
+            [], (), ["usuarios.username", "relacao_pai_aluno.aluno_id", "relacao_pai_aluno.id"],
+            tamanho, cursor
+        )
+
+    @_leitura("relacao_pai_aluno")
+    def contar_vinculos(self):
         cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM relacao_pai_aluno WHERE id=?", (vinculo_id,))
-        self.conn.commit()
+        cursor.execute("SELECT COUNT(*) FROM relacao_pai_aluno")
+        return cursor.fetchone()[0]
+
+    @_escrita("relacao_pai_aluno")
+    def desvincular(self, vinculo_id):
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM relacao_pai_aluno WHERE id=?", (vinculo_id,))
 
     # RELATÓRIOS
+    @_escrita("relatorios")
     def criar_relatorio(self, aluno_id, psicologo_id, texto):
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO relatorios (aluno_id, psicologo_id, texto) VALUES (?, ?, ?)",
-            (aluno_id, psicologo_id, texto)
-        )
-        self.conn.commit()
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT INTO relatorios (aluno_id, psicologo_id, texto) VALUES (?, ?, ?)",
+                (aluno_id, psicologo_id, texto)
+            )
 
+    @_leitura("relatorios")
     def listar_relatorios_aluno(self, aluno_id):
         cursor = self.conn.cursor()
         cursor.execute("""
@@ -249,7 +1116,79 @@ class DatabaseManager:
         """, (aluno_id,))
         return cursor.fetchall()
 
+    def iterar_relatorios_aluno(self, aluno_id, lote=100):
+        """Mesmas linhas (texto, data) de listar_relatorios_aluno, mas
+        trazidas do cursor de `lote` em `lote` conforme quem consome pede —
+        para exportar um histórico enorme sem tê-lo inteiro na memória.
+        Não passa pelo cache; consuma na mesma thread que chamou."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+        SELECT texto, data FROM relatorios
+        WHERE aluno_id=?
+        ORDER BY data DESC
+        """, (aluno_id,))
+        try:
+            while True:
+                linhas = cursor.fetchmany(lote)
+                if not linhas:
+                    return
+                yield from linhas
+        finally:
+            cursor.close()
+
+    @_leitura("relatorios")
+    def contar_relatorios_aluno(self, aluno_id):
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM relatorios WHERE aluno_id=?", (aluno_id,))
+        return cursor.fetchone()[0]
+
+    @_leitura("relatorios")
+    def listar_previas_relatorios_pagina(self, aluno_id, tamanho, cursor=None, tamanho_previa=80):
+        """Histórico do aluno para listagem, mais recentes primeiro, uma
+        página por vez: (linhas, proximo_cursor), cada linha (id, data,
+        previa, tamanho) — previa são os primeiros `tamanho_previa`
+        caracteres do texto e tamanho, o comprimento dele todo. O texto
+        inteiro não sai do banco; quem precisa dele pede obter_relatorio(id)."""
+        return self._pagina(
+            "id, data, substr(texto, 1, ?), length(texto)", "relatorios", ["aluno_id=?"],
+            (tamanho_previa, aluno_id), ["data", "id"], tamanho, cursor, decrescente=True
+        )
+
+    @_leitura("relatorios")
+    def obter_relatorio(self, relatorio_id):
+        """Retorna (texto, data) de um relatório, ou None."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT texto, data FROM relatorios WHERE id=?", (relatorio_id,))
+        return cursor.fetchone()
+
+    @_leitura("relatorios", "relatorios_fts", "alunos")
+    def buscar_relatorios(self, consulta, limite=50, offset=0):
+        """Busca de texto completo no conteúdo dos relatórios.
+
+        Retorna (relatorio_id, aluno_id, aluno_nome, data, trecho) em ordem
+        de relevância (bm25). O trecho traz os termos encontrados entre
+        « e ». A consulta ignora acentos e maiúsculas e aceita prefixos
+        ("automut" encontra "automutilação")."""
+        expressao = _consulta_fts(consulta)
+        if not expressao:
+            return []
+
+        cursor = self.conn.cursor()
+        cursor.execute("""
+        SELECT
+            relatorios.id, relatorios.aluno_id, alunos.nome, relatorios.data,
+            snippet(relatorios_fts, 0, '«', '»', '…', 16)
+        FROM relatorios_fts
+        JOIN relatorios ON relatorios.id = relatorios_fts.rowid
+        LEFT JOIN alunos ON alunos.id = relatorios.aluno_id
+        WHERE relatorios_fts MATCH ?
+        ORDER BY relatorios_fts.rank
+        LIMIT ? OFFSET ?
+        """, (expressao, limite, offset))
+        return cursor.fetchall()
+
     # PERFIL
+    @_leitura("usuarios")
     def obter_usuario(self, user_id):
         """Retorna dict com username, tipo e data_criacao de um usuário."""
         cursor = self.conn.cursor()
@@ -262,14 +1201,17 @@ class DatabaseManager:
         return {"username": result[0], "tipo": result[1], "data_criacao": result[2]}
 
     # AGENDA (compromissos do psicólogo)
+    # Datas sempre em ISO, "yyyy-MM-dd" (ver _migracao_datas_iso).
+    @_escrita("compromissos")
     def criar_compromisso(self, psicologo_id, titulo, data, hora, cor, descricao=""):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        INSERT INTO compromissos (psicologo_id, titulo, data, hora, cor, descricao)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """, (psicologo_id, titulo, data, hora, cor, descricao))
-        self.conn.commit()
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute("""
+            INSERT INTO compromissos (psicologo_id, titulo, data, hora, cor, descricao)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """, (psicologo_id, titulo, data, hora, cor, descricao))
 
+    @_leitura("compromissos")
     def listar_compromissos(self, psicologo_id):
         """Retorna (id, titulo, data, hora, cor, descricao) ordenados por data/hora."""
         cursor = self.conn.cursor()
@@ -281,6 +1223,15 @@ class DatabaseManager:
         """, (psicologo_id,))
         return cursor.fetchall()
 
+    @_leitura("compromissos")
+    def listar_compromissos_pagina(self, psicologo_id, tamanho, cursor=None):
+        """Versão paginada de listar_compromissos(). Retorna (linhas, proximo_cursor)."""
+        return self._pagina(
+            "id, titulo, data, hora, cor, descricao", "compromissos",
+            ["psicologo_id=?"], (psicologo_id,), ["data", "hora", "id"], tamanho, cursor
+        )
+
+    @_leitura("compromissos")
     def compromissos_por_data(self, psicologo_id, data):
 
         cursor = self.conn.cursor()
@@ -300,99 +1251,172 @@ class DatabaseManager:
 
         return cursor.fetchall()
 
-    def datas_com_compromissos(self, psicologo_id):
+    @_leitura("compromissos")
+    def compromissos_no_intervalo(self, psicologo_id, inicio, fim):
+        """(id, titulo, data, hora, cor, descricao) de inicio a fim (datas
+        ISO, as duas inclusive), em ordem de data/hora — uma semana ou um
+        mês inteiro numa única leitura de faixa do índice."""
         cursor = self.conn.cursor()
-
         cursor.execute("""
-            SELECT DISTINCT data
-            FROM compromissos
-            WHERE psicologo_id=?
-        """, (psicologo_id,))
+        SELECT id, titulo, data, hora, cor, descricao
+        FROM compromissos
+        WHERE psicologo_id=? AND data BETWEEN ? AND ?
+        ORDER BY data, hora
+        """, (psicologo_id, inicio, fim))
+        return cursor.fetchall()
+
+    @_leitura("compromissos")
+    def datas_com_compromissos(self, psicologo_id, inicio=None, fim=None):
+        """Datas (ISO) com ao menos um compromisso, opcionalmente só as
+        de inicio a fim."""
+        cursor = self.conn.cursor()
+        if inicio is None and fim is None:
+            cursor.execute("""
+                SELECT DISTINCT data
+                FROM compromissos
+                WHERE psicologo_id=?
+            """, (psicologo_id,))
+        else:
+            cursor.execute("""
+                SELECT DISTINCT data
+                FROM compromissos
+                WHERE psicologo_id=? AND data BETWEEN ? AND ?
+            """, (psicologo_id, inicio or "0000-00-00", fim or "9999-99-99"))
 
         return [linha[0] for linha in cursor.fetchall()]
 
+    @_escrita("compromissos")
     def excluir_compromisso(self, compromisso_id):
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM compromissos WHERE id=?", (compromisso_id,))
-        self.conn.commit()
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM compromissos WHERE id=?", (compromisso_id,))
 
+    @_escrita("compromissos")
     def atualizar_compromisso(self, compromisso_id, titulo, data, hora, cor, descricao=""):
         """Atualiza um compromisso existente."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            UPDATE compromissos
-            SET titulo=?, data=?, hora=?, cor=?, descricao=?
-            WHERE id=?
-            """,
-            (titulo, data, hora, cor, descricao, compromisso_id)
-        )
-        self.conn.commit()
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                UPDATE compromissos
+                SET titulo=?, data=?, hora=?, cor=?, descricao=?
+                WHERE id=?
+                """,
+                (titulo, data, hora, cor, descricao, compromisso_id)
+            )
 
     # DASHBOARD (tela inicial)
+    @_leitura("contadores")
     def obter_estatisticas_dashboard(self):
         """Retorna um dict com os números exibidos nos cards da tela inicial.
-        Mantém toda a lógica de SQL aqui — as telas só consomem este método."""
-        cursor = self.conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM alunos")
-        total_alunos = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM relatorios")
-        total_relatorios = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(DISTINCT pai_id) FROM relacao_pai_aluno")
-        total_pais = cursor.fetchone()[0]
+        Mantém toda a lógica de SQL aqui — as telas só consomem este método.
 
-        cursor.execute("SELECT COUNT(*) FROM alunos WHERE gravidade='grave'")
-        total_urgentes = cursor.fetchone()[0]
-
-        return {
-            "alunos": total_alunos,
-            "relatorios": total_relatorios,
-            "pais": total_pais,
-            "urgentes": total_urgentes,
-        }
+        Lê da tabela 'contadores' (mantida pelos gatilhos), não conta as
+        tabelas: o custo é o mesmo com 100 ou 100 mil alunos."""
+        return self._ler_contadores({
+            "alunos": "alunos",
+            "relatorios": "relatorios",
+            "pais": "pais_vinculados",
+            "urgentes": "alunos.gravidade.grave",
+        })
 
+    @_leitura("contadores")
     def obter_estatisticas_psicologo(self, psicologo_id):
         """Retorna um dict só com os números que pertencem a ESSE psicólogo
         (relatórios que ele escreveu, compromissos que ele agendou) — ao
         contrário de obter_estatisticas_dashboard(), que é global/escola
         inteira e é só para o admin."""
+        return self._ler_contadores({
+            "relatorios": f"relatorios.psicologo.{psicologo_id}",
+            "compromissos": f"compromissos.psicologo.{psicologo_id}",
+        })
+
+    def _ler_contadores(self, nomes):
+        """{nome: chave} -> {nome: valor}; contador inexistente vale 0."""
+        chaves = list(nomes.values())
         cursor = self.conn.cursor()
+        cursor.execute(
+            f"SELECT chave, valor FROM contadores WHERE chave IN ({', '.join('?' for _ in chaves)})",
+            chaves
+        )
+        valores = dict(cursor.fetchall())
+        return {nome: valores.get(chave, 0) for nome, chave in nomes.items()}
 
-        cursor.execute("SELECT COUNT(*) FROM relatorios WHERE psicologo_id=?", (psicologo_id,))
-        total_relatorios = cursor.fetchone()[0]
+    def verificar_contadores(self):
+        """Compara a tabela 'contadores' com uma contagem completa das
+        tabelas. Retorna {chave: (armazenado, real)} só das que divergem —
+        vazio quando está tudo certo."""
+        cursor = self.conn.cursor()
+        cursor.execute(_CONTADORES_SQL)
+        reais = dict(cursor.fetchall())
+        cursor.execute("SELECT chave, valor FROM contadores")
+        armazenados = dict(cursor.fetchall())
 
-        cursor.execute("SELECT COUNT(*) FROM compromissos WHERE psicologo_id=?", (psicologo_id,))
-        total_compromissos = cursor.fetchone()[0]
+        divergencias = {}
+        for chave in reais.keys() | armazenados.keys():
+            # contador zerado e contador ausente dão no mesmo
+            armazenado, real = armazenados.get(chave, 0), reais.get(chave, 0)
+            if armazenado != real:
+                divergencias[chave] = (armazenado, real)
+        return divergencias
 
-        return {
-            "relatorios": total_relatorios,
-            "compromissos": total_compromissos,
-        }
+    @_escrita("contadores")
+    def reconstruir_contadores(self):
+        """Recalcula a tabela 'contadores' do zero (ex: depois de mexer no
+        banco por fora do sistema). Retorna as divergências encontradas
+        antes da reconstrução, como verificar_contadores()."""
+        with self.transacao():
+            divergencias = self.verificar_contadores()
+            _recontar(self.conn.cursor())
+        return divergencias
 
     # ADMINISTRAÇÃO (gerenciar usuários)
+    @_leitura("usuarios")
     def contar_usuarios(self):
         cursor = self.conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM usuarios")
         return cursor.fetchone()[0]
 
+    @_leitura("usuarios")
     def contar_usuarios_por_tipo(self, tipo):
         cursor = self.conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM usuarios WHERE tipo=?", (tipo,))
         return cursor.fetchone()[0]
 
-    def listar_usuarios(self):
-        """Retorna (id, username, tipo) de todos os usuários cadastrados."""
+    @_leitura("usuarios")
+    def listar_usuarios(self, busca=None):
+        """Retorna (id, username, tipo) dos usuários cadastrados, em ordem
+        de username. busca filtra por trecho do username (sem diferenciar
+        maiúsculas)."""
+        filtros, parametros = self._filtro_busca_usuarios(busca)
+        clausula_where = f"WHERE {filtros[0]}" if filtros else ""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT id, username, tipo FROM usuarios")
+        cursor.execute(
+            f"SELECT id, username, tipo FROM usuarios {clausula_where} ORDER BY username, id",
+            parametros
+        )
         return cursor.fetchall()
 
+    @_leitura("usuarios")
+    def listar_usuarios_pagina(self, tamanho, cursor=None, busca=None):
+        """Versão paginada de listar_usuarios(). Retorna (linhas, proximo_cursor)."""
+        filtros, parametros = self._filtro_busca_usuarios(busca)
+        return self._pagina(
+            "id, username, tipo", "usuarios", filtros, parametros,
+            ["username", "id"], tamanho, cursor
+        )
+
+    @staticmethod
+    def _filtro_busca_usuarios(busca):
+        if busca:
+            return ["instr(lower(username), ?) > 0"], (busca.strip().lower(),)
+        return [], ()
+
+    @_escrita("usuarios", "relacao_pai_aluno", "relatorios")
     def excluir_usuario(self, user_id):
         """Exclui o usuário e limpa vínculos/relatórios associados a ele."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM relacao_pai_aluno WHERE pai_id=?", (user_id,))
-        cursor.execute("DELETE FROM relatorios WHERE psicologo_id=?", (user_id,))
-        cursor.execute("DELETE FROM usuarios WHERE id=?", (user_id,))
-        self.conn.commit()
\ No newline at end of file
+        with self.transacao():
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM relacao_pai_aluno WHERE pai_id=?", (user_id,))
+            cursor.execute("DELETE FROM relatorios WHERE psicologo_id=?", (user_id,))
+            cursor.execute("DELETE FROM usuarios WHERE id=?", (user_id,))
\ No newline at end of file
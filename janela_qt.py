@@ -0,0 +1,126 @@
+"""
+janela_qt.py
+=============
+A janela do SISPE (App) e a partida da interface (executar).
+
+Fica fora do main.py para o main.py não importar o Qt no nível do
+módulo: os processos de trabalho criados com "spawn"
+(politica_senha.gerar_hashes, prontuario_pdf.exportar_em_paralelo)
+reexecutam o main.py como __mp_main__, e só o que está fora do
+`if __name__ == "__main__"` roda neles. Assim cada processo novo não
+paga o PyQt6, o qfluentwidgets e a tela de login, que não usa.
+"""
+
+import importlib
+import os
+import sys
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication, QMessageBox, QStackedWidget
+
+import linha_do_tempo
+from database import DatabaseManager, obter_pasta_dados
+from screens.login_qt import LoginScreen
+from screens.assincrono import BancoAssincrono
+from screens.theme import GLOBAL_STYLESHEET
+from screens.utils import mostrar_alerta
+
+
+class App(QStackedWidget):
+    """Janela do SISPE. A partida é feita em etapas, para a tela de login
+    aparecer o quanto antes:
+
+    1. só o LoginScreen é construído, e a janela é mostrada;
+    2. depois da primeira pintura, num ciclo ocioso, o banco é aberto
+       (migrações, conferência do admin) e o "Entrar" é liberado;
+    3. no ciclo ocioso seguinte, main_app_qt é importado e o MainApp
+       montado (as telas dele são construídas sob demanda).
+
+    Cada etapa vai para a linha do tempo (linha_do_tempo.py)."""
+
+    def __init__(self):
+        super().__init__()
+
+        self.db = None
+        self._main_app = None
+        self._pintou = False
+
+        # controle de usuário
+        self.usuario_logado = None
+
+        # tela de login — o banco chega depois, em _abrir_banco
+        self.login = LoginScreen(self)
+        self.addWidget(self.login)     # index 0
+
+        # começa no login
+        self.setCurrentIndex(0)
+
+    @property
+    def main_app(self):
+        """MainApp (index 1), montado em _montar_main_app ou, se alguém
+        pedir antes, na hora."""
+        if self._main_app is None:
+            self._main_app = importlib.import_module("main_app_qt").MainApp(self.db, self)
+            self.addWidget(self._main_app)
+        return self._main_app
+
+    def paintEvent(self, evento):
+        super().paintEvent(evento)
+        if not self._pintou:
+            self._pintou = True
+            linha_do_tempo.marcar("primeira_pintura")
+            QTimer.singleShot(0, self._abrir_banco)
+
+    def _abrir_banco(self):
+        # banco (com cache de leitura: voltar a uma tela já vista não
+        # repete as consultas, a menos que algo tenha sido gravado)
+        try:
+            self.db = DatabaseManager(tamanho_cache=512)
+        except Exception as erro:
+            mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
+                           f"Não foi possível abrir o banco de dados:\n{erro}")
+            QApplication.instance().quit()
+            return
+        linha_do_tempo.marcar("banco_aberto")
+
+        self.login.definir_banco(self.db)
+        linha_do_tempo.marcar("interativo")
+        QTimer.singleShot(0, self._montar_main_app)
+
+    def _montar_main_app(self):
+        main_app = self.main_app
+        linha_do_tempo.marcar("main_app")
+        linha_do_tempo.resumir()
+        # a home é a primeira tela depois de qualquer login
+        main_app.telas.pre_construir(["home"])
+
+    def encerrar(self):
+        """Ao sair: espera as consultas em segundo plano e fecha as
+        conexões (o que faz o checkpoint do WAL)."""
+        if self.db is not None:
+            BancoAssincrono.compartilhado(self.db).aguardar()
+            self.db.fechar()
+
+    def resolver_caminho(caminho_relativo):
+        """ Retorna o caminho absoluto para o arquivo, funcionando em modo de desenvolvimento ou no .exe """
+        if hasattr(sys, '_MEIPASS'):
+            return os.path.join(sys._MEIPASS, caminho_relativo)
+        return os.path.join(os.path.abspath("."), caminho_relativo)
+
+
+def executar():
+    """Abre a janela e roda o laço de eventos; devolve o código de saída."""
+    linha_do_tempo.configurar_log(obter_pasta_dados())
+    linha_do_tempo.marcar("importacoes")
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(GLOBAL_STYLESHEET)  # estilo visual global (screens/theme.py)
+
+    window = App()
+    window.resize(1000, 600)
+    window.show()
+    linha_do_tempo.marcar("janela")
+
+    app.aboutToQuit.connect(window.encerrar)
+
+    return app.exec()
@@ -0,0 +1,94 @@
+"""
+linha_do_tempo.py
+==================
+Linha do tempo da inicialização do SISPE e o log de desempenho.
+
+main.py importa este módulo antes de qualquer outro: o instante da
+importação é o "zero" da linha do tempo. Cada etapa da partida chama
+marcar("etapa") e, quando o app fica pronto para uso, resumir() grava uma
+linha só com todas elas, para comparar uma versão com a outra:
+
+    inicializacao: importacoes=180ms janela=260ms primeira_pintura=300ms
+                   banco_aberto=620ms interativo=650ms
+
+O log vai para desempenho.log na pasta de dados do SISPE
+(database.obter_pasta_dados), junto com os outros registros de
+desempenho do logger "sispe" (ex: o custo de construção de cada tela, em
+screens/registro_telas.py). O arquivo é rotativo, para não crescer para
+sempre.
+
+medir_importacoes() mede quanto cada importação da partida custa, rodando
+um Python novo com -X importtime (o comando --tempo-importacao de
+comandos.py mostra o resultado e pode cobrar um orçamento).
+
+Este módulo não conhece o Qt nem o banco.
+"""
+
+import logging
+import os
+import sys
+import time
+
+INICIO = time.perf_counter()
+
+ARQUIVO_LOG = "desempenho.log"
+
+_log = logging.getLogger("sispe.inicio")
+_etapas = []
+
+
+def marcar(etapa):
+    """Registra o instante (em ms desde a partida) em que `etapa` terminou."""
+    ms = (time.perf_counter() - INICIO) * 1000
+    _etapas.append((etapa, ms))
+    _log.debug("%s: %.0f ms", etapa, ms)
+    return ms
+
+
+def etapas():
+    return list(_etapas)
+
+
+def resumir():
+    """Grava no log a linha do tempo inteira, numa linha."""
+    _log.info("inicializacao: %s", " ".join(f"{etapa}={ms:.0f}ms" for etapa, ms in _etapas))
+
+
+def configurar_log(pasta):
+    """Liga o logger "sispe" ao arquivo desempenho.log em `pasta`."""
+    from logging.handlers import RotatingFileHandler
+
+    raiz = logging.getLogger("sispe")
+    raiz.setLevel(logging.INFO)
+    manipulador = RotatingFileHandler(
+        os.path.join(pasta, ARQUIVO_LOG), maxBytes=256 * 1024, backupCount=2, encoding="utf-8"
+    )
+    manipulador.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    raiz.addHandler(manipulador)
+
+
+def medir_importacoes(modulo="janela_qt"):
+    """Importa `modulo` num interpretador novo com -X importtime e devolve
+    [(nome, proprio_ms, acumulado_ms), ...] de cada módulo importado, do
+    mais caro (acumulado) para o mais barato. O item do próprio `modulo`
+    traz o custo total da partida até a janela (procure-o pelo nome).
+
+    Só funciona rodando pelo Python (não no .exe, que não aceita -X)."""
+    import subprocess
+
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=pasta, capture_output=True, text=True, check=True,
+    )
+    medidas = []
+    for linha in processo.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not linha.startswith("import time:"):
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        if not proprio.strip().isdigit():
+            continue  # o cabeçalho
+        medidas.append((nome.strip(), int(proprio) / 1000, int(acumulado) / 1000))
+    medidas.sort(key=lambda medida: -medida[2])
+    return medidas
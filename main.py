@@ -1,47 +1,24 @@
-import sys
-from PyQt6.QtWidgets import QApplication, QStackedWidget
-
-from database import DatabaseManager
-from screens.login_qt import LoginScreen
-from main_app_qt import MainApp
-from screens.theme import GLOBAL_STYLESHEET
-import os
-
-
-class App(QStackedWidget):
-    def __init__(self):
-        super().__init__()
-
-        # banco
-        self.db = DatabaseManager()
+import linha_do_tempo  # primeiro: a importação dele é o "zero" da linha do tempo
 
-        # controle de usuário
-        self.usuario_logado = None
-
-        # telas principais
-        self.login = LoginScreen(self, self.db)
-        self.main_app = MainApp(self.db, self)
-
-        # adiciona no stack
-        self.addWidget(self.login)     # index 0
-        self.addWidget(self.main_app)  # index 1
-
-        # começa no login
-        self.setCurrentIndex(0)
+import multiprocessing
+import sys
 
-    def resolver_caminho(caminho_relativo):
-        """ Retorna o caminho absoluto para o arquivo, funcionando em modo de desenvolvimento ou no .exe """
-        if hasattr(sys, '_MEIPASS'):
-            return os.path.join(sys._MEIPASS, caminho_relativo)
-        return os.path.join(os.path.abspath("."), caminho_relativo)
+# Só o mínimo fica no nível do módulo. Com "spawn", os processos que
+# calculam senhas e desenham prontuários em paralelo
+# (politica_senha.gerar_hashes, prontuario_pdf.exportar_em_paralelo)
+# reexecutam este arquivo como __mp_main__ — tudo o que vem abaixo do
+# `if`, inclusive o Qt (em janela_qt.py), não roda neles.
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyleSheet(GLOBAL_STYLESHEET)  # estilo visual global (screens/theme.py)
+    # no .exe, esses mesmos processos reexecutam o programa — isto os desvia
+    multiprocessing.freeze_support()
 
-    window = App()
-    window.resize(1000, 600)
-    window.show()
+    # comandos de manutenção (ex: --reconstruir-contadores) rodam sem janela
+    import comandos
+    codigo = comandos.executar(sys.argv[1:])
+    if codigo is not None:
+        sys.exit(codigo)
 
-    sys.exit(app.exec())
\ No newline at end of file
+    import janela_qt
+    sys.exit(janela_qt.executar())
\ No newline at end of file
@@ -10,8 +10,13 @@ a = Analysis(
         ('uis', 'uis'),
         ('screens', 'screens'),
         ('icon_SISPE.png', '.'),
+        ('janela_qt.py', '.'),
         ('main_app_qt.py', '.'),
-        ('database.py', '.')
+        ('database.py', '.'),
+        ('comandos.py', '.'),
+        ('politica_senha.py', '.'),
+        ('prontuario_pdf.py', '.'),
+        ('linha_do_tempo.py', '.')
     ],
     hiddenimports=[
         'PyQt6.QtCore',
@@ -21,6 +26,24 @@ a = Analysis(
         'bcrypt',
         'sqlite3',
         'qfluentwidgets',
+        # importados só dentro do `if __name__ == "__main__"` do main.py, ou
+        # sob demanda (importlib) pela janela e pelo MainApp
+        'comandos',
+        'janela_qt',
+        'main_app_qt',
+        'screens.home',
+        'screens.psicologo',
+        'screens.admin',
+        'screens.pai',
+        'screens.vincular',
+        'screens.editar_aluno',
+        'screens.historico_relatorios',
+        'screens.configuracoes',
+        # o reportlab só é importado dentro das funções que geram PDF
+        # (screens/utils.py e screens/exportacao.py)
+        'prontuario_pdf',
+        'reportlab.platypus',
+        'reportlab.pdfgen.canvas',
     ],
     hookspath=[],
     hooksconfig={},
@@ -1,17 +1,30 @@
+import importlib
+
 from PyQt6.QtWidgets import QMainWindow, QSizePolicy
-from screens.home import HomeScreen
-from screens.psicologo import PsicologoScreen
-from screens.admin import AdminScreen
-from screens.pai import PaiScreen
-from screens.vincular import VincularScreen
-from screens.editar_aluno import EditarAlunoScreen
-from screens.historico_relatorios import HistoricoRelatoriosScreen
-from screens.configuracoes import ConfiguracoesScreen
 from screens.efeitos import trocar_tela_com_fade, instalar_hover_crescimento
 from screens.fundo import BackgroundWidget
+from screens.registro_telas import RegistroTelas
+from screens.tabelas import TAMANHO_PREVIA
 from uis.main_ui import Ui_MainWindow
 
 
+# Telas que cada tipo de usuário costuma abrir, adiantadas em tempo ocioso
+# logo depois do login (a home é construída na hora)
+_TELAS_DO_TIPO = {
+    "admin": ["admin", "vincular", "configuracoes"],
+    "psicologo": ["psico", "editar_aluno", "historico", "configuracoes"],
+    "pai": ["pai", "configuracoes"],
+}
+
+# nome da tela principal de cada tipo, recarregada a cada login
+_TELA_PRINCIPAL = {"admin": "admin", "psicologo": "psico", "pai": "pai"}
+
+
+def _fabrica(modulo, classe, *args):
+    """Função que importa `modulo` e constrói `classe`(*args)."""
+    return lambda: getattr(importlib.import_module(modulo), classe)(*args)
+
+
 class MainApp(QMainWindow):  # Herda apenas de QMainWindow
     def __init__(self, db, app):
         super().__init__()
@@ -37,24 +50,22 @@ class MainApp(QMainWindow):  # Herda apenas de QMainWindow
         # O stackedWidget (índice 1) recebe todo o espaço extra
         self.ui.centralwidget.layout().setStretch(1, 1)
 
-        # Telas
-        self.home = HomeScreen(db)
-        self.psico = PsicologoScreen(db, app, self)
-        self.admin = AdminScreen(db)
-        self.pai = PaiScreen(db, app)
-        self.vincular = VincularScreen(db)
-        self.editar_aluno = EditarAlunoScreen(db, self)
-        self.historico = HistoricoRelatoriosScreen(db, self)
-        self.configuracoes = ConfiguracoesScreen(db)
-
-        self.ui.stackedWidget.addWidget(self.home)
-        self.ui.stackedWidget.addWidget(self.psico)
-        self.ui.stackedWidget.addWidget(self.admin)
-        self.ui.stackedWidget.addWidget(self.pai)
-        self.ui.stackedWidget.addWidget(self.vincular)
-        self.ui.stackedWidget.addWidget(self.editar_aluno)
-        self.ui.stackedWidget.addWidget(self.historico)
-        self.ui.stackedWidget.addWidget(self.configuracoes)
+        # Telas — construídas na primeira vez que são usadas (ver
+        # screens/registro_telas.py). O módulo de cada uma também só é
+        # importado nessa hora, para não pesar na abertura do programa.
+        self.telas = RegistroTelas(self.ui.stackedWidget, self)
+        self.telas.registrar("home", _fabrica("screens.home", "HomeScreen", db))
+        self.telas.registrar("psico", _fabrica("screens.psicologo", "PsicologoScreen", db, app, self))
+        self.telas.registrar("admin", _fabrica("screens.admin", "AdminScreen", db))
+        # As duas listas de relatórios têm a mesma coluna "Prévia" (esticada
+        # até a borda da tabela), então recebem o mesmo tamanho de prévia
+        self.telas.registrar("pai", _fabrica("screens.pai", "PaiScreen", db, app, TAMANHO_PREVIA))
+        self.telas.registrar("vincular", _fabrica("screens.vincular", "VincularScreen", db))
+        self.telas.registrar("editar_aluno", _fabrica("screens.editar_aluno", "EditarAlunoScreen", db, self))
+        self.telas.registrar("historico", _fabrica(
+            "screens.historico_relatorios", "HistoricoRelatoriosScreen", db, self, TAMANHO_PREVIA
+        ))
+        self.telas.registrar("configuracoes", _fabrica("screens.configuracoes", "ConfiguracoesScreen", db))
 
         # ---------- Visual: indicador de item ativo + hover animado na barra lateral ----------
         self._botoes_nav = [
@@ -73,6 +84,39 @@ class MainApp(QMainWindow):  # Herda apenas de QMainWindow
         self.ui.bntconfig.clicked.connect(self.abrir_configuracoes)
         self.ui.bntsair.clicked.connect(self.logout)
 
+    # ---------- Telas (construídas sob demanda) ----------
+    @property
+    def home(self):
+        return self.telas.obter("home")
+
+    @property
+    def psico(self):
+        return self.telas.obter("psico")
+
+    @property
+    def admin(self):
+        return self.telas.obter("admin")
+
+    @property
+    def pai(self):
+        return self.telas.obter("pai")
+
+    @property
+    def vincular(self):
+        return self.telas.obter("vincular")
+
+    @property
+    def editar_aluno(self):
+        return self.telas.obter("editar_aluno")
+
+    @property
+    def historico(self):
+        return self.telas.obter("historico")
+
+    @property
+    def configuracoes(self):
+        return self.telas.obter("configuracoes")
+
     # ---------- Visual: navegação com transição suave + indicador ativo ----------
     def _ir_para(self, tela, botao=None):
         """Navegação que troca o widget atual do stackedWidget com fade-in e realça o botão ativo."""
@@ -129,14 +173,19 @@ class MainApp(QMainWindow):  # Herda apenas de QMainWindow
         if tipo == "admin":
             self.ui.btngerenusua.show()
             self.ui.bntvincular.show()
-            self.admin.atualizar()
         elif tipo == "psicologo":
             self.ui.btnRegistrarAluno.show()
-            self.psico.atualizar()
         elif tipo == "pai":
             self.ui.bntMeusFilhos.show()
-            self.pai.atualizar()
+
+        # a tela principal, se já existe (login anterior), é recarregada
+        # para o novo usuário; se não, é construída (e carregada) em tempo
+        # ocioso, junto com as outras que este tipo de usuário usa
+        principal = _TELA_PRINCIPAL.get(tipo)
+        if principal and self.telas.construida(principal):
+            self.telas.obter(principal).atualizar()
         self._ir_para_home()
+        self.telas.pre_construir(_TELAS_DO_TIPO.get(tipo, []))
 
     def logout(self):
         self.app.setCurrentIndex(0)
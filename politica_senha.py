@@ -0,0 +1,147 @@
+"""
+politica_senha.py
+==================
+Política de hash das senhas (bcrypt).
+
+O custo do bcrypt (log2 do número de rodadas) decide quanto tempo leva
+conferir uma senha: cada ponto a mais dobra o tempo. Ele fica gravado no
+banco (tabela parametros, chave CHAVE_CUSTO) para cada instalação poder
+ajustar segurança x espera no login conforme a máquina:
+
+    python main.py --calibrar-senha 250
+
+mede o hash nesta máquina e grava o maior custo que cabe em 250 ms. Quem
+já tem senha com outro custo é atualizado sozinho no próximo login que der
+certo (DatabaseManager.atualizar_hash_se_preciso).
+
+Para muitas senhas de uma vez (importação de usuários), gerar_hashes
+espalha o trabalho por todos os núcleos com um ProcessPoolExecutor —
+quando compensa o custo de abrir os processos; poucas senhas são
+calculadas na própria thread.
+
+Este módulo não conhece o banco nem o Qt — só o bcrypt.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import bcrypt
+
+CHAVE_CUSTO = "senha.custo_bcrypt"
+
+# 12 é o padrão do próprio bcrypt.gensalt(); abaixo de CUSTO_MINIMO a
+# calibração não desce, mesmo numa máquina lenta.
+CUSTO_PADRAO = 12
+CUSTO_MINIMO = 10
+CUSTO_MAXIMO = 16
+
+ALVO_PADRAO_MS = 250
+
+# Quanto custa abrir um processo de trabalho para gerar_hashes: com
+# "spawn", cada um sobe um Python novo e reexecuta o main.py (sem o Qt,
+# que fica em janela_qt.py) — medido ~0,2 s. Com poucas senhas, esperar os
+# processos sai mais caro que calcular tudo na thread que chamou.
+PARTIDA_PROCESSO_S = 0.25
+
+
+def gerar_hash(senha, custo=CUSTO_PADRAO):
+    return bcrypt.hashpw(senha.encode(), bcrypt.gensalt(rounds=custo))
+
+
+def gerar_hashes(senhas, custo=CUSTO_PADRAO, ao_avancar=None, cancelado=None):
+    """Lista com o hash de cada senha, na mesma ordem. ao_avancar(feitos)
+    é chamada a cada hash pronto; se cancelado() ficar True, para e
+    devolve None.
+
+    O primeiro hash é calculado aqui mesmo e serve de medida: se o resto,
+    dividido entre os núcleos, não economiza mais que PARTIDA_PROCESSO_S,
+    abrir processos só custaria tempo e tudo continua aqui. Senão, o resto
+    vai para um processo por núcleo.
+
+    Os processos são criados com "spawn" — o mesmo que no Windows, e o
+    único seguro a partir de uma thread do pool com o Qt já rodando. Por
+    isso o main.py chama multiprocessing.freeze_support()."""
+    senhas = list(senhas)
+    hashes = []
+
+    def _guardar(senha_hash):
+        hashes.append(senha_hash)
+        if ao_avancar is not None:
+            ao_avancar(len(hashes))
+
+    if not senhas:
+        return hashes
+    if cancelado is not None and cancelado():
+        return None
+    inicio = time.perf_counter()
+    _guardar(gerar_hash(senhas[0], custo))
+    segundos = time.perf_counter() - inicio
+
+    resto = senhas[1:]
+    processos = min(len(resto), os.cpu_count() or 1)
+    economia = len(resto) * segundos * (1 - 1 / processos) if processos else 0
+    if processos < 2 or economia <= PARTIDA_PROCESSO_S:
+        for senha in resto:
+            if cancelado is not None and cancelado():
+                return None
+            _guardar(gerar_hash(senha, custo))
+        return hashes
+
+    executor = ProcessPoolExecutor(processos, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        for senha_hash in executor.map(gerar_hash, resto, repeat(custo)):
+            if cancelado is not None and cancelado():
+                return None
+            _guardar(senha_hash)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return hashes
+
+
+def conferir(senha, senha_hash):
+    return bcrypt.checkpw(senha.encode(), senha_hash)
+
+
+def custo_do_hash(senha_hash):
+    """Custo gravado no próprio hash ($2b$<custo>$...), ou None se o hash
+    não estiver no formato do bcrypt."""
+    if isinstance(senha_hash, str):
+        senha_hash = senha_hash.encode()
+    try:
+        return int(senha_hash.split(b"$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def precisa_rehash(senha_hash, custo):
+    return custo_do_hash(senha_hash) != custo
+
+
+def medir(custo, repeticoes=1):
+    """Menor tempo (em segundos) de um hash com este custo nesta máquina."""
+    sal = bcrypt.gensalt(rounds=custo)
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        bcrypt.hashpw(b"calibragem", sal)
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor
+
+
+def calibrar(alvo_ms=ALVO_PADRAO_MS):
+    """Mede os custos a partir de CUSTO_MINIMO e para no primeiro que passa
+    do alvo (o seguinte levaria o dobro). Devolve (custo_escolhido,
+    [(custo, segundos), ...])."""
+    medicoes = []
+    escolhido = CUSTO_MINIMO
+    for custo in range(CUSTO_MINIMO, CUSTO_MAXIMO + 1):
+        segundos = medir(custo, repeticoes=3 if custo < CUSTO_PADRAO else 1)
+        medicoes.append((custo, segundos))
+        if segundos * 1000 > alvo_ms:
+            break
+        escolhido = custo
+    return escolhido, medicoes
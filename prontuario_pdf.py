@@ -0,0 +1,269 @@
+"""
+prontuario_pdf.py
+==================
+Geração dos PDFs de relatório e de prontuário com o reportlab.
+
+Fica fora de screens/ de propósito: este módulo não conhece o banco nem o
+Qt — só o reportlab. Os processos que exportam os prontuários de uma
+turma inteira em paralelo (exportar_em_paralelo) importam isto e, como
+todo processo criado com "spawn", reexecutam o main.py como __mp_main__;
+o main.py deixa o Qt para janela_qt.py, então essa reexecução não traz
+a interface junto (cada processo sobe em ~0,2 s, contra ~0,57 s quando o
+main.py importava o Qt).
+
+    gerar_pdf_prontuario(caminho, aluno, relatorios)   # um aluno, em fluxo
+    exportar_em_paralelo(tarefas, ...)                 # vários, um processo por núcleo
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Frame, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+_AZUL_ESCURO = colors.HexColor("#1e293b")
+_MARGEM_X = 2.5 * cm
+
+
+class ConteudoNaoCabe(Exception):
+    """Um bloco do documento não cabe numa página nem dividido."""
+
+
+# ---------------------------------------------------------------------- #
+# Peças comuns aos dois documentos
+# ---------------------------------------------------------------------- #
+def estilos():
+    """Estilos de parágrafo do SISPE: titulo, label, subtitulo e corpo."""
+    base = getSampleStyleSheet()
+    return {
+        "titulo": ParagraphStyle(
+            "TituloSISPE", parent=base["Title"], fontSize=18, textColor=_AZUL_ESCURO
+        ),
+        "label": ParagraphStyle(
+            "LabelSISPE", parent=base["Normal"], fontSize=10, textColor=colors.HexColor("#64748b")
+        ),
+        "subtitulo": ParagraphStyle(
+            "SubtituloSISPE", parent=base["Heading2"], fontSize=13, textColor=_AZUL_ESCURO
+        ),
+        "corpo": ParagraphStyle(
+            "CorpoSISPE", parent=base["Normal"], fontSize=12, leading=18, textColor=_AZUL_ESCURO
+        ),
+    }
+
+
+def documento(caminho):
+    return SimpleDocTemplate(
+        caminho, pagesize=A4,
+        leftMargin=_MARGEM_X, rightMargin=_MARGEM_X, topMargin=2 * cm, bottomMargin=2 * cm
+    )
+
+
+def tabela_dados(linhas):
+    """Tabela de duas colunas (rótulo, valor) do cabeçalho dos documentos."""
+    tabela = Table(linhas, colWidths=[5 * cm, 10 * cm])
+    tabela.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#f0f4f8")),
+        ("TEXTCOLOR", (0, 0), (0, -1), colors.HexColor("#374151")),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("TOPPADDING", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+        ("LEFTPADDING", (0, 0), (-1, -1), 10),
+    ]))
+    return tabela
+
+
+def paragrafos(texto, estilo):
+    """Um Paragraph (seguido de um respiro) por linha não vazia do texto."""
+    for linha in texto.split("\n"):
+        if linha.strip():
+            seguro = linha.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            yield Paragraph(seguro, estilo)
+            yield Spacer(1, 6)
+
+
+# ---------------------------------------------------------------------- #
+# Prontuário: todo o histórico de um aluno
+# ---------------------------------------------------------------------- #
+def _rodape(canvas, nome, pagina):
+    canvas.saveState()
+    canvas.setFont("Helvetica", 8)
+    canvas.setFillColor(colors.HexColor("#64748b"))
+    canvas.drawString(_MARGEM_X, 1.2 * cm, f"SISPE — Prontuário de {nome}")
+    canvas.drawRightString(A4[0] - _MARGEM_X, 1.2 * cm, f"Página {pagina}")
+    canvas.restoreState()
+
+
+def gerar_pdf_prontuario(caminho, aluno, relatorios, total=None, gerado_em=None,
+                         ao_avancar=None, cancelado=None):
+    """Grava em `caminho` o prontuário do aluno e devolve o caminho (ou
+    None, sem gravar nada, se cancelado() ficar True no meio).
+
+    aluno: dict com 'nome', 'sala', 'serie', 'gravidade' (já para exibição)
+    relatorios: iterável de (texto, data), na ordem em que devem aparecer —
+    pode ser um cursor do banco (DatabaseManager.iterar_relatorios_aluno)
+    total: quantos relatórios são (para o cabeçalho), se `relatorios` não
+    tiver len()
+
+    Em fluxo: em vez de montar a "story" inteira e entregá-la ao
+    SimpleDocTemplate, cada relatório vira parágrafos na hora em que é
+    lido e eles são assentados direto na moldura da página; quando a
+    página enche, ela é fechada no canvas e os parágrafos dela são
+    descartados. O que fica limitado é a entrada: do histórico, só o
+    relatório atual (texto e parágrafos) está na memória. A saída não: o
+    Canvas do reportlab guarda cada página pronta (comprimida, com
+    pageCompression) até o save(), e não há como gravá-las antes. A
+    memória cresce com o número de páginas, ~10 KB por página (medido:
+    374 páginas, pico de 3,7 MB; 1494 páginas, 14,5 MB).
+    ao_avancar(relatorios_feitos, paginas) é chamada a cada relatório
+    assentado.
+
+    O que não cabe no resto da página é dividido (split) linha a linha
+    entre ela e a seguinte; se algo não couber nem numa página em branco,
+    levanta ConteudoNaoCabe e o arquivo não é gravado."""
+    if gerado_em is None:
+        gerado_em = datetime.now()
+    if total is None:
+        total = len(relatorios)
+    e = estilos()
+
+    canvas = Canvas(caminho, pagesize=A4, pageCompression=1)
+    canvas.setTitle(f"Prontuário — {aluno.get('nome', '')}")
+    estado = {"moldura": None, "vazia": True, "paginas": 0}
+
+    def _nova_pagina():
+        estado["moldura"] = Frame(
+            _MARGEM_X, 2 * cm, A4[0] - 2 * _MARGEM_X, A4[1] - 4 * cm,
+            leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0,
+        )
+        estado["vazia"] = True
+
+    def _fechar_pagina():
+        estado["paginas"] += 1
+        _rodape(canvas, aluno.get("nome", ""), estado["paginas"])
+        canvas.showPage()
+
+    def _assentar(flowables):
+        fila = list(flowables)
+        while fila:
+            flowable = fila.pop(0)
+            moldura = estado["moldura"]
+            if moldura.add(flowable, canvas):
+                estado["vazia"] = False
+                continue
+            partes = moldura.split(flowable, canvas)
+            if partes and moldura.add(partes[0], canvas):
+                estado["vazia"] = False
+                fila[:0] = partes[1:]
+                continue
+            if estado["vazia"]:
+                # nem dividido cabe numa página em branco: falha em vez de
+                # deixar parte do prontuário de fora sem ninguém saber
+                raise ConteudoNaoCabe(
+                    f"Um trecho do prontuário de {aluno.get('nome', '')} não cabe numa página."
+                )
+            _fechar_pagina()
+            _nova_pagina()
+            fila.insert(0, flowable)
+
+    _nova_pagina()
+    _assentar([
+        Paragraph("SISPE — Prontuário Clínico", e["titulo"]),
+        Paragraph("Sistema SISPE", e["label"]),
+        Spacer(1, 16),
+        tabela_dados([
+            ["Aluno", aluno.get("nome", "-")],
+            ["Sala", aluno.get("sala", "-")],
+            ["Série", aluno.get("serie", "-")],
+            ["Gravidade", aluno.get("gravidade", "-")],
+            ["Total de registros", str(total)],
+            ["Gerado em", gerado_em.strftime("%d/%m/%Y às %H:%M")],
+        ]),
+        Spacer(1, 20),
+    ])
+    for feitos, (texto, data) in enumerate(relatorios, 1):
+        if cancelado is not None and cancelado():
+            return None
+        _assentar([Paragraph(f"Registro em {data}", e["subtitulo"]), Spacer(1, 4)])
+        _assentar(paragrafos(texto, e["corpo"]))
+        _assentar([Spacer(1, 12)])
+        if ao_avancar is not None:
+            ao_avancar(feitos, estado["paginas"])
+
+    _fechar_pagina()
+    canvas.save()
+    return caminho
+
+
+def exportar_em_paralelo(tarefas, ao_avancar=None, cancelado=None, processos=None):
+    """Gera um prontuário por tarefa, cada uma (caminho, aluno, relatorios),
+    distribuindo-as entre processos (um por núcleo, por padrão). `tarefas`
+    pode ser um gerador: só umas poucas por processo ficam na memória de
+    cada vez, então ler o banco e desenhar os PDFs andam juntos.
+
+    ao_avancar(feitos) é chamada a cada PDF terminado; se cancelado() ficar
+    True, as tarefas que não começaram são descartadas e a função devolve
+    None. Senão devolve (gerados, falhas): a lista dos caminhos gravados e
+    [(caminho, erro), ...] dos que não deu para gravar.
+
+    Como em politica_senha.gerar_hashes, os processos são criados com
+    "spawn" (ver o começo deste arquivo sobre o custo de cada um) e, numa
+    máquina de um núcleo só, tudo roda aqui mesmo."""
+    processos = processos or os.cpu_count() or 1
+    gerados, falhas = [], []
+
+    def _registrar(caminho, erro):
+        if erro is None:
+            gerados.append(caminho)
+        else:
+            falhas.append((caminho, erro))
+        if ao_avancar is not None:
+            ao_avancar(len(gerados) + len(falhas))
+
+    if processos < 2:
+        for caminho, aluno, relatorios in tarefas:
+            if cancelado is not None and cancelado():
+                return None
+            try:
+                gerar_pdf_prontuario(caminho, aluno, relatorios)
+            except (OSError, ConteudoNaoCabe) as erro:
+                _registrar(caminho, erro)
+            else:
+                _registrar(caminho, None)
+        return gerados, falhas
+
+    executor = ProcessPoolExecutor(processos, mp_context=multiprocessing.get_context("spawn"))
+    pendentes = {}
+
+    def _colher(quando):
+        prontos, _ = wait(pendentes, return_when=quando)
+        for futuro in prontos:
+            caminho = pendentes.pop(futuro)
+            erro = futuro.exception()
+            if erro is not None and not isinstance(erro, (OSError, ConteudoNaoCabe)):
+                raise erro
+            _registrar(caminho, erro)
+
+    try:
+        for caminho, aluno, relatorios in tarefas:
+            if cancelado is not None and cancelado():
+                return None
+            pendentes[executor.submit(gerar_pdf_prontuario, caminho, aluno, relatorios)] = caminho
+            # duas tarefas por processo: uma desenhando, outra já na fila
+            if len(pendentes) >= 2 * processos:
+                _colher(FIRST_COMPLETED)
+        while pendentes:
+            if cancelado is not None and cancelado():
+                return None
+            _colher(FIRST_COMPLETED)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return gerados, falhas
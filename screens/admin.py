@@ -9,13 +9,22 @@ validações, filtragem e chamadas ao banco (database.py). Nenhum SQL cru
 fica nesta tela — tudo passa por métodos do DatabaseManager.
 """
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QWidget, QTableWidgetItem, QMessageBox
+import os
 
-from qfluentwidgets import PushButton
+from PyQt6.QtWidgets import QWidget, QMessageBox, QFileDialog
 
 from uis.admin_ui import Ui_AdminScreen
-from screens.utils import mostrar_alerta
+from screens.assincrono import BancoAssincrono, FilaTarefas
+from screens.importacao import (
+    EXTENSOES, ErroImportacao, ImportacaoCancelada, ProgressoImportacao, importar_usuarios,
+)
+from screens.tabelas import ModeloPaginado, indicar_carregamento
+from screens.utils import BuscaAdiada, mostrar_alerta
+
+
+def _contar_usuarios(db):
+    """As três contagens do cartão de informações, numa ida só ao pool."""
+    return db.contar_usuarios(), db.contar_usuarios_por_tipo("pai"), db.contar_usuarios_por_tipo("psicologo")
 
 
 class AdminScreen(QWidget):
@@ -26,8 +35,24 @@ class AdminScreen(QWidget):
         self.ui = Ui_AdminScreen()
         self.ui.setupUi(self)
 
-        self.ui.inputBusca.textChanged.connect(self.carregar_usuarios)
+        self.modelo = ModeloPaginado([
+            ("Username", lambda u: u[1]),
+            ("Tipo", lambda u: u[2]),
+            ("Ações", None),
+        ], parent=self, assincrono=BancoAssincrono.compartilhado(db))
+        self.ui.tabelaUsuarios.setModel(self.modelo)
+        self.ui.ajustar_colunas_usuarios()
+        indicar_carregamento(self.ui.tabelaUsuarios, self.modelo)
+        self.ui.delegateExcluir.clicado.connect(lambda row: self.excluir(self.modelo.linha(row)[0]))
+
+        self.busca = BuscaAdiada(self.ui.inputBusca, self.carregar_usuarios)
         self.ui.btnCriarUsuario.clicked.connect(self.criar_usuario)
+        self.ui.btnImportarUsuarios.clicked.connect(self.importar_planilha)
+        self.ui.btnCancelarImportacao.clicked.connect(self.cancelar_importacao)
+        self._progresso_importacao = None
+        # o bcrypt da importação leva segundos: fila própria, fora das
+        # threads das consultas (BancoAssincrono)
+        self.fila_importacao = FilaTarefas(parent=self)
 
         self.atualizar()
 
@@ -35,14 +60,18 @@ class AdminScreen(QWidget):
     # API pública — chamada por main_app_qt.py
     # ------------------------------------------------------------------ #
     def atualizar(self):
-        self.carregar_usuarios()
+        self.busca.disparar_agora()
         self.atualizar_info()
 
     # ------------------------------------------------------------------ #
     def atualizar_info(self):
-        total = self.db.contar_usuarios()
-        pais = self.db.contar_usuarios_por_tipo("pai")
-        psico = self.db.contar_usuarios_por_tipo("psicologo")
+        self.ui.labelInfo.setText("📊 Total: … | 👨‍👩‍👧 Responsáveis: … | 🧠 Psicólogos: …")
+        BancoAssincrono.compartilhado(self.db).chamar(
+            "admin.info", _contar_usuarios, self.db, ao_concluir=self._mostrar_info,
+        )
+
+    def _mostrar_info(self, contagens):
+        total, pais, psico = contagens
         self.ui.labelInfo.setText(f"📊 Total: {total} | 👨‍👩‍👧 Responsáveis: {pais} | 🧠 Psicólogos: {psico}")
 
     def criar_usuario(self):
@@ -68,23 +97,86 @@ class AdminScreen(QWidget):
         self.ui.inputSenha.clear()
         self.atualizar()
 
-    def carregar_usuarios(self):
-        texto = self.ui.inputBusca.text().strip().lower()
-        usuarios = self.db.listar_usuarios()
-        if texto:
-            usuarios = [u for u in usuarios if texto in u[1].lower()]
+    def importar_planilha(self):
+        """Criação de contas em massa a partir de um .csv/.xlsx (ver
+        importar_usuarios em screens/importacao.py). As senhas são
+        calculadas em paralelo, em segundo plano."""
+        caminho, _ = QFileDialog.getOpenFileName(
+            self, "Importar usuários", "", f"Planilhas ({' '.join(EXTENSOES)})"
+        )
+        if not caminho:
+            return
 
-        tabela = self.ui.tabelaUsuarios
-        tabela.setRowCount(len(usuarios))
-        for i, (id_, user, tipo) in enumerate(usuarios):
-            tabela.setItem(i, 0, QTableWidgetItem(user))
-            tabela.setItem(i, 1, QTableWidgetItem(tipo))
+        self._progresso_importacao = ProgressoImportacao(self)
+        self._progresso_importacao.avancou.connect(self.ui.barraImportacao.setValue)
+
+        self.ui.barraImportacao.setValue(0)
+        self.ui.labelImportacao.setText(f"Importando {os.path.basename(caminho)}...")
+        self.ui.frameImportacao.setVisible(True)
+        self.ui.btnImportarUsuarios.setEnabled(False)
+
+        self.fila_importacao.enfileirar(
+            importar_usuarios, self.db, caminho, self._progresso_importacao,
+            ao_concluir=self._importacao_concluida, ao_falhar=self._importacao_falhou,
+        )
+
+    def cancelar_importacao(self):
+        if self._progresso_importacao is not None:
+            self._progresso_importacao.cancelar()
+            self.ui.labelImportacao.setText("Cancelando...")
+
+    def _encerrar_importacao(self):
+        self.ui.frameImportacao.setVisible(False)
+        self.ui.btnImportarUsuarios.setEnabled(True)
+        if self._progresso_importacao is not None:
+            self._progresso_importacao.deleteLater()
+            self._progresso_importacao = None
+
+    def _importacao_concluida(self, resultado):
+        self._encerrar_importacao()
+        self.atualizar()
 
-            btn_excluir = PushButton("Excluir")
-            btn_excluir.clicked.connect(lambda checked, uid=id_: self.excluir(uid))
-            tabela.setCellWidget(i, 2, btn_excluir)
+        if not (resultado.erros or resultado.duplicados):
+            mostrar_alerta(self, QMessageBox.Icon.Information, "Importação concluída", resultado.resumo())
+            return
 
-            tabela.item(i, 0).setData(Qt.ItemDataRole.UserRole, id_)
+        texto = resultado.resumo()
+        if resultado.erros:
+            texto += "\n\n" + "\n".join(f"Linha {linha}: {motivo}" for linha, motivo in resultado.erros[:5])
+            if len(resultado.erros) > 5:
+                texto += "\n..."
+        texto += "\n\nDeseja salvar a lista completa das linhas ignoradas?"
+
+        botoes = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        resposta = mostrar_alerta(self, QMessageBox.Icon.Warning, "Importação concluída", texto, botoes)
+        if resposta != QMessageBox.StandardButton.Yes:
+            return
+
+        caminho, _ = QFileDialog.getSaveFileName(
+            self, "Salvar linhas ignoradas", "importacao_usuarios_ignorados.csv", "CSV (*.csv)"
+        )
+        if caminho:
+            resultado.salvar_relatorio(caminho)
+
+    def _importacao_falhou(self, erro):
+        self._encerrar_importacao()
+        if isinstance(erro, ImportacaoCancelada):
+            mostrar_alerta(self, QMessageBox.Icon.Information, "Importação cancelada",
+                           "Nenhum usuário foi criado.")
+        elif isinstance(erro, ErroImportacao):
+            mostrar_alerta(self, QMessageBox.Icon.Warning, "Erro", str(erro))
+        else:
+            mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
+                           f"Não foi possível importar a planilha:\n{erro}")
+
+    def carregar_usuarios(self, texto, geracao):
+        """Chamada pela BuscaAdiada quando o usuário para de digitar.
+        A tabela busca as linhas em páginas, conforme rola."""
+        if not self.busca.eh_atual(geracao):
+            return
+        self.modelo.recarregar(
+            lambda cursor, tamanho: self.db.listar_usuarios_pagina(tamanho, cursor, busca=texto)
+        )
 
     def excluir(self, user_id):
         botoes = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
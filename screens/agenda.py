@@ -0,0 +1,119 @@
+"""
+screens/agenda.py
+==================
+Cache em memória da agenda do psicólogo, por mês, para o calendário de
+screens/configuracoes.py.
+
+Em vez de uma consulta por clique num dia (e outra trazendo todas as datas
+com compromisso de todo o histórico), a agenda guarda uma "janela" de três
+meses — o visível e os vizinhos — cada um lido com uma única consulta de
+faixa (DatabaseManager.compromissos_no_intervalo) e guardado num dict
+data -> compromissos. O mês visível é pedido primeiro; os vizinhos vêm
+logo depois, em segundo plano, para trocar de mês no calendário já
+encontrar tudo pronto. Clicar num dia não vai ao banco.
+
+Depois de uma gravação, recarregar() relê só os meses da janela.
+"""
+
+import calendar
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+def meses_vizinhos(ano, mes):
+    """(ano, mes) do mês anterior, do próprio e do seguinte."""
+    anterior = (ano - 1, 12) if mes == 1 else (ano, mes - 1)
+    seguinte = (ano + 1, 1) if mes == 12 else (ano, mes + 1)
+    return [anterior, (ano, mes), seguinte]
+
+
+def intervalo_do_mes(ano, mes):
+    """Primeiro e último dia do mês, em ISO."""
+    ultimo = calendar.monthrange(ano, mes)[1]
+    return f"{ano:04d}-{mes:02d}-01", f"{ano:04d}-{mes:02d}-{ultimo:02d}"
+
+
+class AgendaMensal(QObject):
+    """Compromissos de um psicólogo, mês a mês, lidos pelo BancoAssincrono.
+
+    mesCarregado(ano, mes) avisa a tela quando um mês chega do banco."""
+
+    mesCarregado = pyqtSignal(int, int)
+
+    def __init__(self, banco, parent=None):
+        super().__init__(parent)
+        self.banco = banco
+        self._psicologo_id = None
+        self._janela = []
+        self._meses = {}  # (ano, mes) -> {data_iso: [(id, titulo, hora, cor, descricao), ...]}
+        self._geracao = 0
+
+    # ------------------------------------------------------------------ #
+    def definir_psicologo(self, psicologo_id):
+        """Troca de usuário: esquece tudo o que estava em memória."""
+        if psicologo_id != self._psicologo_id:
+            self._psicologo_id = psicologo_id
+            self._descartar(self._janela)
+            self._janela = []
+
+    def mostrar_mes(self, ano, mes):
+        """Move a janela para (ano, mes): o que saiu dela é descartado e o
+        que ainda falta é pedido ao banco, o mês visível primeiro."""
+        janela = meses_vizinhos(ano, mes)
+        self._descartar([m for m in self._janela if m not in janela])
+        self._janela = janela
+
+        for chave in [(ano, mes)] + [m for m in janela if m != (ano, mes)]:
+            if chave not in self._meses:
+                self._buscar(chave)
+
+    def recarregar(self):
+        """Relê os meses da janela (depois de criar/editar/excluir)."""
+        self._geracao += 1
+        self._meses.clear()
+        ano, mes = self._janela[1] if self._janela else (None, None)
+        if ano is not None:
+            self.mostrar_mes(ano, mes)
+
+    # ------------------------------------------------------------------ #
+    def compromissos_do_dia(self, data_iso):
+        """Compromissos do dia (ordenados por hora), ou None se o mês dele
+        ainda não chegou do banco."""
+        ano, mes = int(data_iso[:4]), int(data_iso[5:7])
+        dias = self._meses.get((ano, mes))
+        if dias is None:
+            return None
+        return dias.get(data_iso, [])
+
+    def datas_com_compromissos(self):
+        """Todas as datas com compromisso nos meses já carregados."""
+        return {data for dias in self._meses.values() for data in dias}
+
+    # ------------------------------------------------------------------ #
+    def _chave(self, ano, mes):
+        return f"configuracoes.agenda.{ano:04d}-{mes:02d}"
+
+    def _descartar(self, meses):
+        for ano, mes in meses:
+            self.banco.cancelar(self._chave(ano, mes))
+            self._meses.pop((ano, mes), None)
+
+    def _buscar(self, chave):
+        ano, mes = chave
+        inicio, fim = intervalo_do_mes(ano, mes)
+        psicologo_id, geracao = self._psicologo_id, self._geracao
+
+        def _guardar(linhas):
+            # resposta de outro usuário ou de antes de um recarregar(): ignora
+            if psicologo_id != self._psicologo_id or geracao != self._geracao or chave not in self._janela:
+                return
+            dias = {}
+            for id_, titulo, data, hora, cor, descricao in linhas:
+                dias.setdefault(data, []).append((id_, titulo, hora, cor, descricao))
+            self._meses[chave] = dias
+            self.mesCarregado.emit(ano, mes)
+
+        self.banco.chamar(
+            self._chave(ano, mes), "compromissos_no_intervalo", psicologo_id, inicio, fim,
+            ao_concluir=_guardar,
+        )
@@ -0,0 +1,224 @@
+"""
+screens/assincrono.py
+======================
+Acesso ao banco fora da thread da interface.
+
+BancoAssincrono roda os métodos do DatabaseManager num QThreadPool próprio
+e entrega o resultado de volta na thread da interface, por callback. Cada
+chamada leva uma "chave" (ex: "agenda", "relatorios_pai"): uma chamada nova
+com a mesma chave substitui a anterior — se a antiga ainda não começou, nem
+roda; se já estava rodando, o resultado dela é descartado. Assim uma tela
+que dispara várias consultas seguidas (trocar de dia no calendário, clicar
+em vários filhos) só aplica a última.
+
+As consultas em si continuam em database.py; cada thread do pool usa a sua
+própria conexão (ver DatabaseManager.conn).
+
+FilaTarefas é o mesmo mecanismo para trabalhos que não são consultas (ex:
+gerar um PDF): cada tarefa enfileirada roda, na ordem, sem substituir as
+anteriores.
+"""
+
+import sys
+import threading
+import traceback
+import weakref
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class Pedido:
+    """Uma chamada agendada no BancoAssincrono (o "future" dela).
+
+    resultado/erro só ficam preenchidos depois de concluido=True. Cancelar
+    um pedido impede o callback de ser chamado — e, se ele ainda estiver
+    na fila, impede a consulta de rodar."""
+
+    def __init__(self, chave):
+        self.chave = chave
+        self.cancelado = False
+        self.concluido = False
+        self.resultado = None
+        self.erro = None
+
+    def cancelar(self):
+        self.cancelado = True
+
+
+class _Sinais(QObject):
+    # emitido da thread do pool; como o objeto vive na thread da interface,
+    # o Qt entrega o sinal lá (conexão enfileirada)
+    terminou = pyqtSignal(object, object, object)  # pedido, resultado, erro
+
+
+class _Tarefa(QRunnable):
+    def __init__(self, pedido, funcao, args, kwargs, sinais):
+        super().__init__()
+        self._pedido = pedido
+        self._funcao = funcao
+        self._args = args
+        self._kwargs = kwargs
+        self._sinais = sinais
+
+    def run(self):
+        if self._pedido.cancelado:
+            return
+        resultado, erro = None, None
+        try:
+            resultado = self._funcao(*self._args, **self._kwargs)
+        except Exception as e:
+            erro = e
+        self._sinais.terminou.emit(self._pedido, resultado, erro)
+
+
+class BancoAssincrono(QObject):
+    """Fachada assíncrona sobre o DatabaseManager.
+
+    Uso típico numa tela:
+
+        self.banco = BancoAssincrono.compartilhado(db)
+        self.banco.chamar("configuracoes.agenda", "compromissos_por_data",
+                          uid, data, ao_concluir=self._mostrar_agenda)
+
+    metodo pode ser o nome de um método do DatabaseManager ou qualquer
+    função (útil para juntar várias consultas numa só ida ao pool).
+    ao_concluir(resultado) e ao_falhar(erro) rodam na thread da interface.
+    """
+
+    # Threads do pool. Duas bastam: o SQLite serializa a gravação e as
+    # leituras das telas são curtas; o objetivo é não travar a interface.
+    MAX_THREADS = 2
+
+    _compartilhados = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def compartilhado(cls, db):
+        """Instância única por DatabaseManager, usada por todas as telas
+        (um pool só, em vez de um por tela). Como as chaves são globais,
+        cada tela prefixa as suas (ex: "home.estatisticas")."""
+        banco = cls._compartilhados.get(db)
+        if banco is None:
+            banco = cls._compartilhados[db] = cls(db)
+        return banco
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(self.MAX_THREADS)
+        # threads que não expiram = conexões que não precisam ser reabertas
+        self._pool.setExpiryTimeout(-1)
+        self._sinais = _Sinais(self)
+        self._sinais.terminou.connect(self._ao_terminar)
+        self._atuais = {}
+        self._callbacks = {}
+        self._trava = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    def chamar(self, chave, metodo, *args, ao_concluir=None, ao_falhar=None, **kwargs):
+        """Agenda metodo(*args, **kwargs) no pool, cancelando o pedido
+        anterior com a mesma chave. Devolve o Pedido."""
+        funcao = getattr(self.db, metodo) if isinstance(metodo, str) else metodo
+
+        pedido = Pedido(chave)
+        with self._trava:
+            anterior = self._atuais.get(chave)
+            if anterior is not None:
+                anterior.cancelar()
+                self._callbacks.pop(anterior, None)
+            self._atuais[chave] = pedido
+            self._callbacks[pedido] = (ao_concluir, ao_falhar)
+
+        self._pool.start(_Tarefa(pedido, funcao, args, kwargs, self._sinais))
+        return pedido
+
+    def cancelar(self, chave):
+        """Cancela o pedido pendente com esta chave, se houver."""
+        with self._trava:
+            pedido = self._atuais.pop(chave, None)
+            if pedido is not None:
+                pedido.cancelar()
+                self._callbacks.pop(pedido, None)
+
+    def ocupado(self, chave):
+        """True se ainda há um pedido com esta chave esperando resultado."""
+        with self._trava:
+            return chave in self._atuais
+
+    def aguardar(self, timeout_ms=-1):
+        """Bloqueia até o pool esvaziar (ao fechar o app). Os callbacks
+        pendentes só rodam quando o loop de eventos voltar a girar."""
+        return self._pool.waitForDone(timeout_ms)
+
+    # ------------------------------------------------------------------ #
+    def _ao_terminar(self, pedido, resultado, erro):
+        with self._trava:
+            callbacks = self._callbacks.pop(pedido, None)
+            if self._atuais.get(pedido.chave) is pedido:
+                del self._atuais[pedido.chave]
+
+        pedido.resultado, pedido.erro, pedido.concluido = resultado, erro, True
+        if pedido.cancelado or callbacks is None:
+            return
+
+        ao_concluir, ao_falhar = callbacks
+        if erro is not None:
+            if ao_falhar is not None:
+                ao_falhar(erro)
+            else:
+                traceback.print_exception(type(erro), erro, erro.__traceback__, file=sys.stderr)
+        elif ao_concluir is not None:
+            ao_concluir(resultado)
+
+
+class FilaTarefas(QObject):
+    """Fila de trabalhos demorados em segundo plano, num pool próprio (para
+    não ocupar as threads das consultas). Ao contrário do BancoAssincrono,
+    nada é cancelado por chave: cada tarefa enfileirada roda, em ordem.
+
+        fila.enfileirar(gerar_pdf, caminho, html,
+                        ao_concluir=..., ao_falhar=...)
+
+    pendentesMudou(n) avisa quantas tarefas ainda faltam terminar."""
+
+    pendentesMudou = pyqtSignal(int)
+
+    def __init__(self, max_threads=1, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        # como no BancoAssincrono: a conexão de cada thread fica no
+        # DatabaseManager (por ident) até fechar(); uma thread que expirasse
+        # deixaria a conexão aberta lá e o ident poderia ser reaproveitado
+        self._pool.setExpiryTimeout(-1)
+        self._sinais = _Sinais(self)
+        self._sinais.terminou.connect(self._ao_terminar)
+        self._callbacks = {}
+
+    def enfileirar(self, funcao, *args, ao_concluir=None, ao_falhar=None, **kwargs):
+        """Agenda funcao(*args, **kwargs); ao_concluir(resultado) e
+        ao_falhar(erro) rodam na thread da interface. Devolve o Pedido."""
+        pedido = Pedido(getattr(funcao, "__name__", "tarefa"))
+        self._callbacks[pedido] = (ao_concluir, ao_falhar)
+        self._pool.start(_Tarefa(pedido, funcao, args, kwargs, self._sinais))
+        self.pendentesMudou.emit(len(self._callbacks))
+        return pedido
+
+    def pendentes(self):
+        return len(self._callbacks)
+
+    def aguardar(self, timeout_ms=-1):
+        return self._pool.waitForDone(timeout_ms)
+
+    def _ao_terminar(self, pedido, resultado, erro):
+        ao_concluir, ao_falhar = self._callbacks.pop(pedido, (None, None))
+        pedido.resultado, pedido.erro, pedido.concluido = resultado, erro, True
+        self.pendentesMudou.emit(len(self._callbacks))
+
+        if erro is not None:
+            if ao_falhar is not None:
+                ao_falhar(erro)
+            else:
+                traceback.print_exception(type(erro), erro, erro.__traceback__, file=sys.stderr)
+        elif ao_concluir is not None:
+            ao_concluir(resultado)
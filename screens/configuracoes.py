@@ -7,19 +7,28 @@ lista de filhos do responsável).
 Este arquivo NÃO constrói nenhum widget diretamente — toda a interface
 visual vive em uis/configuracoes_ui.py (classe Ui_ConfiguracoesScreen). Aqui
 só ficam: conexões de sinal, montagem dos cards dinâmicos de compromisso e
-chamadas ao banco (database.py).
+chamadas ao banco (database.py). As leituras rodam em segundo plano
+(BancoAssincrono); as gravações continuam diretas.
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QListWidgetItem, QMessageBox, QFrame, QLabel,
-    QHBoxLayout, QVBoxLayout, QPushButton, QRadioButton,
+    QWidget, QListWidgetItem, QMessageBox, QRadioButton,
 )
 from PyQt6.QtCore import QDate, QLocale, QTime
 from PyQt6.QtGui import QTextCharFormat, QColor
 
 from uis.configuracoes_ui import Ui_ConfiguracoesScreen
+from screens.agenda import AgendaMensal
+from screens.assincrono import BancoAssincrono
 from screens.utils import mostrar_alerta
 
+# Formato das datas dos compromissos no banco (ISO — ver database.py)
+_FORMATO_DATA = "yyyy-MM-dd"
+
+# Um dia com muitos compromissos preenche os cards aos poucos, conforme a
+# lista rola, em vez de todos de uma vez
+_CARDS_POR_VEZ = 15
+
 # Paleta de cores disponíveis para marcar um compromisso
 _CORES_COMPROMISSO = [
     ("#5B84A6", "Azul"),
@@ -34,10 +43,14 @@ class ConfiguracoesScreen(QWidget):
     def __init__(self, db):
         super().__init__()
         self.db = db
+        self.banco = BancoAssincrono.compartilhado(db)
         self.usuario = None
         self.editando_compromisso = None
         self.cor_selecionada = _CORES_COMPROMISSO[0][0]
         self._datas_marcadas = set()
+        # compromissos do mês visível e dos vizinhos (screens/agenda.py)
+        self.agenda = AgendaMensal(self.banco, self)
+        self.agenda.mesCarregado.connect(self._mes_carregado)
 
         self.ui = Ui_ConfiguracoesScreen()
         self.ui.setupUi(self)
@@ -47,8 +60,17 @@ class ConfiguracoesScreen(QWidget):
         self.ui.calendarAgenda.setLocale(locale)
 
         self._construir_seletor_de_cores()
+        self.ui.definir_cores_compromisso([cor for cor, _nome in _CORES_COMPROMISSO])
+        self._cards = []
+        self._compromissos_dia = []
+        self._cards_preenchidos = 0
+        barra = self.ui.scrollCompromissos.verticalScrollBar()
+        barra.valueChanged.connect(self._rolou_compromissos)
+        # cards que ainda não enchem a área visível: preenche mais
+        barra.rangeChanged.connect(lambda *_: self._rolou_compromissos(barra.value()))
 
         self.ui.calendarAgenda.selectionChanged.connect(self.carregar_agenda)
+        self.ui.calendarAgenda.currentPageChanged.connect(self._trocar_mes)
         self.ui.frameNovoCompromisso.hide()
         self.ui.btnNovoCompromisso.clicked.connect(lambda: self.ui.frameNovoCompromisso.show())
         self.ui.btnSalvarCompromisso.clicked.connect(self.adicionar_compromisso)
@@ -79,39 +101,39 @@ class ConfiguracoesScreen(QWidget):
     def _mudar_cor_ativa(self, cor_hex):
         self.cor_selecionada = cor_hex
 
-    def criar_card(self, id_, titulo, hora, cor, descricao):
-        card = QFrame()
-        card.setStyleSheet(f"QFrame {{ background: #FFFFFF; border-left: 8px solid {cor}; border-radius: 10px; }}")
-
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(16, 12, 16, 12)
-        layout.setSpacing(4)
-
-        lblHora = QLabel(hora)
-        lblHora.setStyleSheet("color: #5B7285; font-size: 12px; font-weight: 600;")
-        lblTitulo = QLabel(titulo)
-        lblTitulo.setStyleSheet("font-size: 15px; font-weight: bold; color: #2E3A46;")
-        lblDescricao = QLabel(descricao)
-        lblDescricao.setStyleSheet("color: #7C93A3; font-size: 13px;")
-
-        layout.addWidget(lblHora)
-        layout.addWidget(lblTitulo)
-        layout.addWidget(lblDescricao)
-
-        botoes = QHBoxLayout()
-        botoes.setContentsMargins(0, 8, 0, 0)
-        editar = QPushButton("Editar")
-        excluir = QPushButton("Excluir")
-        estilo_bnt = "padding: 4px 12px; min-height: 28px; font-size: 12px;"
-        editar.setStyleSheet(estilo_bnt)
-        excluir.setStyleSheet(estilo_bnt)
-        excluir.clicked.connect(lambda: self.excluir_compromisso(id_))
-        editar.clicked.connect(lambda id_=id_, t=titulo, h=hora, d=descricao: self.editar_compromisso(id_, t, h, d))
-        botoes.addStretch()
-        botoes.addWidget(editar)
-        botoes.addWidget(excluir)
-        layout.addLayout(botoes)
-        return card
+    # ---------- Cards de compromisso (reaproveitados entre os dias) ----------
+    def _card(self, indice):
+        """O card da posição `indice` da lista, criado só na primeira vez
+        que um dia precisa de tantos cards. Os botões são ligados uma vez
+        e leem o compromisso daquela posição na hora do clique."""
+        while len(self._cards) <= indice:
+            i = len(self._cards)
+            card = self.ui.criar_card_compromisso()
+            card.btnExcluir.clicked.connect(
+                lambda _=False, i=i: self.excluir_compromisso(self._compromissos_dia[i][0]))
+            card.btnEditar.clicked.connect(
+                lambda _=False, i=i: self.editar_compromisso(*self._dados_para_editar(i)))
+            self._cards.append(card)
+        return self._cards[indice]
+
+    def _dados_para_editar(self, indice):
+        id_, titulo, hora, _cor, descricao = self._compromissos_dia[indice]
+        return id_, titulo, hora, descricao
+
+    def _preencher_cards(self, ate):
+        """Preenche os cards até a posição `ate` (exclusive)."""
+        ate = min(ate, len(self._compromissos_dia))
+        for i in range(self._cards_preenchidos, ate):
+            _id, titulo, hora, cor, descricao = self._compromissos_dia[i]
+            card = self._card(i)
+            card.preencher(titulo, hora, cor, descricao)
+            card.setVisible(True)
+        self._cards_preenchidos = max(self._cards_preenchidos, ate)
+
+    def _rolou_compromissos(self, valor):
+        barra = self.ui.scrollCompromissos.verticalScrollBar()
+        if valor >= barra.maximum() - 200 and self._cards_preenchidos < len(self._compromissos_dia):
+            self._preencher_cards(self._cards_preenchidos + _CARDS_POR_VEZ)
 
     # ------------------------------------------------------------------ #
     # API pública — chamada por main_app_qt.py
@@ -124,7 +146,12 @@ class ConfiguracoesScreen(QWidget):
 
     # ------------------------------------------------------------------ #
     def carregar_perfil(self):
-        dados = self.db.obter_usuario(self.usuario["id"])
+        self.banco.chamar(
+            "configuracoes.perfil", "obter_usuario", self.usuario["id"],
+            ao_concluir=self._mostrar_perfil,
+        )
+
+    def _mostrar_perfil(self, dados):
         self.ui.labelUsername.setText(dados["username"])
         self.ui.labelTipo.setText(dados["tipo"].capitalize())
         self.ui.labelDataCriacao.setText(f"Membro desde {dados['data_criacao']}")
@@ -139,7 +166,8 @@ class ConfiguracoesScreen(QWidget):
             self._carregar_filhos()
         elif tipo == "psicologo":
             self.ui.frameFilhos.hide()
-            self._datas_marcadas = set()
+            self.agenda.definir_psicologo(self.usuario["id"])
+            self._trocar_mes(self.ui.calendarAgenda.yearShown(), self.ui.calendarAgenda.monthShown())
             self.carregar_agenda()
         else:
             self.ui.frameAgenda.hide()
@@ -147,14 +175,36 @@ class ConfiguracoesScreen(QWidget):
 
     def _carregar_filhos(self):
         self.ui.listaFilhos.clear()
-        for _id, nome, _sala, _serie in self.db.alunos_do_pai(self.usuario["id"]):
+        self.banco.chamar(
+            "configuracoes.filhos", "alunos_do_pai", self.usuario["id"],
+            ao_concluir=self._mostrar_filhos,
+        )
+
+    def _mostrar_filhos(self, filhos):
+        self.ui.listaFilhos.clear()
+        for _id, nome, _sala, _serie in filhos:
             self.ui.listaFilhos.addItem(QListWidgetItem(nome))
 
+    def _trocar_mes(self, ano, mes):
+        """O calendário mudou de mês: a agenda busca o que faltar da nova
+        janela e as marcações dos meses que saíram dela somem."""
+        self.agenda.mostrar_mes(ano, mes)
+        self.atualizar_calendario()
+
+    def _mes_carregado(self, ano, mes):
+        self.atualizar_calendario()
+        selecionada = self.ui.calendarAgenda.selectedDate()
+        if (selecionada.year(), selecionada.month()) == (ano, mes):
+            self.carregar_agenda()
+
     def atualizar_calendario(self):
+        self._marcar_datas(self.agenda.datas_com_compromissos())
+
+    def _marcar_datas(self, datas):
         """Marca no calendário os dias com compromisso. Só toca nas datas
         que realmente mudaram (comparando com a última marcação), em vez de
         varrer um intervalo fixo de 100 anos a cada atualização."""
-        novas_datas = set(self.db.datas_com_compromissos(self.usuario["id"]))
+        novas_datas = set(datas)
 
         formato_vazio = QTextCharFormat()
         for data_str in self._datas_marcadas - novas_datas:
@@ -174,31 +224,44 @@ class ConfiguracoesScreen(QWidget):
 
     @staticmethod
     def _parse_data(data_str):
-        try:
-            dia, mes, ano = map(int, data_str.split("/"))
-            return QDate(ano, mes, dia)
-        except Exception:
-            return None
+        data = QDate.fromString(data_str or "", _FORMATO_DATA)
+        return data if data.isValid() else None
 
     def carregar_agenda(self):
+        """Mostra os compromissos do dia selecionado — direto da agenda em
+        memória; se o mês ainda não chegou, _mes_carregado mostra depois."""
         locale = QLocale(QLocale.Language.Portuguese, QLocale.Country.Brazil)
-        data = self.ui.calendarAgenda.selectedDate().toString("dd/MM/yyyy")
+        data = self.ui.calendarAgenda.selectedDate().toString(_FORMATO_DATA)
         self.ui.labelDia.setText(
             locale.toString(self.ui.calendarAgenda.selectedDate(), "dddd, dd 'de' MMMM 'de' yyyy")
         )
 
-        compromissos = self.db.compromissos_por_data(self.usuario["id"], data)
-
-        while self.ui.layoutCompromissos.count():
-            item = self.ui.layoutCompromissos.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        for id_, titulo, hora, cor, descricao in compromissos:
-            self.ui.layoutCompromissos.addWidget(self.criar_card(id_, titulo, hora, cor, descricao))
+        compromissos = self.agenda.compromissos_do_dia(data)
+        if compromissos is not None:
+            self._mostrar_compromissos(compromissos)
+            return
 
-        self.ui.layoutCompromissos.addStretch()
-        self.atualizar_calendario()
+        self._limpar_compromissos()
+        self.ui.labelCarregandoCompromissos.setVisible(True)
+
+    def _limpar_compromissos(self):
+        """Esconde os cards (sem destruí-los — o próximo dia reaproveita)."""
+        for card in self._cards[:self._cards_preenchidos]:
+            card.setVisible(False)
+        self._compromissos_dia = []
+        self._cards_preenchidos = 0
+
+    def _mostrar_compromissos(self, compromissos):
+        """Reaproveita os cards já visíveis trocando só os dados; os que
+        sobram do dia anterior são escondidos."""
+        self.ui.labelCarregandoCompromissos.setVisible(False)
+        anteriores = self._cards_preenchidos
+        self._compromissos_dia = compromissos
+        self._cards_preenchidos = 0
+        self.ui.scrollCompromissos.verticalScrollBar().setValue(0)
+        self._preencher_cards(_CARDS_POR_VEZ)
+        for card in self._cards[self._cards_preenchidos:anteriores]:
+            card.setVisible(False)
 
     def adicionar_compromisso(self):
         titulo = self.ui.inputTitulo.text().strip()
@@ -206,7 +269,7 @@ class ConfiguracoesScreen(QWidget):
             mostrar_alerta(self, QMessageBox.Icon.Warning, "Erro", "Informe um título.")
             return
 
-        data = self.ui.calendarAgenda.selectedDate().toString("dd/MM/yyyy")
+        data = self.ui.calendarAgenda.selectedDate().toString(_FORMATO_DATA)
         hora = self.ui.inputHora.time().toString("HH:mm")
         descricao = self.ui.inputDescricao.text().strip()
         cor = self.cor_selecionada
@@ -221,6 +284,7 @@ class ConfiguracoesScreen(QWidget):
         self.ui.inputTitulo.clear()
         self.ui.inputDescricao.clear()
         self.ui.frameNovoCompromisso.hide()
+        self.agenda.recarregar()
         self.carregar_agenda()
 
     def excluir_compromisso(self, compromisso_id):
@@ -228,6 +292,7 @@ class ConfiguracoesScreen(QWidget):
         confirm = mostrar_alerta(self, QMessageBox.Icon.Question, "Confirmar", "Excluir compromisso?", botoes)
         if confirm == QMessageBox.StandardButton.Yes:
             self.db.excluir_compromisso(compromisso_id)
+            self.agenda.recarregar()
             self.carregar_agenda()
 
     def editar_compromisso(self, compromisso_id, titulo, hora, descricao):
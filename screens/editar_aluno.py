@@ -15,9 +15,87 @@ from PyQt6.QtCore import QMarginsF
 from PyQt6.QtGui import QTextDocument, QPageLayout, QPageSize, QPdfWriter
 
 from uis.editar_aluno_ui import Ui_EditarAlunoScreen
+from screens.assincrono import FilaTarefas
 from screens.utils import gravidade_para_db, gravidade_para_exibir, mostrar_alerta
 
 
+# ---------------------------------------------------------------------- #
+# Geração do PDF — roda numa thread da FilaTarefas, nunca na da interface
+# (QTextDocument e QPdfWriter podem ser usados fora dela, desde que cada
+# documento fique numa thread só).
+# ---------------------------------------------------------------------- #
+def _pasta_documentos_sispe():
+    """Localiza (ou cria) a pasta Documentos/SISPE do usuário."""
+    raiz_usuario = os.path.expanduser("~")
+    caminhos_possiveis = [
+        os.path.join(raiz_usuario, "OneDrive", "Documentos"),
+        os.path.join(raiz_usuario, "OneDrive", "Documents"),
+        os.path.join(raiz_usuario, "Documentos"),
+        os.path.join(raiz_usuario, "Documents"),
+    ]
+    pasta_documentos = next((c for c in caminhos_possiveis if os.path.exists(c)), None)
+    if not pasta_documentos:
+        pasta_documentos = os.path.join(raiz_usuario, "Documentos")
+
+    pasta_sispe = os.path.join(pasta_documentos, "SISPE")
+    os.makedirs(pasta_sispe, exist_ok=True)
+    return pasta_sispe
+
+
+def _html_relatorio(texto, nome_aluno, sala_aluno, serie_aluno, gravidade_aluno, psicologo_username):
+    # texto pré-formatado fora do f-string, para não depender de versão do
+    # Python que aceite "\" dentro de {}
+    texto_html = texto.replace("\n", "<br>")
+    return f"""
+    <html>
+    <head>
+        <style>
+            body {{ font-family: 'Segoe UI', Arial, sans-serif; color: #26343F; margin: 10px; }}
+            h1 {{ color: #2F6EA6; border-bottom: 2px solid #5B84A6; padding-bottom: 8px; font-size: 24pt; margin-top: 0px; }}
+            .meta {{ font-size: 13pt; color: #5B7285; margin-bottom: 25px; background-color: #F5F7FA; padding: 14px; border-radius: 6px; line-height: 1.5; }}
+            .card {{ background-color: #FFFFFF; border-left: 6px solid #2F6EA6; padding: 20px; border-bottom: 1px solid #E4E9EF; }}
+            .titulo-sessao {{ font-weight: bold; color: #2F6EA6; font-size: 14pt; margin-bottom: 10px; }}
+            .texto {{ font-size: 13pt; line-height: 1.6; text-align: justify; white-space: pre-wrap; }}
+        </style>
+    </head>
+    <body>
+        <h1>SISPE — Registro de Evolução Psicopedagógica</h1>
+        <div class="meta">
+            <strong>Aluno(a):</strong> {nome_aluno}<br>
+            <strong>Turma:</strong> {sala_aluno} | <strong>Série:</strong> {serie_aluno}<br>
+            <strong>Status de Gravidade:</strong> {gravidade_aluno}<br>
+            <strong>Profissional Responsável:</strong> {psicologo_username}
+        </div>
+        <div class="card">
+            <div class="titulo-sessao">📝 Parecer e Observações Clínicas</div>
+            <div class="texto">{texto_html}</div>
+        </div>
+    </body>
+    </html>
+    """
+
+
+def _gravar_pdf(nome_aluno, html):
+    """Compila o HTML em PDF via QPdfWriter. Devolve o caminho do arquivo."""
+    nome_arquivo = f"Relatorio_{nome_aluno.replace(' ', '_')}.pdf"
+    caminho_pdf = os.path.join(_pasta_documentos_sispe(), nome_arquivo)
+    # o QPdfWriter não avisa quando não consegue abrir o arquivo (ex: PDF
+    # aberto em outro programa no Windows) — testa antes, para virar erro
+    open(caminho_pdf, "ab").close()
+
+    documento = QTextDocument()
+    documento.setHtml(html)
+
+    writer = QPdfWriter(caminho_pdf)
+    margens = QMarginsF(20.0, 20.0, 20.0, 20.0)
+    layout_pagina = QPageLayout(
+        QPageSize(QPageSize.PageSizeId.A4), QPageLayout.Orientation.Portrait, margens
+    )
+    writer.setPageLayout(layout_pagina)
+    documento.print(writer)
+    return caminho_pdf
+
+
 class EditarAlunoScreen(QWidget):
     def __init__(self, db, main_app):
         super().__init__()
@@ -33,6 +111,10 @@ class EditarAlunoScreen(QWidget):
         self.ui.btnHistorico.clicked.connect(self.abrir_historico)
         self.ui.btnVoltar.clicked.connect(self.voltar)
 
+        # PDFs dos relatórios, um de cada vez, em segundo plano
+        self.fila_pdf = FilaTarefas(parent=self)
+        self.fila_pdf.pendentesMudou.connect(self._mostrar_fila_pdf)
+
     # ------------------------------------------------------------------ #
     # API pública — chamada por main_app_qt.py
     # ------------------------------------------------------------------ #
@@ -62,13 +144,17 @@ class EditarAlunoScreen(QWidget):
         self.ui.labelTitulo.setText(f"Editando: {nome}")
         mostrar_alerta(self, QMessageBox.Icon.Information, "Sucesso", "Informações do aluno atualizadas!")
 
-        if self.main_app.psico:
+        if self.main_app.telas.construida("psico"):
             self.main_app.psico.atualizar()
 
     def salvar_relatorio(self):
-        """Salva o relatório no banco e gera o PDF automaticamente na pasta
-        Documentos/SISPE do usuário (não confundir com o banco de dados do
-        app, que agora fica no AppData — ver database.py)."""
+        """Salva o relatório no banco e gera o PDF na pasta Documentos/SISPE
+        do usuário (não confundir com o banco de dados do app, que agora
+        fica no AppData — ver database.py).
+
+        A gravação no banco é imediata; o PDF entra na fila de segundo plano
+        (self.fila_pdf) e o rodapé acompanha o andamento. Salvar outro
+        relatório não espera o PDF anterior ficar pronto."""
         texto = self.ui.textNovoRelatorio.toPlainText().strip()
         if not texto:
             mostrar_alerta(self, QMessageBox.Icon.Warning, "Erro",
@@ -84,85 +170,41 @@ class EditarAlunoScreen(QWidget):
         # 1. Salva o registro no banco de dados
         self.db.criar_relatorio(self.aluno_id, psicologo_id, texto)
 
+        # 2. O PDF é montado e gravado fora da thread da interface
         nome_aluno = self.ui.inputNome.text().strip()
-        sala_aluno = self.ui.inputSala.text().strip()
-        serie_aluno = self.ui.inputSerie.text().strip()
-        gravidade_aluno = self.ui.comboGravidade.currentText()
-
-        # 2. Localiza (ou cria) a pasta Documentos/SISPE do usuário
-        try:
-            raiz_usuario = os.path.expanduser("~")
-            caminhos_possiveis = [
-                os.path.join(raiz_usuario, "OneDrive", "Documentos"),
-                os.path.join(raiz_usuario, "OneDrive", "Documents"),
-                os.path.join(raiz_usuario, "Documentos"),
-                os.path.join(raiz_usuario, "Documents"),
-            ]
-            pasta_documentos = next((c for c in caminhos_possiveis if os.path.exists(c)), None)
-            if not pasta_documentos:
-                pasta_documentos = os.path.join(raiz_usuario, "Documentos")
-
-            pasta_sispe = os.path.join(pasta_documentos, "SISPE")
-            os.makedirs(pasta_sispe, exist_ok=True)
-
-            nome_arquivo = f"Relatorio_{nome_aluno.replace(' ', '_')}.pdf"
-            caminho_pdf = os.path.join(pasta_sispe, nome_arquivo)
-        except Exception as e:
-            mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
-                            f"Não foi possível criar o diretório automático:\n{str(e)}")
-            return
-
-        # 3. Monta o HTML do PDF (texto pré-formatado fora do f-string, para
-        # não depender de versão do Python que aceite "\" dentro de {})
-        texto_html = texto.replace("\n", "<br>")
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; color: #26343F; margin: 10px; }}
-                h1 {{ color: #2F6EA6; border-bottom: 2px solid #5B84A6; padding-bottom: 8px; font-size: 24pt; margin-top: 0px; }}
-                .meta {{ font-size: 13pt; color: #5B7285; margin-bottom: 25px; background-color: #F5F7FA; padding: 14px; border-radius: 6px; line-height: 1.5; }}
-                .card {{ background-color: #FFFFFF; border-left: 6px solid #2F6EA6; padding: 20px; border-bottom: 1px solid #E4E9EF; }}
-                .titulo-sessao {{ font-weight: bold; color: #2F6EA6; font-size: 14pt; margin-bottom: 10px; }}
-                .texto {{ font-size: 13pt; line-height: 1.6; text-align: justify; white-space: pre-wrap; }}
-            </style>
-        </head>
-        <body>
-            <h1>SISPE — Registro de Evolução Psicopedagógica</h1>
-            <div class="meta">
-                <strong>Aluno(a):</strong> {nome_aluno}<br>
-                <strong>Turma:</strong> {sala_aluno} | <strong>Série:</strong> {serie_aluno}<br>
-                <strong>Status de Gravidade:</strong> {gravidade_aluno}<br>
-                <strong>Profissional Responsável:</strong> {psicologo_username}
-            </div>
-            <div class="card">
-                <div class="titulo-sessao">📝 Parecer e Observações Clínicas</div>
-                <div class="texto">{texto_html}</div>
-            </div>
-        </body>
-        </html>
-        """
-
-        # 4. Compila o PDF via QPdfWriter
-        documento = QTextDocument()
-        documento.setHtml(html)
-
-        writer = QPdfWriter(caminho_pdf)
-        margens = QMarginsF(20.0, 20.0, 20.0, 20.0)
-        layout_pagina = QPageLayout(
-            QPageSize(QPageSize.PageSizeId.A4), QPageLayout.Orientation.Portrait, margens
+        html = _html_relatorio(
+            texto, nome_aluno, self.ui.inputSala.text().strip(), self.ui.inputSerie.text().strip(),
+            self.ui.comboGravidade.currentText(), psicologo_username,
+        )
+        self.fila_pdf.enfileirar(
+            _gravar_pdf, nome_aluno, html,
+            ao_concluir=lambda caminho: self._pdf_pronto(nome_aluno, caminho),
+            ao_falhar=lambda erro: self._pdf_falhou(nome_aluno, erro),
         )
-        writer.setPageLayout(layout_pagina)
-        documento.print(writer)
 
         self.ui.textNovoRelatorio.clear()
-        self.ui.labelStatusPdf.setText("✅ Arquivo salvo em: Documentos/SISPE")
-
         mostrar_alerta(
             self, QMessageBox.Icon.Information, "Sucesso",
-            f"Relatório gravado com sucesso!\n\nO PDF foi gerado automaticamente em:\n{caminho_pdf}"
+            "Relatório gravado com sucesso!\n\nO PDF está sendo gerado em segundo plano "
+            "na pasta Documentos/SISPE."
         )
 
+    def _mostrar_fila_pdf(self, pendentes):
+        if pendentes:
+            sufixo = f" ({pendentes} na fila)" if pendentes > 1 else ""
+            self.ui.labelStatusPdf.setText(f"⏳ Gerando PDF...{sufixo}")
+
+    def _pdf_pronto(self, nome_aluno, caminho_pdf):
+        if not self.fila_pdf.pendentes():
+            self.ui.labelStatusPdf.setText(f"✅ PDF de {nome_aluno} salvo em: Documentos/SISPE")
+        self.ui.labelStatusPdf.setToolTip(caminho_pdf)
+
+    def _pdf_falhou(self, nome_aluno, erro):
+        if not self.fila_pdf.pendentes():
+            self.ui.labelStatusPdf.setText("⚠️ Falha ao gerar o PDF")
+        mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
+                        f"O relatório de {nome_aluno} foi gravado, mas o PDF não pôde ser gerado:\n{erro}")
+
     def abrir_historico(self):
         if self.aluno_id is None:
             return
@@ -0,0 +1,147 @@
+"""
+screens/exportacao.py
+======================
+Exportação dos prontuários em PDF: o de um aluno (exportar_prontuario, do
+histórico) e os de uma turma inteira (exportar_prontuarios) — o
+fechamento de bimestre, sem abrir aluno por aluno no histórico.
+
+O prontuário de um aluno é desenhado em fluxo: os relatórios vêm do
+cursor do banco (DatabaseManager.iterar_relatorios_aluno) direto para as
+páginas (prontuario_pdf.gerar_pdf_prontuario), sem ler o histórico
+inteiro nem montar todos os parágrafos antes de desenhar. As páginas
+prontas, essas, ficam no canvas até o fim (~10 KB cada; ver
+gerar_pdf_prontuario).
+
+Na exportação da turma, os alunos são escolhidos por sala, série e gravidade
+(DatabaseManager.listar_alunos_filtrados). O histórico de cada um é lido
+do banco aqui, na thread do pool e sem passar pelo cache de leitura, e os PDFs são desenhados em paralelo, um
+processo por núcleo (prontuario_pdf.exportar_em_paralelo): o reportlab não
+precisa da thread da interface e cada prontuário é independente dos
+outros, então o tempo cai quase na proporção do número de núcleos.
+
+Cada arquivo vai para a pasta do aluno em Documentos/SISPE/Relatorios
+(screens/utils.pasta_relatorios), ao lado dos relatórios avulsos.
+
+O prontuario_pdf (e com ele o reportlab) só é importado dentro das funções
+de exportação, que rodam no pool: abrir a tela do psicólogo ou o histórico
+não paga essa importação, e a primeira exportação a paga fora da thread da
+interface.
+
+Nada aqui desenha widgets: as telas (screens/historico_relatorios.py e
+screens/psicologo.py) rodam estas funções em segundo plano e acompanham
+pelo ProgressoImportacao.
+"""
+
+import os
+import time
+from datetime import datetime
+
+from screens.utils import _slugify, gravidade_para_exibir, pasta_relatorios
+
+
+class ExportacaoCancelada(Exception):
+    pass
+
+
+class ResultadoExportacao:
+    def __init__(self):
+        self.alunos = 0
+        self.gerados = []  # caminhos
+        self.falhas = []   # (caminho, erro)
+        self.pasta = None
+        self.segundos = 0.0
+
+    def resumo(self):
+        if not self.alunos:
+            return "Nenhum aluno encontrado com esses filtros."
+        texto = f"{len(self.gerados)} prontuário(s) exportado(s)"
+        if self.falhas:
+            texto += f", {len(self.falhas)} com erro"
+        texto += "."
+        if self.gerados and self.segundos:
+            texto += f" Tempo: {self.segundos:.1f} s ({len(self.gerados) / self.segundos:.1f} por segundo)."
+        if self.pasta:
+            texto += f"\n\nArquivos em: {self.pasta}"
+        return texto
+
+
+def _aluno_para_pdf(nome, sala, serie, gravidade):
+    return {
+        "nome": nome, "sala": sala, "serie": serie,
+        "gravidade": gravidade_para_exibir(gravidade or ""),
+    }
+
+
+def exportar_prontuario(db, aluno_id, caminho, progresso=None):
+    """Grava em `caminho` o prontuário de um aluno e devolve o número de
+    páginas. Levanta ExportacaoCancelada se o usuário cancelar no meio
+    (nesse caso o arquivo não é criado)."""
+    import prontuario_pdf
+
+    _id, nome, sala, serie, gravidade = db.obter_aluno(aluno_id)
+    total = db.contar_relatorios_aluno(aluno_id)
+    paginas = [0]
+
+    def _avancou(feitos, paginas_prontas):
+        paginas[0] = paginas_prontas
+        if progresso is not None and total:
+            progresso.avancou.emit(feitos * 100 // total)
+
+    gerado = prontuario_pdf.gerar_pdf_prontuario(
+        caminho, _aluno_para_pdf(nome, sala, serie, gravidade),
+        db.iterar_relatorios_aluno(aluno_id), total=total, ao_avancar=_avancou,
+        cancelado=progresso.cancelado if progresso is not None else None,
+    )
+    if gerado is None:
+        raise ExportacaoCancelada()
+    return paginas[0] + 1
+
+
+def _caminho_prontuario(aluno, data):
+    """Documentos/SISPE/Relatorios/<aluno>/prontuario_<sala>_<serie>_<data>.pdf
+    — sala e série no nome para dois alunos homônimos não se sobrescreverem."""
+    turma = _slugify(f"{aluno['sala']} {aluno['serie']}")
+    return os.path.join(pasta_relatorios(aluno["nome"]), f"prontuario_{turma}_{data}.pdf")
+
+
+def exportar_prontuarios(db, sala=None, serie=None, gravidade=None, progresso=None):
+    """Gera o prontuário de cada aluno que passa nos filtros. Levanta
+    ExportacaoCancelada se o usuário cancelar no meio (os PDFs já
+    terminados ficam na pasta)."""
+    import prontuario_pdf
+
+    inicio = time.perf_counter()
+    resultado = ResultadoExportacao()
+    alunos = db.listar_alunos_filtrados(sala, serie, gravidade)
+    resultado.alunos = len(alunos)
+    if not alunos:
+        return resultado
+
+    data = datetime.now().strftime("%Y-%m-%d")
+
+    def _tarefas():
+        # gerador: o histórico de um aluno só é lido quando há um processo
+        # livre para desenhá-lo. Lido pelo iterar_relatorios_aluno, que não
+        # passa pelo cache: os textos de uma turma inteira, que não voltam a
+        # ser lidos, expulsariam de lá as páginas que as telas usam.
+        for aluno_id, *dados in alunos:
+            aluno = _aluno_para_pdf(*dados)
+            relatorios = list(db.iterar_relatorios_aluno(aluno_id))
+            yield _caminho_prontuario(aluno, data), aluno, relatorios
+
+    def _avancou(feitos):
+        if progresso is not None:
+            progresso.avancou.emit(feitos * 100 // len(alunos))
+
+    saida = prontuario_pdf.exportar_em_paralelo(
+        _tarefas(), ao_avancar=_avancou,
+        cancelado=progresso.cancelado if progresso is not None else None,
+    )
+    if saida is None:
+        raise ExportacaoCancelada()
+
+    resultado.gerados, resultado.falhas = saida
+    if resultado.gerados:
+        resultado.pasta = os.path.dirname(os.path.dirname(resultado.gerados[0]))
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
@@ -7,31 +7,55 @@ Este arquivo NÃO constrói nenhum widget diretamente — toda a interface
 visual vive em uis/historico_relatorios_ui.py (classe
 Ui_HistoricoRelatoriosScreen). Aqui só ficam: exportação em PDF, navegação
 e chamadas ao banco (database.py).
+
+O prontuário é gerado em segundo plano e em fluxo (ver
+screens/exportacao.py): a tela continua respondendo, mostra o progresso e
+pode cancelar, mesmo com centenas de relatórios.
 """
 
-from PyQt6.QtWidgets import QWidget, QTableWidgetItem, QFileDialog, QMessageBox
-from PyQt6.QtCore import QMarginsF
-from PyQt6.QtGui import QTextDocument, QPageLayout, QPageSize, QPdfWriter
+from PyQt6.QtWidgets import QWidget, QFileDialog, QMessageBox
 
 from uis.historico_relatorios_ui import Ui_HistoricoRelatoriosScreen
+from screens.assincrono import BancoAssincrono, FilaTarefas
+from screens.exportacao import ExportacaoCancelada, exportar_prontuario
+from screens.importacao import ProgressoImportacao
+from screens.tabelas import TAMANHO_PREVIA, ModeloPaginado, indicar_carregamento, previa
 from screens.utils import mostrar_alerta
 
 
 class HistoricoRelatoriosScreen(QWidget):
-    def __init__(self, db, main_app):
+    def __init__(self, db, main_app, tamanho_previa=TAMANHO_PREVIA):
         super().__init__()
         self.db = db
         self.main_app = main_app
         self.aluno_id = None
         self.nome_aluno = ""
-        self._relatorios = []
 
         self.ui = Ui_HistoricoRelatoriosScreen()
         self.ui.setupUi(self)
 
-        self.ui.tabelaHistorico.cellClicked.connect(self.mostrar_relatorio)
+        # linhas do modelo: (id, data, previa, tamanho) — o texto inteiro
+        # só é lido quando o relatório é selecionado
+        self.banco = BancoAssincrono.compartilhado(db)
+        self.tamanho_previa = tamanho_previa
+        self.modelo = ModeloPaginado([
+            ("Data", lambda r: str(r[1])),
+            ("Prévia", lambda r: previa(r[2], r[3], self.tamanho_previa)),
+        ], tamanho_pagina=50, parent=self, assincrono=self.banco)
+        self.ui.tabelaHistorico.setModel(self.modelo)
+        self.ui.ajustar_colunas_historico()
+        indicar_carregamento(self.ui.tabelaHistorico, self.modelo)
+        self.modelo.carregandoMudou.connect(self._primeira_pagina_chegou)
+        self._selecionar_primeiro = False
+
+        self.ui.tabelaHistorico.clicked.connect(lambda index: self.mostrar_relatorio(index.row()))
         self.ui.btnVoltar.clicked.connect(self.voltar)
         self.ui.btnExportarPDF.clicked.connect(self.exportar_para_pdf)
+        self.ui.btnCancelarExportacao.clicked.connect(self.cancelar_exportacao)
+        self._progresso_exportacao = None
+        # um histórico longo leva minutos para exportar: fila própria, fora
+        # das threads das consultas (self.banco)
+        self.fila_exportacao = FilaTarefas(parent=self)
 
     # ------------------------------------------------------------------ #
     # API pública — chamada por main_app_qt.py
@@ -40,30 +64,48 @@ class HistoricoRelatoriosScreen(QWidget):
         self.aluno_id = aluno_id
         self.nome_aluno = nome_aluno
         self.ui.labelTitulo.setText(f"Histórico — {nome_aluno}")
-        self._relatorios = self.db.listar_relatorios_aluno(aluno_id)
-
-        tabela = self.ui.tabelaHistorico
-        tabela.setRowCount(len(self._relatorios))
-        for i, (texto, data) in enumerate(self._relatorios):
-            previa = texto if len(texto) <= 80 else texto[:80].rstrip() + "..."
-            tabela.setItem(i, 0, QTableWidgetItem(str(data)))
-            tabela.setItem(i, 1, QTableWidgetItem(previa))
+        self.modelo.recarregar(
+            lambda cursor, tamanho: self.db.listar_previas_relatorios_pagina(
+                aluno_id, tamanho, cursor, tamanho_previa=self.tamanho_previa
+            )
+        )
 
+        self.banco.cancelar("historico.relatorio")
         self.ui.textRelatorioCompleto.clear()
-        if self._relatorios:
-            tabela.selectRow(0)
-            self.mostrar_relatorio(0, 0)
+        self._selecionar_primeiro = True
+        self._primeira_pagina_chegou(self.modelo.carregando())
+
+    def _primeira_pagina_chegou(self, carregando):
+        """Mostra o relatório mais recente assim que a primeira página
+        chega (a busca é em segundo plano)."""
+        if carregando or not self._selecionar_primeiro:
+            return
+        self._selecionar_primeiro = False
+        if self.modelo.rowCount():
+            self.ui.tabelaHistorico.selectRow(0)
+            self.mostrar_relatorio(0)
 
     # ------------------------------------------------------------------ #
-    def mostrar_relatorio(self, row, _column=0):
-        if row < 0 or row >= len(self._relatorios):
+    def mostrar_relatorio(self, row):
+        relatorio = self.modelo.linha(row)
+        if not relatorio:
             return
-        texto, data = self._relatorios[row]
+        relatorio_id, data, trecho, tamanho = relatorio
+        self.ui.textRelatorioCompleto.setText(f"📅 {data}\n\n{previa(trecho, tamanho, self.tamanho_previa)}")
+        self.banco.chamar(
+            "historico.relatorio", "obter_relatorio", relatorio_id,
+            ao_concluir=self._mostrar_texto_completo,
+        )
+
+    def _mostrar_texto_completo(self, relatorio):
+        if relatorio is None:  # excluído enquanto a tela estava aberta
+            return
+        texto, data = relatorio
         self.ui.textRelatorioCompleto.setText(f"📅 {data}\n\n{texto}")
 
     def exportar_para_pdf(self):
         """Gera um PDF com todo o histórico de relatórios do aluno."""
-        if not self._relatorios:
+        if not self.aluno_id or not (self.modelo.rowCount() or self.modelo.carregando()):
             mostrar_alerta(self, QMessageBox.Icon.Warning, "Aviso", "Não há relatórios para exportar.")
             return
 
@@ -74,49 +116,44 @@ class HistoricoRelatoriosScreen(QWidget):
         if not caminho:
             return
 
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; color: #26343F; margin: 10px; }}
-                h1 {{ color: #2F6EA6; border-bottom: 2px solid #5B84A6; padding-bottom: 8px; font-size: 24pt; margin-top: 0px; }}
-                .meta {{ font-size: 14pt; color: #5B7285; margin-bottom: 25px; background-color: #F5F7FA; padding: 12px; border-radius: 6px; }}
-                .card {{ background-color: #FFFFFF; border-left: 5px solid #5B84A6; margin-bottom: 20px; padding: 15px; border-bottom: 1px solid #E4E9EF; }}
-                .data {{ font-weight: bold; color: #2F6EA6; font-size: 13pt; margin-bottom: 6px; }}
-                .texto {{ font-size: 13pt; line-height: 1.5; text-align: justify; }}
-            </style>
-        </head>
-        <body>
-            <h1>SISPE — Prontuário Clínico</h1>
-            <div class="meta">
-                <strong>Aluno(a):</strong> {self.nome_aluno}<br>
-                <strong>Total de Registros:</strong> {len(self._relatorios)} relatórios acumulados.
-            </div>
-        """
-
-        for texto, data in self._relatorios:
-            texto_formatado = texto.replace("\n", "<br>")
-            html += f"""
-            <div class="card">
-                <div class="data">📅 Registro em: {data}</div>
-                <div class="texto">{texto_formatado}</div>
-            </div>
-            """
-
-        html += "</body></html>"
-
-        writer = QPdfWriter(caminho)
-        margens = QMarginsF(20.0, 20.0, 20.0, 20.0)
-        layout_pagina = QPageLayout(
-            QPageSize(QPageSize.PageSizeId.A4), QPageLayout.Orientation.Portrait, margens
-        )
-        writer.setPageLayout(layout_pagina)
+        self._progresso_exportacao = ProgressoImportacao(self)
+        self._progresso_exportacao.avancou.connect(self.ui.barraExportacao.setValue)
 
-        documento = QTextDocument()
-        documento.setHtml(html)
-        documento.print(writer)
+        self.ui.barraExportacao.setValue(0)
+        self.ui.labelExportacao.setText("Exportando prontuário...")
+        self.ui.frameExportacao.setVisible(True)
+        self.ui.btnExportarPDF.setEnabled(False)
+
+        self.fila_exportacao.enfileirar(
+            exportar_prontuario, self.db, self.aluno_id, caminho, self._progresso_exportacao,
+            ao_concluir=self._exportacao_concluida, ao_falhar=self._exportacao_falhou,
+        )
 
-        mostrar_alerta(self, QMessageBox.Icon.Information, "Sucesso", "Prontuário exportado em PDF com sucesso!")
+    def cancelar_exportacao(self):
+        if self._progresso_exportacao is not None:
+            self._progresso_exportacao.cancelar()
+            self.ui.labelExportacao.setText("Cancelando...")
+
+    def _encerrar_exportacao(self):
+        self.ui.frameExportacao.setVisible(False)
+        self.ui.btnExportarPDF.setEnabled(True)
+        if self._progresso_exportacao is not None:
+            self._progresso_exportacao.deleteLater()
+            self._progresso_exportacao = None
+
+    def _exportacao_concluida(self, paginas):
+        self._encerrar_exportacao()
+        mostrar_alerta(self, QMessageBox.Icon.Information, "Sucesso",
+                       f"Prontuário exportado em PDF com sucesso! ({paginas} página(s))")
+
+    def _exportacao_falhou(self, erro):
+        self._encerrar_exportacao()
+        if isinstance(erro, ExportacaoCancelada):
+            mostrar_alerta(self, QMessageBox.Icon.Information, "Exportação cancelada",
+                           "O prontuário não foi gravado.")
+        else:
+            mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
+                           f"Não foi possível exportar o prontuário:\n{erro}")
 
     def voltar(self):
         self.main_app.voltar_para_editar_aluno()
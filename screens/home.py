@@ -13,18 +13,25 @@ Regra de negócio dos cards de estatística:
     - psicologo:  vê só os números que pertencem a ele (relatórios que ele
                   escreveu, compromissos que ele agendou).
     - qualquer outro tipo (ex: pai) ou ninguém logado: nenhum card aparece.
+
+Os números são buscados em segundo plano (BancoAssincrono): os cards
+aparecem na hora com "…" e recebem o valor quando a consulta termina.
 """
 
 from PyQt6.QtWidgets import QWidget
 
 from uis.home_ui import Ui_HomeScreen
+from screens.assincrono import BancoAssincrono
 from screens.theme import CORES
 
+_CARREGANDO = "…"
+
 
 class HomeScreen(QWidget):
     def __init__(self, db):
         super().__init__()
         self.db = db
+        self.banco = BancoAssincrono.compartilhado(db)
 
         self.ui = Ui_HomeScreen()
         self.ui.setupUi(self)
@@ -53,6 +60,8 @@ class HomeScreen(QWidget):
 
     # ------------------------------------------------------------------ #
     def _montar_estatisticas_para(self, usuario):
+        # uma resposta atrasada não pode preencher cards que já foram apagados
+        self.banco.cancelar("home.estatisticas")
         self.ui.limpar_estatisticas()
 
         tipo = usuario["tipo"] if usuario else None
@@ -70,32 +79,30 @@ class HomeScreen(QWidget):
 
     def _montar_estatisticas_admin(self):
         """Painel global da escola inteira — só o admin vê isto."""
-        stats = self.db.obter_estatisticas_dashboard()
-
-        self.ui.criar_card_estatistica(
-            "🎓", CORES["azul_escuro"], "Total de alunos"
-        ).definir_valor(stats["alunos"])
-
-        self.ui.criar_card_estatistica(
-            "📝", CORES["sucesso"], "Relatórios feitos"
-        ).definir_valor(stats["relatorios"])
-
-        self.ui.criar_card_estatistica(
-            "👨‍👩‍👧", CORES["azul"], "Pais vinculados"
-        ).definir_valor(stats["pais"])
-
-        self.ui.criar_card_estatistica(
-            "⚠️", CORES["alerta"], "Casos urgentes"
-        ).definir_valor(stats["urgentes"])
+        cards = {
+            "alunos": self.ui.criar_card_estatistica("🎓", CORES["azul_escuro"], "Total de alunos"),
+            "relatorios": self.ui.criar_card_estatistica("📝", CORES["sucesso"], "Relatórios feitos"),
+            "pais": self.ui.criar_card_estatistica("👨‍👩‍👧", CORES["azul"], "Pais vinculados"),
+            "urgentes": self.ui.criar_card_estatistica("⚠️", CORES["alerta"], "Casos urgentes"),
+        }
+        self._preencher_quando_chegar(cards, "obter_estatisticas_dashboard")
 
     def _montar_estatisticas_psicologo(self, psicologo_id):
         """Só os números que pertencem a este psicólogo especificamente."""
-        stats = self.db.obter_estatisticas_psicologo(psicologo_id)
-
-        self.ui.criar_card_estatistica(
-            "📝", CORES["sucesso"], "Relatórios feitos por você"
-        ).definir_valor(stats["relatorios"])
-
-        self.ui.criar_card_estatistica(
-            "🗓️", CORES["azul"], "Compromissos agendados"
-        ).definir_valor(stats["compromissos"])
+        cards = {
+            "relatorios": self.ui.criar_card_estatistica(
+                "📝", CORES["sucesso"], "Relatórios feitos por você"),
+            "compromissos": self.ui.criar_card_estatistica(
+                "🗓️", CORES["azul"], "Compromissos agendados"),
+        }
+        self._preencher_quando_chegar(cards, "obter_estatisticas_psicologo", psicologo_id)
+
+    def _preencher_quando_chegar(self, cards, metodo, *args):
+        for card in cards.values():
+            card.definir_valor(_CARREGANDO)
+
+        def _preencher(stats):
+            for chave, card in cards.items():
+                card.definir_valor(stats[chave])
+
+        self.banco.chamar("home.estatisticas", metodo, *args, ao_concluir=_preencher)
@@ -0,0 +1,458 @@
+"""
+screens/importacao.py
+======================
+Importação em massa a partir de uma planilha (.csv ou .xlsx): alunos — o
+cadastro do começo do ano letivo, sem digitar aluno por aluno — e contas
+de usuário (importar_usuarios, no fim do arquivo).
+
+O arquivo é lido em fluxo (linha a linha, nunca inteiro na memória), cada
+linha passa pelas mesmas regras do cadastro manual (campos obrigatórios,
+gravidade via gravidade_para_db, duplicata por nome+sala+série) e as
+válidas vão para o banco em lotes, numa única transação
+(DatabaseManager.adicionar_alunos_em_lote). As linhas válidas são
+juntadas antes de a transação abrir: a trava de gravação só é pega
+para os INSERTs, não durante a leitura do arquivo. Linhas com problema não
+interrompem a importação: viram uma entrada no relatório de erros.
+
+A planilha precisa de um cabeçalho com as colunas Nome, Sala, Série e
+Gravidade (em qualquer ordem; acentos e maiúsculas não importam).
+
+Nada aqui desenha widgets: a tela (screens/psicologo.py) roda
+importar_alunos() em segundo plano e acompanha pelo ProgressoImportacao.
+"""
+
+import csv
+import io
+import os
+import posixpath
+import re
+import threading
+import time
+import zipfile
+from functools import lru_cache
+from xml.etree import ElementTree
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import politica_senha
+from screens.utils import GRAVIDADE_EXIBIR, _remover_acentos, gravidade_para_db
+
+# nomes aceitos no cabeçalho (já sem acento e em minúsculas) -> campo
+_CABECALHOS = {
+    "nome": "nome", "aluno": "nome", "nome do aluno": "nome",
+    "sala": "sala", "turma": "sala",
+    "serie": "serie", "ano": "serie",
+    "gravidade": "gravidade",
+}
+_CAMPOS = ("nome", "sala", "serie", "gravidade")
+_ROTULOS = {"nome": "Nome", "sala": "Sala", "serie": "Série", "gravidade": "Gravidade"}
+
+EXTENSOES = ("*.csv", "*.xlsx")
+
+# Uma planilha tem meia dúzia de grafias de gravidade repetidas em milhares
+# de linhas — converte cada grafia uma vez só.
+_gravidade_db = lru_cache(maxsize=128)(gravidade_para_db)
+
+
+class ErroImportacao(Exception):
+    """Arquivo que não dá para importar (formato, cabeçalho...). Erros de
+    uma linha específica não levantam isto — vão para o relatório."""
+
+
+class ImportacaoCancelada(Exception):
+    pass
+
+
+class ResultadoImportacao:
+    def __init__(self, item="aluno(s)", motivo_duplicado="Aluno já cadastrado"):
+        self.item = item
+        self.motivo_duplicado = motivo_duplicado
+        self.lidas = 0
+        self.inseridos = 0
+        self.duplicados = []  # números de linha
+        self.erros = []       # (numero_linha, motivo)
+        self.segundos = 0.0
+
+    def resumo(self):
+        partes = [f"{self.inseridos} {self.item} importado(s)"]
+        if self.duplicados:
+            partes.append(f"{len(self.duplicados)} já cadastrado(s)")
+        if self.erros:
+            partes.append(f"{len(self.erros)} linha(s) com erro")
+        texto = ", ".join(partes) + "."
+        if self.inseridos and self.segundos:
+            texto += f" Tempo: {self.segundos:.1f} s ({self.inseridos / self.segundos:.1f} por segundo)."
+        return texto
+
+    def salvar_relatorio(self, caminho):
+        """Grava as linhas ignoradas (erros e duplicatas) num CSV que abre
+        direto no Excel."""
+        problemas = self.erros + [(linha, self.motivo_duplicado) for linha in self.duplicados]
+        problemas.sort()
+        with open(caminho, "w", newline="", encoding="utf-8-sig") as arquivo:
+            escritor = csv.writer(arquivo, delimiter=";")
+            escritor.writerow(["Linha", "Problema"])
+            escritor.writerows(problemas)
+
+
+class ProgressoImportacao(QObject):
+    """Ponte entre a importação (rodando numa thread do pool) e a tela:
+    avancou(percentual) chega na thread da interface, e cancelar() pode
+    ser chamado de lá a qualquer momento."""
+
+    avancou = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cancelado = threading.Event()
+
+    def cancelar(self):
+        self._cancelado.set()
+
+    def cancelado(self):
+        return self._cancelado.is_set()
+
+
+# ---------------------------------------------------------------------- #
+# Leitura em fluxo
+# ---------------------------------------------------------------------- #
+def ler_planilha(caminho):
+    """Gera (numero_linha, celulas, fracao_lida) para cada linha do arquivo,
+    com as células já como texto. fracao_lida (0 a 1) é uma estimativa do
+    quanto do arquivo já passou, para a barra de progresso."""
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".csv":
+        return _ler_csv(caminho)
+    if extensao == ".xlsx":
+        return _ler_xlsx(caminho)
+    raise ErroImportacao("Formato não suportado. Use uma planilha .csv ou .xlsx.")
+
+
+def _ler_csv(caminho):
+    tamanho = os.path.getsize(caminho) or 1
+    with open(caminho, "rb") as bruto:
+        amostra = bruto.read(64 * 1024)
+        bruto.seek(0)
+
+        # Excel no Brasil salva CSV em Windows-1252 e com ";" — aceita os dois
+        try:
+            amostra.decode("utf-8")
+            codificacao = "utf-8-sig"
+        except UnicodeDecodeError as e:
+            # a amostra pode ter cortado um caractere no meio
+            codificacao = "utf-8-sig" if e.start >= len(amostra) - 3 else "cp1252"
+        try:
+            dialeto = csv.Sniffer().sniff(amostra.decode(codificacao, errors="ignore"), delimiters=";,\t")
+        except csv.Error:
+            dialeto = csv.excel
+
+        texto = io.TextIOWrapper(bruto, encoding=codificacao, newline="")
+        for numero, celulas in enumerate(csv.reader(texto, dialeto), start=1):
+            yield numero, celulas, bruto.tell() / tamanho
+
+
+# Um .xlsx é um zip de XMLs. Só precisamos de texto e números da planilha
+# ativa, então ela é lida direto com o iterparse da biblioteca padrão (em C)
+# — dezenas de vezes mais rápido que o openpyxl sem lxml e sem dependência
+# nova. Fórmulas entram pelo último valor calculado, datas como número.
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_COLUNA = re.compile(r"[A-Z]+")
+
+
+def _ler_xlsx(caminho):
+    try:
+        arquivo = zipfile.ZipFile(caminho)
+    except zipfile.BadZipFile:
+        raise ErroImportacao("O arquivo não é uma planilha .xlsx válida.")
+
+    with arquivo:
+        try:
+            caminho_planilha = _planilha_ativa(arquivo)
+            compartilhadas = _textos_compartilhados(arquivo)
+            tamanho = arquivo.getinfo(caminho_planilha).file_size or 1
+        except KeyError:
+            raise ErroImportacao("O arquivo não é uma planilha .xlsx válida.")
+
+        with arquivo.open(caminho_planilha) as xml:
+            for _evento, elemento in ElementTree.iterparse(xml):
+                if elemento.tag != _NS + "row":
+                    continue
+                celulas = []
+                for c in elemento.iter(_NS + "c"):
+                    coluna = _indice_coluna(c.get("r"), len(celulas))
+                    celulas.extend([""] * (coluna - len(celulas)))
+                    celulas.append(_valor_celula(c, compartilhadas))
+                numero = int(elemento.get("r"))
+                elemento.clear()
+                yield numero, celulas, xml.tell() / tamanho
+
+
+def _planilha_ativa(arquivo):
+    """Caminho, dentro do zip, do XML da aba que estava aberta no Excel."""
+    livro = ElementTree.fromstring(arquivo.read("xl/workbook.xml"))
+    vista = livro.find(f"{_NS}bookViews/{_NS}workbookView")
+    aba = int(vista.get("activeTab", 0)) if vista is not None else 0
+    abas = livro.findall(f"{_NS}sheets/{_NS}sheet")
+    rel_id = abas[min(aba, len(abas) - 1)].get(_NS_REL + "id")
+
+    relacoes = ElementTree.fromstring(arquivo.read("xl/_rels/workbook.xml.rels"))
+    for relacao in relacoes:
+        if relacao.get("Id") == rel_id:
+            alvo = relacao.get("Target")
+            if alvo.startswith("/"):
+                return alvo.lstrip("/")
+            return posixpath.normpath(posixpath.join("xl", alvo))
+    raise KeyError(rel_id)
+
+
+def _textos_compartilhados(arquivo):
+    try:
+        xml = arquivo.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    textos = []
+    with xml:
+        for _evento, elemento in ElementTree.iterparse(xml):
+            if elemento.tag == _NS + "si":
+                # texto com formatação vem picado em vários <t>
+                textos.append("".join(t.text or "" for t in elemento.iter(_NS + "t")))
+                elemento.clear()
+    return textos
+
+
+def _indice_coluna(referencia, padrao):
+    if not referencia:
+        return padrao
+    indice = 0
+    for letra in _COLUNA.match(referencia).group():
+        indice = indice * 26 + ord(letra) - 64
+    return indice - 1
+
+
+def _valor_celula(c, compartilhadas):
+    tipo = c.get("t")
+    if tipo == "inlineStr":
+        return "".join(t.text or "" for t in c.iter(_NS + "t"))
+    valor = c.findtext(_NS + "v") or ""
+    if tipo == "s":
+        return compartilhadas[int(valor)] if valor else ""
+    if tipo in (None, "n") and valor.endswith(".0"):
+        return valor[:-2]  # série 9 salva como número vira "9", não "9.0"
+    return valor
+
+
+# ---------------------------------------------------------------------- #
+# Validação
+# ---------------------------------------------------------------------- #
+def _mapear_cabecalho(celulas, cabecalhos=_CABECALHOS, rotulos=_ROTULOS):
+    """Índice de cada campo no cabeçalho, ou ErroImportacao se faltar algum.
+    rotulos diz, na ordem, os campos obrigatórios e como chamá-los na
+    mensagem de erro."""
+    indices = {}
+    for i, celula in enumerate(celulas):
+        campo = cabecalhos.get(_remover_acentos(celula.strip().lower()))
+        if campo and campo not in indices:
+            indices[campo] = i
+
+    faltando = [campo for campo in rotulos if campo not in indices]
+    if faltando:
+        nomes = list(rotulos.values())
+        raise ErroImportacao(
+            f"A primeira linha da planilha precisa ter as colunas {', '.join(nomes[:-1])} e "
+            f"{nomes[-1]}. Faltando: {', '.join(rotulos[c] for c in faltando)}."
+        )
+    return indices
+
+
+def validar_linha(celulas, indices):
+    """(nome, sala, serie, gravidade_db) de uma linha, ou ValueError com o
+    motivo — as mesmas regras de PsicologoScreen.cadastrar_aluno."""
+    def _valor(campo):
+        i = indices[campo]
+        return celulas[i].strip() if i < len(celulas) else ""
+
+    nome, sala, serie, gravidade = (_valor(campo) for campo in _CAMPOS)
+
+    vazios = [rotulo for rotulo, valor in (("nome", nome), ("sala", sala), ("série", serie)) if not valor]
+    if vazios:
+        raise ValueError(f"Campo obrigatório vazio: {', '.join(vazios)}")
+
+    gravidade_db = _gravidade_db(gravidade)
+    if gravidade_db not in GRAVIDADE_EXIBIR:
+        raise ValueError(f"Gravidade inválida: '{gravidade}' (use Baixo, Médio ou Grave)")
+
+    return nome, sala, serie, gravidade_db
+
+
+# ---------------------------------------------------------------------- #
+# Importação
+# ---------------------------------------------------------------------- #
+def importar_alunos(db, caminho, progresso=None, tamanho_lote=5000):
+    """Importa os alunos do arquivo. Feita para rodar fora da thread da
+    interface (ex: via BancoAssincrono). Retorna um ResultadoImportacao;
+    levanta ErroImportacao para arquivos inválidos e ImportacaoCancelada
+    se progresso.cancelar() for chamado — nos dois casos nada é gravado."""
+    inicio = time.perf_counter()
+    linhas = ler_planilha(caminho)
+    resultado = ResultadoImportacao()
+
+    indices = None
+    for numero, celulas, _fracao in linhas:
+        if any(c.strip() for c in celulas):
+            indices = _mapear_cabecalho(celulas)
+            break
+    if indices is None:
+        raise ErroImportacao("A planilha está vazia.")
+
+    existentes = db.chaves_alunos()
+
+    def _avisar(fracao):
+        if progresso is not None:
+            if progresso.cancelado():
+                raise ImportacaoCancelada()
+            progresso.avancou.emit(min(99, int(fracao * 100)))
+
+    def _lotes():
+        lote = []
+        for numero, celulas, fracao in linhas:
+            if not any(c.strip() for c in celulas):
+                continue
+            resultado.lidas += 1
+            if resultado.lidas % 1000 == 0:
+                _avisar(fracao)
+
+            try:
+                aluno = validar_linha(celulas, indices)
+            except ValueError as e:
+                resultado.erros.append((numero, str(e)))
+                continue
+
+            # também pega o mesmo aluno repetido dentro da própria planilha
+            chave = aluno[:3]
+            if chave in existentes:
+                resultado.duplicados.append(numero)
+                continue
+            existentes.add(chave)
+
+            lote.append(aluno)
+            if len(lote) >= tamanho_lote:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+
+    try:
+        resultado.inseridos = db.adicionar_alunos_em_lote(_lotes())
+    finally:
+        linhas.close()  # fecha o arquivo mesmo se parou no meio
+    resultado.segundos = time.perf_counter() - inicio
+    if progresso is not None:
+        progresso.avancou.emit(100)
+    return resultado
+
+
+# ---------------------------------------------------------------------- #
+# Usuários
+# ---------------------------------------------------------------------- #
+# Contas de responsáveis/psicólogos, com uma senha inicial por linha. O
+# lento aqui não é o banco, é o bcrypt (de propósito): as senhas são
+# calculadas em paralelo por politica_senha.gerar_hashes e as contas
+# entram todas numa transação só.
+_CABECALHOS_USUARIO = {
+    "username": "username", "usuario": "username", "login": "username",
+    "tipo": "tipo", "perfil": "tipo",
+    "senha": "senha", "senha inicial": "senha",
+}
+_ROTULOS_USUARIO = {"username": "Usuário", "tipo": "Tipo", "senha": "Senha"}
+
+# mesmos tipos que o admin pode escolher na tela (AdminScreen.criar_usuario)
+_TIPOS_USUARIO = {
+    "pai": "pai", "mae": "pai", "responsavel": "pai",
+    "psicologo": "psicologo", "psicologa": "psicologo",
+}
+
+
+def validar_linha_usuario(celulas, indices):
+    """(username, tipo, senha) de uma linha, ou ValueError com o motivo."""
+    def _valor(campo):
+        i = indices[campo]
+        return celulas[i].strip() if i < len(celulas) else ""
+
+    username, tipo, senha = (_valor(campo) for campo in _ROTULOS_USUARIO)
+
+    vazios = [rotulo for rotulo, valor in (("usuário", username), ("tipo", tipo), ("senha", senha))
+              if not valor]
+    if vazios:
+        raise ValueError(f"Campo obrigatório vazio: {', '.join(vazios)}")
+
+    tipo_db = _TIPOS_USUARIO.get(_remover_acentos(tipo.lower()))
+    if tipo_db is None:
+        raise ValueError(f"Tipo inválido: '{tipo}' (use Pai ou Psicólogo)")
+
+    return username, tipo_db, senha
+
+
+def importar_usuarios(db, caminho, progresso=None):
+    """Cria as contas listadas no arquivo (colunas Usuário, Tipo e Senha).
+    Mesmo contrato de importar_alunos: roda fora da thread da interface,
+    devolve um ResultadoImportacao e não grava nada se o arquivo for
+    inválido ou a importação for cancelada."""
+    inicio = time.perf_counter()
+    resultado = ResultadoImportacao("usuário(s)", "Usuário já existe")
+
+    def _avisar(percentual):
+        if progresso is not None:
+            if progresso.cancelado():
+                raise ImportacaoCancelada()
+            progresso.avancou.emit(percentual)
+
+    # São centenas de linhas, não milhares: cabe tudo na memória, e o
+    # username de todas é conferido no banco de uma vez.
+    linhas = ler_planilha(caminho)
+    try:
+        indices = None
+        validas = []  # (numero_linha, username, tipo, senha)
+        for numero, celulas, _fracao in linhas:
+            if not any(c.strip() for c in celulas):
+                continue
+            if indices is None:
+                indices = _mapear_cabecalho(celulas, _CABECALHOS_USUARIO, _ROTULOS_USUARIO)
+                continue
+            resultado.lidas += 1
+            try:
+                validas.append((numero, *validar_linha_usuario(celulas, indices)))
+            except ValueError as e:
+                resultado.erros.append((numero, str(e)))
+    finally:
+        linhas.close()
+    if indices is None:
+        raise ErroImportacao("A planilha está vazia.")
+    _avisar(5)
+
+    existentes = db.usuarios_existentes(username for _n, username, _t, _s in validas)
+    novos = []
+    for numero, username, tipo, senha in validas:
+        # também pega o mesmo username repetido dentro da própria planilha
+        if username in existentes:
+            resultado.duplicados.append(numero)
+            continue
+        existentes.add(username)
+        novos.append((username, tipo, senha))
+
+    total = len(novos) or 1
+    hashes = politica_senha.gerar_hashes(
+        [senha for _u, _t, senha in novos], db.custo_senha(),
+        ao_avancar=lambda feitos: _avisar(5 + 90 * feitos // total),
+        cancelado=progresso.cancelado if progresso is not None else None,
+    )
+    if hashes is None:
+        raise ImportacaoCancelada()
+
+    resultado.inseridos = db.criar_usuarios_em_lote(
+        [(username, senha_hash, tipo) for (username, tipo, _s), senha_hash in zip(novos, hashes)]
+    )
+    resultado.segundos = time.perf_counter() - inicio
+    if progresso is not None:
+        progresso.avancou.emit(100)
+    return resultado
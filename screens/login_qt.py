@@ -6,20 +6,56 @@ Lógica da tela de login do SISPE.
 Este arquivo NÃO constrói nenhum widget diretamente — toda a interface visual
 vive em screens/login_ui.py (classe Ui_LoginScreen). Aqui só ficam:
 autenticação, conexão de sinais e navegação entre telas.
+
+A senha é conferida fora da thread da interface (o bcrypt é lento de
+propósito). Enquanto isso, a outra thread do pool já lê as consultas que a
+tela inicial do usuário vai pedir, para elas estarem no cache do banco
+quando o login terminar.
 """
 
+from datetime import date
+
 from PyQt6.QtWidgets import QWidget, QMessageBox
 
 from uis.login_ui import Ui_LoginScreen
+from screens.agenda import intervalo_do_mes, meses_vizinhos
+from screens.assincrono import BancoAssincrono
 from screens.fundo import BackgroundWidget
+from screens.tabelas import TAMANHO_PAGINA
 from screens.utils import mostrar_alerta
 
 
+def _aquecer_cache(db, usuario):
+    """Roda no pool, em paralelo com o login: faz as mesmas leituras (com
+    os mesmos argumentos) que as telas abertas por MainApp.carregar_usuario
+    vão fazer, para elas saírem do cache. O resultado é descartado."""
+    perfil = db.perfil_para_login(usuario)
+    if perfil is None:
+        return
+    uid, tipo = perfil
+
+    if tipo == "admin":
+        db.obter_estatisticas_dashboard()
+        db.contar_usuarios()
+        db.contar_usuarios_por_tipo("pai")
+        db.contar_usuarios_por_tipo("psicologo")
+        db.listar_usuarios_pagina(TAMANHO_PAGINA, None, busca="")
+    elif tipo == "psicologo":
+        db.obter_estatisticas_psicologo(uid)
+        db.listar_alunos_pagina(TAMANHO_PAGINA, None, busca="")
+        hoje = date.today()
+        for ano, mes in meses_vizinhos(hoje.year, hoje.month):
+            db.compromissos_no_intervalo(uid, *intervalo_do_mes(ano, mes))
+    elif tipo == "pai":
+        db.alunos_do_pai(uid)
+
+
 class LoginScreen(QWidget):
-    def __init__(self, app, db):
+    def __init__(self, app, db=None):
         super().__init__()
         self.app = app
-        self.db = db
+        self.db = None
+        self.banco = None
 
         self.ui = Ui_LoginScreen()
         self.ui.setupUi(self)
@@ -30,7 +66,23 @@ class LoginScreen(QWidget):
 
         self.ui.bntContinuar.clicked.connect(self.login)
 
+        # A tela aparece antes do banco abrir (ver janela_qt.py): dá para ir
+        # digitando, mas "Entrar" espera o definir_banco()
+        if db is None:
+            self._definir_aguardando(True)
+            self.ui.inputUsuario.setEnabled(True)
+            self.ui.inputSenha.setEnabled(True)
+        else:
+            self.definir_banco(db)
+
+    def definir_banco(self, db):
+        self.db = db
+        self.banco = BancoAssincrono.compartilhado(db)
+        self._definir_aguardando(False)
+
     def login(self):
+        if self.db is None:
+            return
         usuario = self.ui.inputUsuario.text().strip()
         senha = self.ui.inputSenha.text().strip()
 
@@ -38,12 +90,36 @@ class LoginScreen(QWidget):
             mostrar_alerta(self, QMessageBox.Icon.Warning, "Erro", "Preencha todos os campos")
             return
 
-        resultado = self.db.login(usuario, senha)
+        self._definir_aguardando(True)
+        if self.db.cache_ativo:
+            self.banco.chamar("login.aquecimento", _aquecer_cache, self.db, usuario)
+        self.banco.chamar(
+            "login.autenticar", "login", usuario, senha,
+            ao_concluir=lambda resultado: self._login_concluido(resultado, senha),
+            ao_falhar=self._login_falhou,
+        )
+
+    def _definir_aguardando(self, aguardando):
+        self.ui.bntContinuar.setEnabled(not aguardando)
+        self.ui.inputUsuario.setEnabled(not aguardando)
+        self.ui.inputSenha.setEnabled(not aguardando)
+        self.ui.spinnerLogin.setVisible(aguardando)
+
+    def _login_concluido(self, resultado, senha):
+        self._definir_aguardando(False)
         if resultado:
             self.app.usuario_logado = resultado
             self.app.main_app.carregar_usuario(resultado)
+            # senha com custo antigo (ver politica_senha.py): troca o hash
+            # em segundo plano, depois das consultas da tela inicial
+            self.banco.chamar("login.rehash", "atualizar_hash_se_preciso", resultado["id"], senha)
             self.app.setCurrentIndex(1)
             self.ui.inputUsuario.clear()
             self.ui.inputSenha.clear()
         else:
             mostrar_alerta(self, QMessageBox.Icon.Warning, "Erro", "Usuário ou senha inválidos")
+
+    def _login_falhou(self, erro):
+        self._definir_aguardando(False)
+        mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
+                       f"Não foi possível entrar:\n{erro}")
@@ -6,25 +6,44 @@ Lógica da tela do responsável (pai/mãe) — "Meus Filhos".
 Este arquivo NÃO constrói nenhum widget diretamente — toda a interface
 visual vive em uis/pai_ui.py (classe Ui_PaiScreen). Aqui só ficam: carregar
 os alunos vinculados a este responsável e os relatórios do aluno
-selecionado, via database.py.
+selecionado, via database.py — em segundo plano (BancoAssincrono).
+
+Os relatórios aparecem como uma lista de prévias (paginada, como o
+histórico do psicólogo); o texto inteiro de um relatório só é lido quando
+ele é selecionado.
 """
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget, QTableWidgetItem
 
 from uis.pai_ui import Ui_PaiScreen
+from screens.assincrono import BancoAssincrono
+from screens.tabelas import TAMANHO_PREVIA, ModeloPaginado, indicar_carregamento, previa
 
 
 class PaiScreen(QWidget):
-    def __init__(self, db, app):
+    def __init__(self, db, app, tamanho_previa=TAMANHO_PREVIA):
         super().__init__()
         self.db = db
         self.app = app
+        self.banco = BancoAssincrono.compartilhado(db)
 
         self.ui = Ui_PaiScreen()
         self.ui.setupUi(self)
 
+        # linhas do modelo: (id, data, previa, tamanho)
+        self.tamanho_previa = tamanho_previa
+        self.modelo = ModeloPaginado([
+            ("Data", lambda r: str(r[1])),
+            ("Prévia", lambda r: previa(r[2], r[3], self.tamanho_previa)),
+        ], tamanho_pagina=50, parent=self, assincrono=self.banco)
+        self.ui.tabelaRelatorios.setModel(self.modelo)
+        self.ui.ajustar_colunas_relatorios()
+        indicar_carregamento(self.ui.tabelaRelatorios, self.modelo)
+        self.modelo.carregandoMudou.connect(self._relatorios_carregados)
+
         self.ui.tabelaFilhos.cellClicked.connect(self.carregar_relatorios)
+        self.ui.tabelaRelatorios.clicked.connect(lambda index: self.mostrar_relatorio(index.row()))
 
     # ------------------------------------------------------------------ #
     # API pública — chamada por main_app_qt.py
@@ -34,8 +53,19 @@ class PaiScreen(QWidget):
         if not self.app.usuario_logado:
             return
 
-        dados = self.db.alunos_do_pai(self.app.usuario_logado["id"])
+        self.modelo.limpar()
+        self.banco.cancelar("pai.relatorio")
+        self.ui.tabelaRelatorios.setVisible(False)
+        self.ui.labelRelatorios.setText("Selecione um aluno acima para ver os relatórios.")
+        self.ui.textRelatorios.clear()
+        self.ui.labelSemFilhos.setVisible(False)
+        self.banco.chamar(
+            "pai.filhos", "alunos_do_pai", self.app.usuario_logado["id"],
+            ao_concluir=self._mostrar_filhos,
+        )
 
+    # ------------------------------------------------------------------ #
+    def _mostrar_filhos(self, dados):
         tabela = self.ui.tabelaFilhos
         tabela.setRowCount(len(dados))
         for i, (id_, nome, sala, serie) in enumerate(dados):
@@ -46,23 +76,45 @@ class PaiScreen(QWidget):
 
         self.ui.labelSemFilhos.setVisible(len(dados) == 0)
         self.ui.tabelaFilhos.setVisible(len(dados) > 0)
-        self.ui.textRelatorios.clear()
 
-    # ------------------------------------------------------------------ #
     def carregar_relatorios(self, row, _column=0):
         item = self.ui.tabelaFilhos.item(row, 0)
         if not item:
             return
 
         aluno_id = item.data(Qt.ItemDataRole.UserRole)
-        rels = self.db.listar_relatorios_aluno(aluno_id)
-
-        if not rels:
-            self.ui.textRelatorios.setText("Nenhum relatório registrado para este aluno ainda.")
+        self.banco.cancelar("pai.relatorio")
+        self.ui.textRelatorios.clear()
+        self.ui.labelRelatorios.setText("Carregando relatórios…")
+        self.modelo.recarregar(
+            lambda cursor, tamanho: self.db.listar_previas_relatorios_pagina(
+                aluno_id, tamanho, cursor, tamanho_previa=self.tamanho_previa
+            )
+        )
+
+    def _relatorios_carregados(self, carregando):
+        if carregando:
             return
-
-        texto = ""
-        for conteudo, data in rels:
-            texto += f"📅 {data}\n{conteudo}\n\n"
-
-        self.ui.textRelatorios.setText(texto)
+        tem_relatorios = self.modelo.rowCount() > 0
+        self.ui.tabelaRelatorios.setVisible(tem_relatorios)
+        if tem_relatorios:
+            self.ui.labelRelatorios.setText("Selecione um relatório para ler o texto completo.")
+        else:
+            self.ui.labelRelatorios.setText("Nenhum relatório registrado para este aluno ainda.")
+
+    def mostrar_relatorio(self, row):
+        relatorio = self.modelo.linha(row)
+        if not relatorio:
+            return
+        relatorio_id, data, trecho, tamanho = relatorio
+        self.ui.textRelatorios.setText(f"📅 {data}\n\n{previa(trecho, tamanho, self.tamanho_previa)}")
+        self.banco.chamar(
+            "pai.relatorio", "obter_relatorio", relatorio_id,
+            ao_concluir=self._mostrar_texto_completo,
+        )
+
+    def _mostrar_texto_completo(self, relatorio):
+        if relatorio is None:
+            return
+        texto, data = relatorio
+        self.ui.textRelatorios.setText(f"📅 {data}\n\n{texto}")
@@ -8,13 +8,19 @@ visual vive em screens/psicologo_ui.py (classe Ui_PsicologoScreen). Aqui só
 ficam: conexões de sinal, validações e chamadas ao banco (database.py).
 """
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QTableWidgetItem, QMessageBox, QWidget
+import os
 
-from qfluentwidgets import PushButton
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QTableWidgetItem, QMessageBox, QWidget, QFileDialog
 
 from uis.psicologo_ui import Ui_PsicologoScreen
-from screens.utils import gravidade_para_db, gravidade_para_exibir, mostrar_alerta
+from screens.assincrono import BancoAssincrono, FilaTarefas
+from screens.exportacao import ExportacaoCancelada, exportar_prontuarios
+from screens.importacao import (
+    EXTENSOES, ErroImportacao, ImportacaoCancelada, ProgressoImportacao, importar_alunos,
+)
+from screens.tabelas import ModeloPaginado, indicar_carregamento
+from screens.utils import BuscaAdiada, gravidade_para_db, gravidade_para_exibir, mostrar_alerta
 
 
 class PsicologoScreen(QWidget):
@@ -27,10 +33,40 @@ class PsicologoScreen(QWidget):
         self.ui = Ui_PsicologoScreen()
         self.ui.setupUi(self)
 
+        self.modelo = ModeloPaginado([
+            ("Nome", lambda a: a[1]),
+            ("Sala", lambda a: a[2]),
+            ("Série", lambda a: a[3]),
+            ("Gravidade", lambda a: gravidade_para_exibir(a[4])),
+            ("Data", lambda a: a[5] or "---", lambda a: f"{a[6]} relatório(s) registrado(s)"),
+            ("Ações", None),
+        ], parent=self, assincrono=BancoAssincrono.compartilhado(db))
+        self.ui.tabelaAlunos.setModel(self.modelo)
+        self.ui.ajustar_colunas_alunos()
+        indicar_carregamento(self.ui.tabelaAlunos, self.modelo)
+
         self.ui.btnCadastrar.clicked.connect(self.cadastrar_aluno)
+        self.ui.btnImportar.clicked.connect(self.importar_planilha)
+        self.ui.btnCancelarImportacao.clicked.connect(self.cancelar_importacao)
+        self._progresso_importacao = None
+        # importação e exportação podem levar de segundos a minutos: cada
+        # uma roda numa fila própria, não nas threads das consultas
+        # (BancoAssincrono), que as tabelas e buscas usam
+        self.fila_importacao = FilaTarefas(parent=self)
+        self.ui.btnExportarTurma.clicked.connect(self.exportar_turma)
+        self.ui.btnCancelarExportacao.clicked.connect(self.cancelar_exportacao)
+        self._progresso_exportacao = None
+        self.fila_exportacao = FilaTarefas(parent=self)
         self.ui.btnLimpar.clicked.connect(self.limpar_tudo)
-        self.ui.inputBusca.textChanged.connect(self.filtrar_alunos)
-        self.ui.tabelaAlunos.cellDoubleClicked.connect(self.abrir_edicao)
+        self.busca = BuscaAdiada(self.ui.inputBusca, self.filtrar_alunos)
+        self.ui.tabelaAlunos.doubleClicked.connect(self.abrir_edicao)
+        self.ui.delegateExcluir.clicado.connect(
+            lambda row: self.excluir_aluno(self.modelo.linha(row)[0])
+        )
+        self.ui.inputBuscaRelatorios.searchSignal.connect(self.buscar_relatorios)
+        self.ui.inputBuscaRelatorios.returnPressed.connect(self.buscar_relatorios)
+        self.ui.inputBuscaRelatorios.clearSignal.connect(self.limpar_busca_relatorios)
+        self.ui.tabelaBuscaRelatorios.cellDoubleClicked.connect(self.abrir_historico_da_busca)
 
         self.atualizar()
 
@@ -38,33 +74,61 @@ class PsicologoScreen(QWidget):
     # API pública — chamada por main_app_qt.py
     # ------------------------------------------------------------------ #
     def atualizar(self):
-        self.filtrar_alunos()
+        self.busca.disparar_agora()
 
     # ------------------------------------------------------------------ #
-    def filtrar_alunos(self):
-        texto = self.ui.inputBusca.text().strip().lower()
-        alunos = self.db.listar_alunos()
-        if texto:
-            alunos = [a for a in alunos if texto in a[1].lower()]
-
-        tabela = self.ui.tabelaAlunos
-        tabela.setRowCount(len(alunos))
-        for i, (id_, nome, sala, serie, gravidade) in enumerate(alunos):
-            tabela.setItem(i, 0, QTableWidgetItem(nome))
-            tabela.setItem(i, 1, QTableWidgetItem(sala))
-            tabela.setItem(i, 2, QTableWidgetItem(serie))
-            tabela.setItem(i, 3, QTableWidgetItem(gravidade_para_exibir(gravidade)))
-            tabela.setItem(i, 4, QTableWidgetItem(self._obter_ultima_data_relatorio(id_)))
-
-            btn_excluir = PushButton("Excluir")
-            btn_excluir.clicked.connect(lambda checked, aid=id_: self.excluir_aluno(aid))
-            tabela.setCellWidget(i, 5, btn_excluir)
-
-            tabela.item(i, 0).setData(Qt.ItemDataRole.UserRole, id_)
-
-    def _obter_ultima_data_relatorio(self, aluno_id):
-        relatorios = self.db.listar_relatorios_aluno(aluno_id)
-        return relatorios[0][1] if relatorios else "---"
+    def filtrar_alunos(self, texto, geracao):
+        """Chamada pela BuscaAdiada quando o usuário para de digitar.
+        A tabela busca as linhas em páginas, conforme rola."""
+        if not self.busca.eh_atual(geracao):
+            return
+        self.modelo.recarregar(
+            lambda cursor, tamanho: self.db.listar_alunos_pagina(tamanho, cursor, busca=texto)
+        )
+
+    def buscar_relatorios(self, *_):
+        """Busca de texto completo nos relatórios de todos os alunos."""
+        consulta = self.ui.inputBuscaRelatorios.text().strip()
+        if not consulta:
+            self.limpar_busca_relatorios()
+            return
+
+        self.ui.labelBuscaRelatorios.setText("Buscando…")
+        self.ui.labelBuscaRelatorios.setVisible(True)
+        BancoAssincrono.compartilhado(self.db).chamar(
+            "psicologo.busca_relatorios", "buscar_relatorios", consulta, limite=100,
+            ao_concluir=self._mostrar_busca_relatorios,
+        )
+
+    def _mostrar_busca_relatorios(self, resultados):
+        tabela = self.ui.tabelaBuscaRelatorios
+        tabela.setRowCount(len(resultados))
+        for i, (_rel_id, aluno_id, nome, data, trecho) in enumerate(resultados):
+            tabela.setItem(i, 0, QTableWidgetItem(str(data)))
+            tabela.setItem(i, 1, QTableWidgetItem(nome or "—"))
+            tabela.setItem(i, 2, QTableWidgetItem(" ".join(trecho.split())))
+            tabela.item(i, 1).setData(Qt.ItemDataRole.UserRole, aluno_id)
+
+        if resultados:
+            self.ui.labelBuscaRelatorios.setText(
+                f"{len(resultados)} relatório(s) encontrado(s) — dê dois cliques para abrir o histórico."
+            )
+        else:
+            self.ui.labelBuscaRelatorios.setText("Nenhum relatório encontrado.")
+        self.ui.labelBuscaRelatorios.setVisible(True)
+        tabela.setVisible(bool(resultados))
+
+    def limpar_busca_relatorios(self):
+        BancoAssincrono.compartilhado(self.db).cancelar("psicologo.busca_relatorios")
+        self.ui.tabelaBuscaRelatorios.setRowCount(0)
+        self.ui.tabelaBuscaRelatorios.setVisible(False)
+        self.ui.labelBuscaRelatorios.setVisible(False)
+
+    def abrir_historico_da_busca(self, row, _column):
+        item_aluno = self.ui.tabelaBuscaRelatorios.item(row, 1)
+        if not item_aluno or item_aluno.data(Qt.ItemDataRole.UserRole) is None:
+            return
+        self.main_app.abrir_historico(item_aluno.data(Qt.ItemDataRole.UserRole), item_aluno.text())
 
     def cadastrar_aluno(self):
         nome = self.ui.inputNome.text().strip()
@@ -85,6 +149,131 @@ class PsicologoScreen(QWidget):
         self.limpar_campos_cadastro()
         self.atualizar()
 
+    def importar_planilha(self):
+        """Cadastro em massa a partir de um .csv/.xlsx (ver screens/importacao.py).
+        Roda em segundo plano, com barra de progresso e opção de cancelar."""
+        caminho, _ = QFileDialog.getOpenFileName(
+            self, "Importar alunos", "", f"Planilhas ({' '.join(EXTENSOES)})"
+        )
+        if not caminho:
+            return
+
+        self._progresso_importacao = ProgressoImportacao(self)
+        self._progresso_importacao.avancou.connect(self.ui.barraImportacao.setValue)
+
+        self.ui.barraImportacao.setValue(0)
+        self.ui.labelImportacao.setText(f"Importando {os.path.basename(caminho)}...")
+        self.ui.frameImportacao.setVisible(True)
+        self.ui.btnImportar.setEnabled(False)
+
+        self.fila_importacao.enfileirar(
+            importar_alunos, self.db, caminho, self._progresso_importacao,
+            ao_concluir=self._importacao_concluida, ao_falhar=self._importacao_falhou,
+        )
+
+    def cancelar_importacao(self):
+        if self._progresso_importacao is not None:
+            self._progresso_importacao.cancelar()
+            self.ui.labelImportacao.setText("Cancelando...")
+
+    def _encerrar_importacao(self):
+        self.ui.frameImportacao.setVisible(False)
+        self.ui.btnImportar.setEnabled(True)
+        if self._progresso_importacao is not None:
+            self._progresso_importacao.deleteLater()
+            self._progresso_importacao = None
+
+    def _importacao_concluida(self, resultado):
+        self._encerrar_importacao()
+        self.atualizar()
+
+        if not (resultado.erros or resultado.duplicados):
+            mostrar_alerta(self, QMessageBox.Icon.Information, "Importação concluída", resultado.resumo())
+            return
+
+        texto = resultado.resumo()
+        if resultado.erros:
+            texto += "\n\n" + "\n".join(f"Linha {linha}: {motivo}" for linha, motivo in resultado.erros[:5])
+            if len(resultado.erros) > 5:
+                texto += "\n..."
+        texto += "\n\nDeseja salvar a lista completa das linhas ignoradas?"
+
+        botoes = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        resposta = mostrar_alerta(self, QMessageBox.Icon.Warning, "Importação concluída", texto, botoes)
+        if resposta != QMessageBox.StandardButton.Yes:
+            return
+
+        caminho, _ = QFileDialog.getSaveFileName(
+            self, "Salvar linhas ignoradas", "importacao_linhas_ignoradas.csv", "CSV (*.csv)"
+        )
+        if caminho:
+            resultado.salvar_relatorio(caminho)
+
+    def _importacao_falhou(self, erro):
+        self._encerrar_importacao()
+        if isinstance(erro, ImportacaoCancelada):
+            mostrar_alerta(self, QMessageBox.Icon.Information, "Importação cancelada",
+                           "Nenhum aluno foi importado.")
+        elif isinstance(erro, ErroImportacao):
+            mostrar_alerta(self, QMessageBox.Icon.Warning, "Erro", str(erro))
+        else:
+            mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
+                           f"Não foi possível importar a planilha:\n{erro}")
+
+    def exportar_turma(self):
+        """Prontuário em PDF de cada aluno da sala/série/gravidade escolhida
+        (ver screens/exportacao.py). Roda em segundo plano, com barra de
+        progresso e opção de cancelar."""
+        sala = self.ui.inputSalaExportacao.text().strip()
+        serie = self.ui.inputSerieExportacao.text().strip()
+        gravidade = None
+        if self.ui.comboGravidadeExportacao.currentIndex() > 0:
+            gravidade = gravidade_para_db(self.ui.comboGravidadeExportacao.currentText())
+
+        self._progresso_exportacao = ProgressoImportacao(self)
+        self._progresso_exportacao.avancou.connect(self.ui.barraExportacao.setValue)
+
+        self.ui.barraExportacao.setValue(0)
+        self.ui.labelExportacao.setText("Exportando prontuários...")
+        self.ui.frameExportacao.setVisible(True)
+        self.ui.btnExportarTurma.setEnabled(False)
+
+        self.fila_exportacao.enfileirar(
+            exportar_prontuarios, self.db, sala, serie, gravidade, self._progresso_exportacao,
+            ao_concluir=self._exportacao_concluida, ao_falhar=self._exportacao_falhou,
+        )
+
+    def cancelar_exportacao(self):
+        if self._progresso_exportacao is not None:
+            self._progresso_exportacao.cancelar()
+            self.ui.labelExportacao.setText("Cancelando...")
+
+    def _encerrar_exportacao(self):
+        self.ui.frameExportacao.setVisible(False)
+        self.ui.btnExportarTurma.setEnabled(True)
+        if self._progresso_exportacao is not None:
+            self._progresso_exportacao.deleteLater()
+            self._progresso_exportacao = None
+
+    def _exportacao_concluida(self, resultado):
+        self._encerrar_exportacao()
+        if not resultado.falhas:
+            mostrar_alerta(self, QMessageBox.Icon.Information, "Exportação concluída", resultado.resumo())
+            return
+        texto = resultado.resumo() + "\n\n" + "\n".join(
+            f"{os.path.basename(caminho)}: {erro}" for caminho, erro in resultado.falhas[:5]
+        )
+        mostrar_alerta(self, QMessageBox.Icon.Warning, "Exportação concluída", texto)
+
+    def _exportacao_falhou(self, erro):
+        self._encerrar_exportacao()
+        if isinstance(erro, ExportacaoCancelada):
+            mostrar_alerta(self, QMessageBox.Icon.Information, "Exportação cancelada",
+                           "Os prontuários já gerados continuam na pasta Documentos/SISPE/Relatorios.")
+        else:
+            mostrar_alerta(self, QMessageBox.Icon.Critical, "Erro",
+                           f"Não foi possível exportar os prontuários:\n{erro}")
+
     def excluir_aluno(self, aluno_id):
         botoes = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         confirm = mostrar_alerta(
@@ -95,15 +284,14 @@ class PsicologoScreen(QWidget):
             self.db.excluir_aluno(aluno_id)
             self.atualizar()
 
-    def abrir_edicao(self, row, _column):
-        item_nome = self.ui.tabelaAlunos.item(row, 0)
-        if not item_nome:
+    def abrir_edicao(self, index):
+        aluno = self.modelo.linha(index.row())
+        if not aluno:
             return
-        self.abrir_edicao_por_id(item_nome.data(Qt.ItemDataRole.UserRole))
+        self.abrir_edicao_por_id(aluno[0])
 
     def abrir_edicao_por_id(self, aluno_id):
-        alunos = self.db.listar_alunos()
-        aluno = next((a for a in alunos if a[0] == aluno_id), None)
+        aluno = self.db.obter_aluno(aluno_id)
         if not aluno:
             return
         _, nome, sala, serie, gravidade = aluno
@@ -0,0 +1,74 @@
+"""
+screens/registro_telas.py
+==========================
+Registro das telas internas do MainApp, construídas só quando são usadas.
+
+Cada tela é registrada com uma "fábrica" (função sem argumentos que a
+constrói). obter(nome) constrói na primeira vez, coloca no stackedWidget
+e devolve a mesma instância dali em diante. Um responsável só usa duas das
+oito telas; as outras nunca chegam a existir — nem a montar widgets, nem
+a consultar o banco no construtor.
+
+pre_construir(nomes) adianta a construção das telas que o usuário logado
+provavelmente vai abrir, uma por vez, quando o laço de eventos está ocioso
+(QTimer de 0 ms): o clique no menu encontra a tela pronta, sem travar a
+troca de tela que acabou de acontecer.
+
+O tempo de construção de cada tela fica em custos (nome -> segundos) e vai
+para o log "sispe.telas".
+"""
+
+import logging
+import time
+
+from PyQt6.QtCore import QObject, QTimer
+
+_log = logging.getLogger("sispe.telas")
+
+
+class RegistroTelas(QObject):
+    def __init__(self, stacked, parent=None):
+        super().__init__(parent)
+        self._stacked = stacked
+        self._fabricas = {}
+        self._telas = {}
+        self._fila = []
+        self.custos = {}
+
+    def registrar(self, nome, fabrica):
+        self._fabricas[nome] = fabrica
+
+    def construida(self, nome):
+        return nome in self._telas
+
+    def obter(self, nome):
+        tela = self._telas.get(nome)
+        if tela is None:
+            inicio = time.perf_counter()
+            tela = self._fabricas[nome]()
+            self._stacked.addWidget(tela)
+            self._telas[nome] = tela
+            self.custos[nome] = time.perf_counter() - inicio
+            _log.info("tela %s construída em %.1f ms", nome, self.custos[nome] * 1000)
+        return tela
+
+    def pre_construir(self, nomes):
+        """Agenda a construção das telas ainda não construídas, uma por
+        ciclo ocioso do laço de eventos, na ordem dada."""
+        parado = not self._fila
+        self._fila.extend(n for n in nomes if n not in self._telas and n not in self._fila)
+        if parado and self._fila:
+            QTimer.singleShot(0, self._construir_proxima)
+
+    def _construir_proxima(self):
+        if not self._fila:
+            return
+        self.obter(self._fila.pop(0))
+        if self._fila:
+            QTimer.singleShot(0, self._construir_proxima)
+
+    def relatorio_custos(self):
+        """Linhas "nome: x ms" das telas já construídas, da mais cara para
+        a mais barata."""
+        return [f"{nome}: {segundos * 1000:.1f} ms"
+                for nome, segundos in sorted(self.custos.items(), key=lambda item: -item[1])]
@@ -0,0 +1,270 @@
+"""
+screens/tabelas.py
+===================
+Peças reutilizáveis para as tabelas de listagem (model/view).
+
+- ModeloPaginado: QAbstractTableModel que busca as linhas no banco aos
+  poucos, uma página por vez, conforme a tabela rola (canFetchMore /
+  fetchMore). Abrir uma lista de 20 mil alunos custa uma página, não 20
+  mil linhas.
+- DelegateBotaoAcao: pinta um botão ("Excluir", "Desvincular"...) dentro
+  da célula e avisa qual linha foi clicada. Substitui o antigo
+  setCellWidget com um PushButton de verdade por linha — agora é um único
+  delegate por coluna, não importa quantas linhas existam.
+
+Nenhuma consulta acontece aqui: quem sabe buscar uma página é a tela, que
+passa uma função carregar_pagina(cursor, tamanho) -> (linhas, proximo_cursor)
+apontando para um método *_pagina do DatabaseManager. Com um
+BancoAssincrono, essa função roda fora da thread da interface.
+"""
+
+import sys
+import traceback
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QCursor, QPainter, QPen
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle
+
+from screens.theme import CORES
+
+# linhas por página quando a tela não pede outro tamanho
+TAMANHO_PAGINA = 100
+
+# caracteres do texto de um relatório que vêm do banco para a coluna
+# "Prévia" (DatabaseManager.listar_previas_relatorios_pagina)
+TAMANHO_PREVIA = 80
+
+
+def previa(trecho, tamanho, tamanho_previa=TAMANHO_PREVIA):
+    """Texto da coluna "Prévia": o trecho vindo do banco, numa linha só e
+    com reticências se o relatório (de `tamanho` caracteres) for maior que
+    a prévia. tamanho_previa tem de ser o mesmo pedido à consulta."""
+    trecho = " ".join(trecho.split())
+    return trecho if tamanho <= tamanho_previa else trecho.rstrip() + "..."
+
+
+class ModeloPaginado(QAbstractTableModel):
+    """Modelo de tabela somente leitura alimentado por páginas.
+
+    colunas: lista de (titulo, valor) ou (titulo, valor, dica), onde valor
+    e dica recebem a linha (tupla vinda do banco) e devolvem o texto da
+    célula / do tooltip. valor=None deixa a célula vazia (ex: coluna de
+    ações, pintada por um DelegateBotaoAcao).
+
+    carregar_pagina(cursor, tamanho) devolve (linhas, proximo_cursor);
+    proximo_cursor None indica que não há mais páginas. O cursor é opaco
+    para o modelo — ele só devolve o que recebeu na página anterior.
+
+    Com assincrono (um BancoAssincrono), cada página é buscada no pool e
+    entra na tabela quando chega; carregandoMudou(bool) avisa a tela para
+    mostrar o estado de carregamento. Uma recarga no meio do caminho
+    descarta a página que estava a caminho."""
+
+    carregandoMudou = pyqtSignal(bool)
+
+    def __init__(self, colunas, carregar_pagina=None, tamanho_pagina=TAMANHO_PAGINA, parent=None, assincrono=None):
+        super().__init__(parent)
+        self._colunas = colunas
+        self._carregar_pagina = carregar_pagina
+        self._tamanho_pagina = tamanho_pagina
+        self._assincrono = assincrono
+        self._chave = f"modelo.{id(self)}"
+        self._linhas = []
+        self._cursor = None
+        self._fim = True
+        self._carregando = False
+
+    # ------------------------------------------------------------------ #
+    # API usada pelas telas
+    # ------------------------------------------------------------------ #
+    def recarregar(self, carregar_pagina=None):
+        """Descarta as linhas carregadas e busca de novo a primeira página
+        (opcionalmente trocando a fonte — ex: um novo texto de busca)."""
+        if carregar_pagina is not None:
+            self._carregar_pagina = carregar_pagina
+
+        if self._assincrono is not None:
+            self._assincrono.cancelar(self._chave)
+        self._definir_carregando(False)
+
+        self.beginResetModel()
+        self._linhas = []
+        self._cursor = None
+        self._fim = self._carregar_pagina is None
+        self.endResetModel()
+
+        if not self._fim:
+            self.fetchMore(QModelIndex())
+
+    def limpar(self):
+        """Esvazia a tabela e esquece a fonte, até o próximo recarregar()."""
+        self._carregar_pagina = None
+        self.recarregar()
+
+    def linha(self, row):
+        """Tupla original (do banco) exibida na linha `row`, ou None."""
+        if 0 <= row < len(self._linhas):
+            return self._linhas[row]
+        return None
+
+    def carregando(self):
+        return self._carregando
+
+    def _definir_carregando(self, valor):
+        if valor != self._carregando:
+            self._carregando = valor
+            self.carregandoMudou.emit(valor)
+
+    # ------------------------------------------------------------------ #
+    # QAbstractTableModel
+    # ------------------------------------------------------------------ #
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._linhas)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._colunas)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        linha = self._linhas[index.row()]
+        coluna = self._colunas[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            valor = coluna[1]
+            return None if valor is None else valor(linha)
+        if role == Qt.ItemDataRole.ToolTipRole and len(coluna) > 2 and coluna[2]:
+            return coluna[2](linha)
+        if role == Qt.ItemDataRole.UserRole:
+            return linha
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._colunas[section][0]
+        return None
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and not self._fim
+
+    def fetchMore(self, parent):
+        if parent.isValid() or self._fim or self._carregando:
+            return
+
+        if self._assincrono is None:
+            self._receber_pagina(self._carregar_pagina(self._cursor, self._tamanho_pagina))
+            return
+
+        self._definir_carregando(True)
+        self._assincrono.chamar(
+            self._chave, self._carregar_pagina, self._cursor, self._tamanho_pagina,
+            ao_concluir=self._receber_pagina, ao_falhar=self._falha_pagina,
+        )
+
+    def _falha_pagina(self, erro):
+        # para de tentar (senão a view pediria a mesma página de novo a cada
+        # rolagem) e registra o erro no console
+        self._definir_carregando(False)
+        self._fim = True
+        traceback.print_exception(type(erro), erro, erro.__traceback__, file=sys.stderr)
+
+    def _receber_pagina(self, pagina):
+        linhas, proximo = pagina
+        self._cursor = proximo
+        self._fim = proximo is None
+
+        if linhas:
+            inicio = len(self._linhas)
+            self.beginInsertRows(QModelIndex(), inicio, inicio + len(linhas) - 1)
+            self._linhas.extend(linhas)
+            self.endInsertRows()
+
+        # só depois das linhas entrarem, para quem ouve o sinal já vê-las
+        self._definir_carregando(False)
+
+
+def indicar_carregamento(tabela, modelo):
+    """Cursor de "ocupado" sobre a tabela enquanto o modelo busca uma página
+    em segundo plano — a tabela continua rolável e clicável."""
+    def _mudou(carregando):
+        if carregando:
+            tabela.viewport().setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            tabela.viewport().unsetCursor()
+    modelo.carregandoMudou.connect(_mudou)
+
+
+class DelegateBotaoAcao(QStyledItemDelegate):
+    """Pinta um botão de ação centralizado na célula e emite clicado(row)
+    quando ele é clicado. Usado com setItemDelegateForColumn na coluna
+    "Ações" das tabelas.
+
+    O fundo da célula (hover/seleção da linha) continua sendo pintado pelo
+    delegate padrão da TableView Fluent, para a coluna não destoar do
+    resto da linha."""
+
+    clicado = pyqtSignal(int)
+
+    _ALTURA = 32
+    _PADDING_H = 14
+
+    def __init__(self, texto, tabela):
+        super().__init__(tabela)
+        self._texto = texto
+        self._tabela = tabela
+        self._linha_pressionada = -1
+
+    def _retangulo_botao(self, option):
+        largura = option.fontMetrics.horizontalAdvance(self._texto) + 2 * self._PADDING_H
+        altura = min(self._ALTURA, option.rect.height() - 4)
+        ret = QRect(0, 0, min(largura, option.rect.width() - 8), altura)
+        ret.moveCenter(option.rect.center())
+        return ret
+
+    def sizeHint(self, option, index):
+        largura = option.fontMetrics.horizontalAdvance(self._texto) + 2 * self._PADDING_H
+        return QSize(largura + 16, self._ALTURA + 8)
+
+    def paint(self, painter, option, index):
+        base = self._tabela.itemDelegate()
+        if base is not None and base is not self:
+            base.paint(painter, QStyleOptionViewItem(option), index)
+
+        ret = self._retangulo_botao(option)
+        sobre = bool(option.state & QStyle.StateFlag.State_MouseOver) and ret.contains(
+            self._tabela.viewport().mapFromGlobal(QCursor.pos())
+        )
+        pressionado = sobre and self._linha_pressionada == index.row()
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if pressionado:
+            painter.setBrush(QColor(CORES["cinza_claro"]))
+        elif sobre:
+            painter.setBrush(QColor(CORES["azul_claro"]))
+        else:
+            painter.setBrush(QColor(CORES["branco"]))
+        painter.setPen(QPen(QColor(CORES["azul"] if sobre else CORES["cinza_medio"]), 1))
+        painter.drawRoundedRect(ret.adjusted(0, 0, -1, -1), 6, 6)
+
+        painter.setPen(QColor(CORES["azul_escuro"] if sobre else CORES["texto"]))
+        painter.drawText(ret, Qt.AlignmentFlag.AlignCenter, self._texto)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        tipo = event.type()
+        if tipo not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        dentro = self._retangulo_botao(option).contains(event.position().toPoint())
+        if tipo == QEvent.Type.MouseButtonPress:
+            self._linha_pressionada = index.row() if dentro else -1
+            return dentro
+
+        clicou = dentro and self._linha_pressionada == index.row()
+        self._linha_pressionada = -1
+        if clicou:
+            self.clicado.emit(index.row())
+        return clicou
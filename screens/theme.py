@@ -10,7 +10,7 @@ qualquer tela sem risco de efeitos colaterais.
 
 COMO USAR
 ---------
-1) Estilo global (aplicado uma única vez, em main.py):
+1) Estilo global (aplicado uma única vez, em janela_qt.py):
        from screens.theme import GLOBAL_STYLESHEET
        app.setStyleSheet(GLOBAL_STYLESHEET)
 
@@ -256,7 +256,7 @@ def estilo_tag_secao(radius=10):
 
 
 # ---------------------------------------------------------------------------
-# ESTILO GLOBAL — aplicado uma única vez em toda a QApplication (main.py).
+# ESTILO GLOBAL — aplicado uma única vez em toda a QApplication (janela_qt.py).
 # Cobre elementos que hoje NÃO têm styleSheet próprio nos arquivos .ui
 # (ex: botões "Editar"/"Excluir" criados dinamicamente em Python), além de
 # padronizar scrollbars, inputs e o "look" básico de qualquer widget novo.
@@ -4,15 +4,10 @@ import sys
 import unicodedata
 from datetime import datetime
 
+from PyQt6.QtCore import QObject, QTimer
 from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QMessageBox
 from PyQt6.QtGui import QColor
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-
 from screens.theme import CORES
 
 
@@ -55,6 +50,45 @@ def mostrar_alerta(parent, tipo, titulo, texto, botoes=QMessageBox.StandardButto
     return msg.exec()
 
 
+# ---------- Busca: agrupa as teclas digitadas antes de consultar o banco ----------
+
+class BuscaAdiada(QObject):
+    """Liga um campo de busca a uma função de consulta, com "debounce":
+    cada tecla reinicia um temporizador curto e só quando o usuário para de
+    digitar é que ao_buscar(texto, geracao) é chamada — uma consulta por
+    pausa, não uma por caractere.
+
+    Cada disparo recebe um número de geração crescente. Quem recebe o
+    resultado depois (ex: de uma consulta que terminou atrasada) confere
+    com eh_atual(geracao) e descarta respostas que já foram superadas."""
+
+    def __init__(self, campo, ao_buscar, intervalo_ms=220):
+        super().__init__(campo)
+        self._campo = campo
+        self._ao_buscar = ao_buscar
+        self._geracao = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(intervalo_ms)
+        self._timer.timeout.connect(self._disparar)
+
+        # start() num temporizador ativo reinicia a contagem
+        campo.textChanged.connect(lambda _texto: self._timer.start())
+
+    def disparar_agora(self):
+        """Consulta imediatamente (ex: ao abrir a tela ou depois de um cadastro)."""
+        self._timer.stop()
+        self._disparar()
+
+    def eh_atual(self, geracao):
+        return geracao == self._geracao
+
+    def _disparar(self):
+        self._geracao += 1
+        self._ao_buscar(self._campo.text().strip(), self._geracao)
+
+
 # ---------- Gravidade: mantém consistência entre telas e banco de dados ----------
 
 GRAVIDADE_EXIBIR = {"baixo": "Baixo", "medio": "Médio", "grave": "Grave"}
@@ -108,27 +142,18 @@ def gerar_pdf_relatorio(aluno, texto_relatorio, psicologo_username=None, data_ho
     nome_arquivo = f"relatorio_{data_hora.strftime('%Y-%m-%d_%Hh%M')}.pdf"
     caminho = os.path.join(pasta, nome_arquivo)
 
-    styles = getSampleStyleSheet()
-    titulo_style = ParagraphStyle(
-        "TituloSISPE", parent=styles["Title"], fontSize=18, textColor=colors.HexColor("#1e293b")
-    )
-    label_style = ParagraphStyle(
-        "LabelSISPE", parent=styles["Normal"], fontSize=10, textColor=colors.HexColor("#64748b")
-    )
-    corpo_style = ParagraphStyle(
-        "CorpoSISPE", parent=styles["Normal"], fontSize=12, leading=18,
-        textColor=colors.HexColor("#1e293b")
-    )
-
-    doc = SimpleDocTemplate(
-        caminho, pagesize=A4,
-        leftMargin=2.5 * cm, rightMargin=2.5 * cm, topMargin=2 * cm, bottomMargin=2 * cm
-    )
-    story = []
-
-    story.append(Paragraph("Relatório de Atendimento Psicológico", titulo_style))
-    story.append(Paragraph("Sistema SISPE", label_style))
-    story.append(Spacer(1, 16))
+    # O reportlab só é importado aqui, na primeira vez que um PDF é gerado:
+    # importá-lo com o módulo custaria ~0,1 s na abertura de todas as telas
+    # (ver python main.py --tempo-importacao).
+    from reportlab.platypus import Paragraph, Spacer
+    import prontuario_pdf
+
+    e = prontuario_pdf.estilos()
+    story = [
+        Paragraph("Relatório de Atendimento Psicológico", e["titulo"]),
+        Paragraph("Sistema SISPE", e["label"]),
+        Spacer(1, 16),
+    ]
 
     dados_aluno = [
         ["Aluno", aluno.get("nome", "-")],
@@ -140,35 +165,14 @@ def gerar_pdf_relatorio(aluno, texto_relatorio, psicologo_username=None, data_ho
     if psicologo_username:
         dados_aluno.append(["Psicólogo(a) responsável", psicologo_username])
 
-    tabela = Table(dados_aluno, colWidths=[5 * cm, 10 * cm])
-    tabela.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#f0f4f8")),
-        ("TEXTCOLOR", (0, 0), (0, -1), colors.HexColor("#374151")),
-        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, -1), 10),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING", (0, 0), (-1, -1), 8),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-        ("LEFTPADDING", (0, 0), (-1, -1), 10),
-    ]))
-    story.append(tabela)
+    story.append(prontuario_pdf.tabela_dados(dados_aluno))
     story.append(Spacer(1, 20))
 
-    story.append(Paragraph("Relatório", ParagraphStyle(
-        "SubtituloSISPE", parent=styles["Heading2"], fontSize=13, textColor=colors.HexColor("#1e293b")
-    )))
+    story.append(Paragraph("Relatório", e["subtitulo"]))
     story.append(Spacer(1, 8))
+    story.extend(prontuario_pdf.paragrafos(texto_relatorio, e["corpo"]))
 
-    for paragrafo in texto_relatorio.split("\n"):
-        if paragrafo.strip():
-            texto_seguro = (
-                paragrafo.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            )
-            story.append(Paragraph(texto_seguro, corpo_style))
-            story.append(Spacer(1, 6))
-
-    doc.build(story)
+    prontuario_pdf.documento(caminho).build(story)
     return caminho
 def resolver_caminho(caminho_relativo):
     """Retorna o caminho absoluto para o arquivo, funcionando em modo de desenvolvimento ou no .exe"""
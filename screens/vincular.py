@@ -9,23 +9,42 @@ ficam: conexões de sinal, validações e chamadas ao banco (database.py).
 Nenhum SQL cru fica nesta tela — tudo passa por métodos do DatabaseManager.
 """
 
-from PyQt6.QtWidgets import QWidget, QTableWidgetItem, QMessageBox
-
-from qfluentwidgets import PushButton
+from PyQt6.QtWidgets import QWidget, QMessageBox
 
 from uis.vincular_ui import Ui_VincularScreen
-from screens.utils import mostrar_alerta
+from screens.assincrono import BancoAssincrono
+from screens.tabelas import ModeloPaginado, indicar_carregamento
+from screens.utils import BuscaAdiada, mostrar_alerta
+
+# Quantos alunos o combo mostra de cada vez: os primeiros (em ordem de
+# nome) que passam na busca. Para achar os outros, digita-se o nome.
+LIMITE_ALUNOS_COMBO = 50
 
 
 class VincularScreen(QWidget):
     def __init__(self, db):
         super().__init__()
         self.db = db
+        self.banco = BancoAssincrono.compartilhado(db)
 
         self.ui = Ui_VincularScreen()
         self.ui.setupUi(self)
 
+        self.modelo = ModeloPaginado([
+            ("Responsável", lambda v: v[1]),
+            ("Aluno", lambda v: v[3]),
+            ("Ações", None),
+        ], carregar_pagina=lambda cursor, tamanho: self.db.listar_vinculos_pagina(tamanho, cursor),
+            parent=self, assincrono=self.banco)
+        self.ui.tabelaVinculos.setModel(self.modelo)
+        self.ui.ajustar_colunas_vinculos()
+        indicar_carregamento(self.ui.tabelaVinculos, self.modelo)
+        self.ui.delegateDesvincular.clicado.connect(
+            lambda row: self.desvincular(self.modelo.linha(row)[0])
+        )
+
         self.ui.btnVincular.clicked.connect(self.vincular)
+        self.busca_aluno = BuscaAdiada(self.ui.inputBuscaAluno, self.carregar_alunos)
 
         self.atualizar()
 
@@ -38,47 +57,62 @@ class VincularScreen(QWidget):
 
     # ------------------------------------------------------------------ #
     def carregar_combos(self):
-        """Popula os comboboxes de pais e alunos disponíveis, preservando
-        a seleção atual quando possível (ex: depois de criar um vínculo)."""
-        pai_atual = self.ui.comboPai.currentData()
-        aluno_atual = self.ui.comboAluno.currentData()
+        """Popula os comboboxes de pais e alunos, em segundo plano,
+        preservando a seleção atual quando possível (ex: depois de criar um
+        vínculo)."""
+        self.banco.chamar("vincular.pais", "listar_pais", ao_concluir=self._mostrar_pais)
+        self.busca_aluno.disparar_agora()
+
+    def carregar_alunos(self, texto, geracao):
+        """Chamada pela BuscaAdiada: traz só a primeira página de alunos
+        que passam na busca, não a lista inteira da escola."""
+        self.banco.chamar(
+            "vincular.alunos", "listar_alunos_pagina", LIMITE_ALUNOS_COMBO, None, busca=texto,
+            ao_concluir=lambda pagina: self._mostrar_alunos(pagina, geracao),
+        )
 
-        # IMPORTANTE: o ComboBox do PyQt6-Fluent-Widgets tem a assinatura
-        # addItem(text, icon=None, userData=None) — diferente do QComboBox
-        # puro. Passar o id como segundo argumento posicional faz ele cair
-        # no parâmetro "icon" (e quebrar ao abrir o dropdown). Por isso
-        # userData vai sempre por nome aqui.
+    # IMPORTANTE: o ComboBox do PyQt6-Fluent-Widgets tem a assinatura
+    # addItem(text, icon=None, userData=None) — diferente do QComboBox
+    # puro. Passar o id como segundo argumento posicional faz ele cair no
+    # parâmetro "icon" (e quebrar ao abrir o dropdown). Por isso userData
+    # vai sempre por nome aqui.
+    def _mostrar_pais(self, pais):
+        pai_atual = self.ui.comboPai.currentData()
         self.ui.comboPai.clear()
-        for pai_id, username in self.db.listar_pais():
+        for pai_id, username in pais:
             self.ui.comboPai.addItem(username, userData=pai_id)
+        self._restaurar_selecao(self.ui.comboPai, pai_atual)
 
+    def _mostrar_alunos(self, pagina, geracao):
+        if not self.busca_aluno.eh_atual(geracao):
+            return
+        alunos, proximo = pagina
+        aluno_atual = self.ui.comboAluno.currentData()
         self.ui.comboAluno.clear()
-        for aluno_id, nome, sala, serie, gravidade in self.db.listar_alunos():
+        for aluno_id, nome, sala, serie, *_resumo in alunos:
             self.ui.comboAluno.addItem(f"{nome} ({sala} - {serie})", userData=aluno_id)
+        self._restaurar_selecao(self.ui.comboAluno, aluno_atual)
 
-        if pai_atual is not None:
-            idx = self.ui.comboPai.findData(pai_atual)
-            if idx >= 0:
-                self.ui.comboPai.setCurrentIndex(idx)
-        if aluno_atual is not None:
-            idx = self.ui.comboAluno.findData(aluno_atual)
+        self.ui.labelAvisoAlunos.setText(
+            f"Mostrando os {LIMITE_ALUNOS_COMBO} primeiros alunos. "
+            "Digite o nome na busca para encontrar os outros."
+        )
+        self.ui.labelAvisoAlunos.setVisible(proximo is not None)
+
+    @staticmethod
+    def _restaurar_selecao(combo, dado):
+        if dado is not None:
+            idx = combo.findData(dado)
             if idx >= 0:
-                self.ui.comboAluno.setCurrentIndex(idx)
+                combo.setCurrentIndex(idx)
 
     def carregar_vinculos(self):
-        vinculos = self.db.listar_vinculos()
-        tabela = self.ui.tabelaVinculos
-        tabela.setRowCount(len(vinculos))
-
-        for i, (vinculo_id, pai_username, aluno_id, aluno_nome) in enumerate(vinculos):
-            tabela.setItem(i, 0, QTableWidgetItem(pai_username))
-            tabela.setItem(i, 1, QTableWidgetItem(aluno_nome))
-
-            btn_desvincular = PushButton("Desvincular")
-            btn_desvincular.clicked.connect(lambda checked, vid=vinculo_id: self.desvincular(vid))
-            tabela.setCellWidget(i, 2, btn_desvincular)
-
-        self.ui.labelInfo.setText(f"🔗 Vínculos ativos: {len(vinculos)}")
+        self.modelo.recarregar()
+        self.ui.labelInfo.setText("🔗 Vínculos ativos: …")
+        self.banco.chamar(
+            "vincular.contagem", "contar_vinculos",
+            ao_concluir=lambda total: self.ui.labelInfo.setText(f"🔗 Vínculos ativos: {total}"),
+        )
 
     def vincular(self):
         if self.ui.comboPai.count() == 0:
@@ -89,6 +123,10 @@ class VincularScreen(QWidget):
             )
             return
         if self.ui.comboAluno.count() == 0:
+            if self.ui.inputBuscaAluno.text().strip():
+                mostrar_alerta(self, QMessageBox.Icon.Warning, "Erro",
+                               "Nenhum aluno encontrado com essa busca.")
+                return
             mostrar_alerta(
                 self, QMessageBox.Icon.Warning, "Erro",
                 "Nenhum aluno cadastrado ainda. "
@@ -15,11 +15,12 @@ Requer: pip install PyQt6-Fluent-Widgets
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QHeaderView
 
 from qfluentwidgets import (
-    LineEdit, ComboBox, SearchLineEdit, PrimaryPushButton,
+    LineEdit, ComboBox, SearchLineEdit, PrimaryPushButton, PushButton,
     TitleLabel, CaptionLabel, StrongBodyLabel, SimpleCardWidget,
-    TableWidget, ScrollArea,
+    TableView, ScrollArea, ProgressBar,
 )
 
+from screens.tabelas import DelegateBotaoAcao
 from screens.utils import aplicar_sombra
 from screens.theme import CORES
 
@@ -117,6 +118,36 @@ class Ui_AdminScreen:
         linha.addWidget(self.btnCriarUsuario)
 
         layout.addLayout(linha)
+
+        linha_botoes = QHBoxLayout()
+        linha_botoes.addStretch()
+        self.btnImportarUsuarios = PushButton("📥 Importar planilha", card)
+        self.btnImportarUsuarios.setFixedHeight(44)
+        self.btnImportarUsuarios.setToolTip("Criar várias contas de uma vez a partir de um arquivo .csv ou .xlsx "
+                                            "com as colunas Usuário, Tipo e Senha")
+        linha_botoes.addWidget(self.btnImportarUsuarios)
+        layout.addLayout(linha_botoes)
+
+        # Progresso da importação — escondido até uma importação começar
+        self.frameImportacao = QWidget(card)
+        self.frameImportacao.setStyleSheet("background: transparent;")
+        linha_importacao = QHBoxLayout(self.frameImportacao)
+        linha_importacao.setContentsMargins(0, 0, 0, 0)
+        linha_importacao.setSpacing(12)
+
+        self.labelImportacao = CaptionLabel("Importando...", self.frameImportacao)
+        self.labelImportacao.setStyleSheet(f"color: {CORES['texto_sec']}; background: transparent;")
+        linha_importacao.addWidget(self.labelImportacao)
+
+        self.barraImportacao = ProgressBar(self.frameImportacao)
+        self.barraImportacao.setRange(0, 100)
+        linha_importacao.addWidget(self.barraImportacao, 1)
+
+        self.btnCancelarImportacao = PushButton("Cancelar", self.frameImportacao)
+        linha_importacao.addWidget(self.btnCancelarImportacao)
+
+        self.frameImportacao.setVisible(False)
+        layout.addWidget(self.frameImportacao)
         return card
 
     def _montar_tabela(self):
@@ -142,18 +173,24 @@ class Ui_AdminScreen:
 
         layout.addLayout(cabecalho)
 
-        self.tabelaUsuarios = TableWidget(card)
-        self.tabelaUsuarios.setColumnCount(3)
-        self.tabelaUsuarios.setHorizontalHeaderLabels(["Username", "Tipo", "Ações"])
-        self.tabelaUsuarios.setEditTriggers(TableWidget.EditTrigger.NoEditTriggers)
-        self.tabelaUsuarios.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
+        # Colunas: Username, Tipo, Ações — definidas pelo modelo que a
+        # lógica instala (screens/admin.py)
+        self.tabelaUsuarios = TableView(card)
+        self.tabelaUsuarios.setEditTriggers(TableView.EditTrigger.NoEditTriggers)
+        self.tabelaUsuarios.setSelectionBehavior(TableView.SelectionBehavior.SelectRows)
         self.tabelaUsuarios.verticalHeader().setDefaultSectionSize(52)
         self.tabelaUsuarios.verticalHeader().hide()
 
+        self.delegateExcluir = DelegateBotaoAcao("Excluir", self.tabelaUsuarios)
+        self.tabelaUsuarios.setItemDelegateForColumn(2, self.delegateExcluir)
+
+        layout.addWidget(self.tabelaUsuarios)
+        return card
+
+    def ajustar_colunas_usuarios(self):
+        """Modos de redimensionamento das colunas — só valem depois que a
+        tabela tem um modelo (as seções do cabeçalho vêm dele)."""
         header = self.tabelaUsuarios.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-
-        layout.addWidget(self.tabelaUsuarios)
-        return card
@@ -13,7 +13,7 @@ Quem dá vida a estes widgets é screens/configuracoes.py.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCalendarWidget,
-    QScrollArea, QLineEdit, QTimeEdit,
+    QScrollArea, QLineEdit, QTimeEdit, QFrame, QPushButton,
 )
 
 from qfluentwidgets import (
@@ -25,6 +25,69 @@ from screens.utils import aplicar_sombra
 from screens.theme import CORES, estilo_lista
 
 
+# --------------------------------------------------------------------------- #
+# Card de compromisso da agenda. Os cards são reaproveitados de um dia para
+# o outro (screens/configuracoes.py guarda um "pool" deles): preencher() só
+# troca os textos e a propriedade "cor". O visual não fica em cada card —
+# vem de uma folha de estilo única, aplicada no contêiner da lista por
+# definir_cores_compromisso(), com uma regra por cor ([cor="#5B84A6"]).
+# --------------------------------------------------------------------------- #
+class _CardCompromisso(QFrame):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("cardCompromisso")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 12, 16, 12)
+        layout.setSpacing(4)
+
+        self.lblHora = QLabel(self)
+        self.lblHora.setObjectName("horaCompromisso")
+        self.lblTitulo = QLabel(self)
+        self.lblTitulo.setObjectName("tituloCompromisso")
+        self.lblDescricao = QLabel(self)
+        self.lblDescricao.setObjectName("descricaoCompromisso")
+
+        layout.addWidget(self.lblHora)
+        layout.addWidget(self.lblTitulo)
+        layout.addWidget(self.lblDescricao)
+
+        botoes = QHBoxLayout()
+        botoes.setContentsMargins(0, 8, 0, 0)
+        self.btnEditar = QPushButton("Editar", self)
+        self.btnExcluir = QPushButton("Excluir", self)
+        botoes.addStretch()
+        botoes.addWidget(self.btnEditar)
+        botoes.addWidget(self.btnExcluir)
+        layout.addLayout(botoes)
+
+    def preencher(self, titulo, hora, cor, descricao):
+        self.lblHora.setText(hora)
+        self.lblTitulo.setText(titulo)
+        self.lblDescricao.setText(descricao)
+        if self.property("cor") != cor:
+            # a regra [cor=...] só é reavaliada depois de um novo polish
+            self.setProperty("cor", cor)
+            self.style().unpolish(self)
+            self.style().polish(self)
+
+
+def _estilo_cards_compromisso(cores):
+    regras = [f"""
+        QWidget {{ background: transparent; }}
+        QFrame#cardCompromisso {{
+            background: #FFFFFF; border-left: 8px solid {CORES['texto_sec']}; border-radius: 10px;
+        }}
+        QLabel#horaCompromisso {{ color: #5B7285; font-size: 12px; font-weight: 600; }}
+        QLabel#tituloCompromisso {{ font-size: 15px; font-weight: bold; color: #2E3A46; }}
+        QLabel#descricaoCompromisso {{ color: #7C93A3; font-size: 13px; }}
+        QFrame#cardCompromisso QPushButton {{ padding: 4px 12px; min-height: 28px; font-size: 12px; }}
+    """]
+    for cor in cores:
+        regras.append(f'QFrame#cardCompromisso[cor="{cor}"] {{ border-left-color: {cor}; }}')
+    return "\n".join(regras)
+
+
 class Ui_ConfiguracoesScreen:
     """Monta a interface visual da tela de configurações e expõe os
     widgets como atributos de instância.
@@ -114,6 +177,17 @@ class Ui_ConfiguracoesScreen:
 
         return self.frameFilhos
 
+    def definir_cores_compromisso(self, cores):
+        """Folha de estilo única dos cards de compromisso, com uma regra
+        pronta para cada cor da paleta (lista de "#rrggbb")."""
+        self.conteudoCompromissos.setStyleSheet(_estilo_cards_compromisso(cores))
+
+    def criar_card_compromisso(self):
+        """Cria um card vazio no fim da lista (antes do espaço final)."""
+        card = _CardCompromisso(self.conteudoCompromissos)
+        self.layoutCompromissos.insertWidget(self.layoutCompromissos.count() - 1, card)
+        return card
+
     def _montar_agenda(self):
         self.frameAgenda = SimpleCardWidget()
         self.frameAgenda.setBorderRadius(18)
@@ -149,10 +223,17 @@ class Ui_ConfiguracoesScreen:
         self.scrollCompromissos.setStyleSheet("background: transparent;")
 
         self.conteudoCompromissos = QWidget()
-        self.conteudoCompromissos.setStyleSheet("background: transparent;")
+        self.conteudoCompromissos.setStyleSheet(_estilo_cards_compromisso([]))
         self.layoutCompromissos = QVBoxLayout(self.conteudoCompromissos)
         self.layoutCompromissos.setSpacing(10)
         self.layoutCompromissos.setContentsMargins(0, 0, 0, 0)
+
+        self.labelCarregandoCompromissos = QLabel("Carregando compromissos…", self.conteudoCompromissos)
+        self.labelCarregandoCompromissos.setStyleSheet("color: #7C93A3; font-size: 13px;")
+        self.labelCarregandoCompromissos.setVisible(False)
+        self.layoutCompromissos.addWidget(self.labelCarregandoCompromissos)
+        # os cards entram entre o aviso de carregamento e este espaço final
+        self.layoutCompromissos.addStretch()
         self.scrollCompromissos.setWidget(self.conteudoCompromissos)
         direita.addWidget(self.scrollCompromissos, 1)
 
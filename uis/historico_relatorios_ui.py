@@ -13,8 +13,8 @@ Quem dá vida a estes widgets é screens/historico_relatorios.py.
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QHeaderView
 
 from qfluentwidgets import (
-    PushButton, PrimaryPushButton, TitleLabel, StrongBodyLabel,
-    SimpleCardWidget, TableWidget, TextEdit, ScrollArea,
+    PushButton, PrimaryPushButton, TitleLabel, StrongBodyLabel, CaptionLabel,
+    SimpleCardWidget, TableView, TextEdit, ScrollArea, ProgressBar,
 )
 
 from screens.utils import aplicar_sombra
@@ -51,6 +51,7 @@ class Ui_HistoricoRelatoriosScreen:
         corpo.setContentsMargins(48, 40, 48, 40)
 
         corpo.addLayout(self._montar_topo())
+        corpo.addWidget(self._montar_progresso_exportacao())
         corpo.addWidget(self._montar_tabela())
         corpo.addWidget(self._montar_detalhe(), 1)
 
@@ -72,6 +73,28 @@ class Ui_HistoricoRelatoriosScreen:
         linha.addWidget(self.btnExportarPDF)
         return linha
 
+    def _montar_progresso_exportacao(self):
+        # Progresso da exportação — escondido até uma exportação começar
+        self.frameExportacao = QWidget()
+        self.frameExportacao.setStyleSheet("background: transparent;")
+        linha = QHBoxLayout(self.frameExportacao)
+        linha.setContentsMargins(0, 0, 0, 0)
+        linha.setSpacing(12)
+
+        self.labelExportacao = CaptionLabel("Exportando...", self.frameExportacao)
+        self.labelExportacao.setStyleSheet(f"color: {CORES['texto_sec']}; background: transparent;")
+        linha.addWidget(self.labelExportacao)
+
+        self.barraExportacao = ProgressBar(self.frameExportacao)
+        self.barraExportacao.setRange(0, 100)
+        linha.addWidget(self.barraExportacao, 1)
+
+        self.btnCancelarExportacao = PushButton("Cancelar", self.frameExportacao)
+        linha.addWidget(self.btnCancelarExportacao)
+
+        self.frameExportacao.setVisible(False)
+        return self.frameExportacao
+
     def _montar_tabela(self):
         card = SimpleCardWidget()
         card.setBorderRadius(16)
@@ -86,21 +109,24 @@ class Ui_HistoricoRelatoriosScreen:
         titulo.setStyleSheet(f"color: {CORES['texto']}; background: transparent;")
         layout.addWidget(titulo)
 
-        self.tabelaHistorico = TableWidget(card)
-        self.tabelaHistorico.setColumnCount(2)
-        self.tabelaHistorico.setHorizontalHeaderLabels(["Data", "Prévia"])
-        self.tabelaHistorico.setEditTriggers(TableWidget.EditTrigger.NoEditTriggers)
-        self.tabelaHistorico.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
+        # Colunas: Data, Prévia — definidas pelo modelo que a lógica
+        # instala (screens/historico_relatorios.py)
+        self.tabelaHistorico = TableView(card)
+        self.tabelaHistorico.setEditTriggers(TableView.EditTrigger.NoEditTriggers)
+        self.tabelaHistorico.setSelectionBehavior(TableView.SelectionBehavior.SelectRows)
         self.tabelaHistorico.verticalHeader().setDefaultSectionSize(48)
         self.tabelaHistorico.verticalHeader().hide()
 
+        layout.addWidget(self.tabelaHistorico)
+        return card
+
+    def ajustar_colunas_historico(self):
+        """Modos de redimensionamento das colunas — só valem depois que a
+        tabela tem um modelo (as seções do cabeçalho vêm dele)."""
         header = self.tabelaHistorico.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
 
-        layout.addWidget(self.tabelaHistorico)
-        return card
-
     def _montar_detalhe(self):
         card = SimpleCardWidget()
         card.setBorderRadius(16)
@@ -18,7 +18,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 
 from qfluentwidgets import (
     LineEdit, PasswordLineEdit, PrimaryPushButton, TitleLabel,
-    CaptionLabel, SimpleCardWidget,
+    CaptionLabel, SimpleCardWidget, IndeterminateProgressRing,
 )
 
 from screens.utils import aplicar_sombra
@@ -32,7 +32,8 @@ class Ui_LoginScreen:
     Uso (em screens/login_qt.py):
         self.ui = Ui_LoginScreen()
         self.ui.setupUi(self)
-        # depois: self.ui.inputUsuario, self.ui.inputSenha, self.ui.bntContinuar
+        # depois: self.ui.inputUsuario, self.ui.inputSenha, self.ui.bntContinuar,
+        #        self.ui.spinnerLogin
     """
 
     def setupUi(self, tela: QWidget):
@@ -96,4 +97,15 @@ class Ui_LoginScreen:
         self.bntContinuar.setFixedHeight(48)
         v.addWidget(self.bntContinuar)
 
+        # Girando enquanto a senha é conferida (escondido fora disso)
+        v.addSpacing(14)
+        self.spinnerLogin = IndeterminateProgressRing(self.cardLogin)
+        self.spinnerLogin.setFixedSize(28, 28)
+        self.spinnerLogin.setStrokeWidth(3)
+        politica = self.spinnerLogin.sizePolicy()
+        politica.setRetainSizeWhenHidden(True)  # o card não muda de altura
+        self.spinnerLogin.setSizePolicy(politica)
+        self.spinnerLogin.setVisible(False)
+        v.addWidget(self.spinnerLogin, alignment=Qt.AlignmentFlag.AlignCenter)
+
         raiz.addWidget(self.cardLogin, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -16,7 +16,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHeaderView
 
 from qfluentwidgets import (
     TitleLabel, CaptionLabel, StrongBodyLabel, SimpleCardWidget,
-    TableWidget, TextEdit, ScrollArea,
+    TableWidget, TableView, TextEdit, ScrollArea,
 )
 
 from screens.utils import aplicar_sombra
@@ -125,9 +125,31 @@ class Ui_PaiScreen:
         titulo.setStyleSheet(f"color: {CORES['texto']}; background: transparent;")
         layout.addWidget(titulo)
 
+        self.labelRelatorios = CaptionLabel("Selecione um aluno acima para ver os relatórios.", card)
+        self.labelRelatorios.setStyleSheet(f"color: {CORES['texto_sec']}; background: transparent;")
+        layout.addWidget(self.labelRelatorios)
+
+        # Colunas: Data, Prévia — definidas pelo modelo que a lógica
+        # instala (screens/pai.py)
+        self.tabelaRelatorios = TableView(card)
+        self.tabelaRelatorios.setEditTriggers(TableView.EditTrigger.NoEditTriggers)
+        self.tabelaRelatorios.setSelectionBehavior(TableView.SelectionBehavior.SelectRows)
+        self.tabelaRelatorios.verticalHeader().setDefaultSectionSize(44)
+        self.tabelaRelatorios.verticalHeader().hide()
+        self.tabelaRelatorios.setMinimumHeight(200)
+        self.tabelaRelatorios.setVisible(False)
+        layout.addWidget(self.tabelaRelatorios)
+
         self.textRelatorios = TextEdit(card)
         self.textRelatorios.setReadOnly(True)
-        self.textRelatorios.setPlaceholderText("Selecione um aluno acima para ver os relatórios...")
+        self.textRelatorios.setPlaceholderText("Selecione um relatório na lista para ler o texto completo...")
         layout.addWidget(self.textRelatorios, 1)
 
         return card
+
+    def ajustar_colunas_relatorios(self):
+        """Modos de redimensionamento das colunas — só valem depois que a
+        tabela tem um modelo (as seções do cabeçalho vêm dele)."""
+        header = self.tabelaRelatorios.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
@@ -19,9 +19,10 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QHeaderView
 from qfluentwidgets import (
     LineEdit, ComboBox, SearchLineEdit, PrimaryPushButton, PushButton,
     TitleLabel, CaptionLabel, StrongBodyLabel, SimpleCardWidget,
-    TableWidget, ScrollArea,
+    TableWidget, TableView, ScrollArea, ProgressBar,
 )
 
+from screens.tabelas import DelegateBotaoAcao
 from screens.utils import aplicar_sombra
 from screens.theme import CORES
 
@@ -58,7 +59,9 @@ class Ui_PsicologoScreen:
 
         corpo.addWidget(self._montar_titulo())
         corpo.addWidget(self._montar_cadastro())
+        corpo.addWidget(self._montar_exportacao())
         corpo.addWidget(self._montar_tabela(), 1)
+        corpo.addWidget(self._montar_busca_relatorios())
 
     # ------------------------------------------------------------------ #
     def _montar_titulo(self):
@@ -114,11 +117,100 @@ class Ui_PsicologoScreen:
 
         linha_botoes = QHBoxLayout()
         linha_botoes.addStretch()
+        self.btnImportar = PushButton("📥 Importar planilha", card)
+        self.btnImportar.setFixedHeight(44)
+        self.btnImportar.setToolTip("Cadastrar vários alunos de uma vez a partir de um arquivo .csv ou .xlsx "
+                                    "com as colunas Nome, Sala, Série e Gravidade")
+        linha_botoes.addWidget(self.btnImportar)
         self.btnCadastrar = PrimaryPushButton("➕ Cadastrar Aluno", card)
         self.btnCadastrar.setFixedHeight(44)
         linha_botoes.addWidget(self.btnCadastrar)
         layout.addLayout(linha_botoes)
 
+        # Progresso da importação — escondido até uma importação começar
+        self.frameImportacao = QWidget(card)
+        self.frameImportacao.setStyleSheet("background: transparent;")
+        linha_importacao = QHBoxLayout(self.frameImportacao)
+        linha_importacao.setContentsMargins(0, 0, 0, 0)
+        linha_importacao.setSpacing(12)
+
+        self.labelImportacao = CaptionLabel("Importando...", self.frameImportacao)
+        self.labelImportacao.setStyleSheet(f"color: {CORES['texto_sec']}; background: transparent;")
+        linha_importacao.addWidget(self.labelImportacao)
+
+        self.barraImportacao = ProgressBar(self.frameImportacao)
+        self.barraImportacao.setRange(0, 100)
+        linha_importacao.addWidget(self.barraImportacao, 1)
+
+        self.btnCancelarImportacao = PushButton("Cancelar", self.frameImportacao)
+        linha_importacao.addWidget(self.btnCancelarImportacao)
+
+        self.frameImportacao.setVisible(False)
+        layout.addWidget(self.frameImportacao)
+
+        return card
+
+    def _montar_exportacao(self):
+        card = SimpleCardWidget()
+        card.setBorderRadius(18)
+        aplicar_sombra(card, blur=24, y_offset=6, alpha=18)
+
+        layout = QVBoxLayout(card)
+        layout.setContentsMargins(28, 24, 28, 24)
+        layout.setSpacing(14)
+
+        titulo = StrongBodyLabel("Exportar Prontuários da Turma", card)
+        titulo.setStyleSheet(f"color: {CORES['texto']}; background: transparent;")
+        layout.addWidget(titulo)
+
+        linha = QHBoxLayout()
+        linha.setSpacing(14)
+
+        self.inputSalaExportacao = LineEdit(card)
+        self.inputSalaExportacao.setPlaceholderText("Sala (vazio = todas)")
+        self.inputSalaExportacao.setFixedHeight(40)
+
+        self.inputSerieExportacao = LineEdit(card)
+        self.inputSerieExportacao.setPlaceholderText("Série (vazio = todas)")
+        self.inputSerieExportacao.setFixedHeight(40)
+
+        self.comboGravidadeExportacao = ComboBox(card)
+        self.comboGravidadeExportacao.addItems(["Todas", "Baixo", "Médio", "Grave"])
+        self.comboGravidadeExportacao.setFixedHeight(40)
+        self.comboGravidadeExportacao.setFixedWidth(140)
+
+        self.btnExportarTurma = PrimaryPushButton("📄 Exportar prontuários", card)
+        self.btnExportarTurma.setFixedHeight(40)
+        self.btnExportarTurma.setToolTip("Gera um PDF com o histórico completo de cada aluno filtrado, "
+                                         "em Documentos/SISPE/Relatorios")
+
+        linha.addWidget(self.inputSalaExportacao)
+        linha.addWidget(self.inputSerieExportacao)
+        linha.addWidget(self.comboGravidadeExportacao)
+        linha.addWidget(self.btnExportarTurma)
+        layout.addLayout(linha)
+
+        # Progresso da exportação — escondido até uma exportação começar
+        self.frameExportacao = QWidget(card)
+        self.frameExportacao.setStyleSheet("background: transparent;")
+        linha_exportacao = QHBoxLayout(self.frameExportacao)
+        linha_exportacao.setContentsMargins(0, 0, 0, 0)
+        linha_exportacao.setSpacing(12)
+
+        self.labelExportacao = CaptionLabel("Exportando...", self.frameExportacao)
+        self.labelExportacao.setStyleSheet(f"color: {CORES['texto_sec']}; background: transparent;")
+        linha_exportacao.addWidget(self.labelExportacao)
+
+        self.barraExportacao = ProgressBar(self.frameExportacao)
+        self.barraExportacao.setRange(0, 100)
+        linha_exportacao.addWidget(self.barraExportacao, 1)
+
+        self.btnCancelarExportacao = PushButton("Cancelar", self.frameExportacao)
+        linha_exportacao.addWidget(self.btnCancelarExportacao)
+
+        self.frameExportacao.setVisible(False)
+        layout.addWidget(self.frameExportacao)
+
         return card
 
     def _montar_tabela(self):
@@ -147,21 +239,71 @@ class Ui_PsicologoScreen:
 
         layout.addLayout(cabecalho)
 
-        self.tabelaAlunos = TableWidget(card)
-        self.tabelaAlunos.setColumnCount(6)
-        self.tabelaAlunos.setHorizontalHeaderLabels(
-            ["Nome", "Sala", "Série", "Gravidade", "Data", "Ações"]
-        )
-        self.tabelaAlunos.setEditTriggers(TableWidget.EditTrigger.NoEditTriggers)
-        self.tabelaAlunos.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
+        # Colunas: Nome, Sala, Série, Gravidade, Data, Ações — definidas
+        # pelo modelo que a lógica instala (screens/psicologo.py)
+        self.tabelaAlunos = TableView(card)
+        self.tabelaAlunos.setEditTriggers(TableView.EditTrigger.NoEditTriggers)
+        self.tabelaAlunos.setSelectionBehavior(TableView.SelectionBehavior.SelectRows)
         self.tabelaAlunos.verticalHeader().setDefaultSectionSize(52)
         self.tabelaAlunos.verticalHeader().hide()
 
+        self.delegateExcluir = DelegateBotaoAcao("Excluir", self.tabelaAlunos)
+        self.tabelaAlunos.setItemDelegateForColumn(5, self.delegateExcluir)
+
+        layout.addWidget(self.tabelaAlunos)
+
+        return card
+
+    def ajustar_colunas_alunos(self):
+        """Modos de redimensionamento das colunas — só valem depois que a
+        tabela tem um modelo (as seções do cabeçalho vêm dele)."""
         header = self.tabelaAlunos.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         for col in range(1, 6):
             header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
 
-        layout.addWidget(self.tabelaAlunos)
+    def _montar_busca_relatorios(self):
+        card = SimpleCardWidget()
+        card.setBorderRadius(18)
+        aplicar_sombra(card, blur=24, y_offset=6, alpha=18)
+
+        layout = QVBoxLayout(card)
+        layout.setContentsMargins(28, 24, 28, 24)
+        layout.setSpacing(14)
+
+        cabecalho = QHBoxLayout()
+        titulo = StrongBodyLabel("Buscar nos Relatórios", card)
+        titulo.setStyleSheet(f"color: {CORES['texto']}; background: transparent;")
+        cabecalho.addWidget(titulo)
+        cabecalho.addStretch()
+
+        self.inputBuscaRelatorios = SearchLineEdit(card)
+        self.inputBuscaRelatorios.setPlaceholderText("Ex: bullying, automutilação...")
+        self.inputBuscaRelatorios.setFixedWidth(320)
+        cabecalho.addWidget(self.inputBuscaRelatorios)
+
+        layout.addLayout(cabecalho)
+
+        self.labelBuscaRelatorios = CaptionLabel("", card)
+        self.labelBuscaRelatorios.setStyleSheet(f"color: {CORES['texto_sec']}; background: transparent;")
+        self.labelBuscaRelatorios.setVisible(False)
+        layout.addWidget(self.labelBuscaRelatorios)
+
+        self.tabelaBuscaRelatorios = TableWidget(card)
+        self.tabelaBuscaRelatorios.setColumnCount(3)
+        self.tabelaBuscaRelatorios.setHorizontalHeaderLabels(["Data", "Aluno", "Trecho"])
+        self.tabelaBuscaRelatorios.setEditTriggers(TableWidget.EditTrigger.NoEditTriggers)
+        self.tabelaBuscaRelatorios.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
+        self.tabelaBuscaRelatorios.verticalHeader().setDefaultSectionSize(48)
+        self.tabelaBuscaRelatorios.verticalHeader().hide()
+        self.tabelaBuscaRelatorios.setMinimumHeight(260)
+        self.tabelaBuscaRelatorios.setVisible(False)
+
+        header = self.tabelaBuscaRelatorios.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+
+        layout.addWidget(self.tabelaBuscaRelatorios)
 
         return card
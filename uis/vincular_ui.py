@@ -16,11 +16,12 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QHeaderView
 
 from qfluentwidgets import (
-    ComboBox, PrimaryPushButton,
+    ComboBox, PrimaryPushButton, SearchLineEdit,
     TitleLabel, CaptionLabel, StrongBodyLabel, SimpleCardWidget,
-    TableWidget, ScrollArea,
+    TableView, ScrollArea,
 )
 
+from screens.tabelas import DelegateBotaoAcao
 from screens.utils import aplicar_sombra
 from screens.theme import CORES
 
@@ -32,8 +33,9 @@ class Ui_VincularScreen:
     Uso (em screens/vincular.py):
         self.ui = Ui_VincularScreen()
         self.ui.setupUi(self)
-        # depois: self.ui.comboPai, self.ui.comboAluno, self.ui.btnVincular,
-        # self.ui.tabelaVinculos, self.ui.labelInfo
+        # depois: self.ui.comboPai, self.ui.inputBuscaAluno, self.ui.comboAluno,
+        # self.ui.labelAvisoAlunos, self.ui.btnVincular, self.ui.tabelaVinculos,
+        # self.ui.labelInfo
     """
 
     def setupUi(self, tela: QWidget):
@@ -109,6 +111,12 @@ class Ui_VincularScreen:
         self.comboPai.setFixedHeight(44)
         self.comboPai.setPlaceholderText("Selecione o responsável")
 
+        # O combo de alunos não traz a escola inteira: mostra só os
+        # primeiros que passam nesta busca (ver screens/vincular.py).
+        self.inputBuscaAluno = SearchLineEdit(card)
+        self.inputBuscaAluno.setFixedHeight(44)
+        self.inputBuscaAluno.setPlaceholderText("Buscar aluno pelo nome")
+
         self.comboAluno = ComboBox(card)
         self.comboAluno.setFixedHeight(44)
         self.comboAluno.setPlaceholderText("Selecione o aluno")
@@ -117,6 +125,7 @@ class Ui_VincularScreen:
         self.btnVincular.setFixedHeight(44)
 
         linha.addLayout(_campo("Responsável (pai)", self.comboPai), 1)
+        linha.addLayout(_campo("Buscar aluno", self.inputBuscaAluno), 1)
         linha.addLayout(_campo("Aluno", self.comboAluno), 1)
 
         # Espaço vazio equivalente ao rótulo do combo, para o botão alinhar
@@ -130,6 +139,11 @@ class Ui_VincularScreen:
         linha.addLayout(colunaBotao)
 
         layout.addLayout(linha)
+
+        self.labelAvisoAlunos = CaptionLabel("", card)
+        self.labelAvisoAlunos.setStyleSheet(f"color: {CORES['texto_sec']}; background: transparent;")
+        self.labelAvisoAlunos.setVisible(False)
+        layout.addWidget(self.labelAvisoAlunos)
         return card
 
     def _montar_tabela(self):
@@ -146,20 +160,27 @@ class Ui_VincularScreen:
         titulo.setStyleSheet(f"color: {CORES['texto']}; background: transparent;")
         layout.addWidget(titulo)
 
-        self.tabelaVinculos = TableWidget(card)
-        self.tabelaVinculos.setColumnCount(3)
-        self.tabelaVinculos.setHorizontalHeaderLabels(["Responsável", "Aluno", "Ações"])
-        self.tabelaVinculos.setEditTriggers(TableWidget.EditTrigger.NoEditTriggers)
-        self.tabelaVinculos.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
-        self.tabelaVinculos.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Colunas: Responsável, Aluno, Ações — definidas pelo modelo que a
+        # lógica instala (screens/vincular.py). A rolagem vertical fica
+        # ligada: é ela que pede as próximas páginas ao modelo.
+        self.tabelaVinculos = TableView(card)
+        self.tabelaVinculos.setEditTriggers(TableView.EditTrigger.NoEditTriggers)
+        self.tabelaVinculos.setSelectionBehavior(TableView.SelectionBehavior.SelectRows)
+        self.tabelaVinculos.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.tabelaVinculos.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.tabelaVinculos.verticalHeader().setDefaultSectionSize(52)
         self.tabelaVinculos.verticalHeader().hide()
 
+        self.delegateDesvincular = DelegateBotaoAcao("Desvincular", self.tabelaVinculos)
+        self.tabelaVinculos.setItemDelegateForColumn(2, self.delegateDesvincular)
+
+        layout.addWidget(self.tabelaVinculos)
+        return card
+
+    def ajustar_colunas_vinculos(self):
+        """Modos de redimensionamento das colunas — só valem depois que a
+        tabela tem um modelo (as seções do cabeçalho vêm dele)."""
         header = self.tabelaVinculos.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-
-        layout.addWidget(self.tabelaVinculos)
-        return card